@@ -1,6 +1,15 @@
 import os
+import hashlib
+import json
+import logging
+import queue
 import sqlite3
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 import csv
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
@@ -21,6 +30,8 @@ except ImportError:
     FigureCanvasTkAgg = None
     Figure = None
 
+logger = logging.getLogger(__name__)
+
 class ToolTip:
     """Create a tooltip for a given widget"""
     def __init__(self, widget, text='widget info'):
@@ -63,6 +74,68 @@ DB_PATH = os.path.abspath(os.path.join(DB_DIR, "app.db"))
 INVOICE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "invoices"))
 BACKUP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "backups"))
 IMAGE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "images"))
+THUMB_CACHE_DIR = os.path.abspath(os.path.join(DB_DIR, ".thumb_cache"))
+THUMB_FLUSH_MS = 100  # gallery thumbnails are applied in batches at this interval
+BILLS_CACHE_TTL = 2.0  # seconds the reports bill list is reused before it is queried again
+
+# Table status -> (background, hover background) for the table cards
+TABLE_STATUS_COLORS = {
+    "empty": ("#E8F5E8", "#C8E6C9"),     # Light / medium green
+    "ordering": ("#E3F2FD", "#BBDEFB"),  # Light / medium blue
+    "ready": ("#FFF3E0", "#FFE0B2"),     # Light / medium orange
+    "served": ("#F3E5F5", "#E1BEE7"),    # Light / medium purple
+}
+PRINTABLE_TABLE_STATUSES = frozenset({"ordering", "ready", "served"})  # statuses with a kitchen order
+ACTIVE_TABLE_STATUSES = frozenset({"ordering", "ready"})  # counted as active orders
+TABLE_STATUS_EMOJI = {"empty": "", "ordering": "📝", "ready": "✅", "served": "🍽️"}
+
+
+@lru_cache(maxsize=None)
+def table_status_text(status: str, item_count: int) -> str:
+    """Label of a table button for a status and number of ordered items"""
+    if status in ("ordering", "ready", "served"):
+        return f"{status.upper()}\n({item_count} items)"
+    return "VIEW"
+
+def _fmt_dt(s: str) -> str:
+    """DB timestamp "YYYY-MM-DD HH:MM:SS" as "DD-MM-YYYY HH:MM"; anything else is shown as stored"""
+    if len(s) == 19 and s[10] == " ":
+        return f"{s[8:10]}-{s[5:7]}-{s[0:4]} {s[11:16]}"
+    return s
+
+
+def _fmt_time(s: str) -> str:
+    """HH:MM of a DB timestamp"""
+    if len(s) == 19 and s[10] == " ":
+        return s[11:16]
+    return s.split(" ")[1] if " " in s else s
+
+
+@lru_cache(maxsize=1024)
+def money(value) -> str:
+    """Value as "₹1234.50"; treeview fills repeat the same prices and totals, so each is formatted once"""
+    return f"₹{value:.2f}"
+
+
+_ALT_TAGS = ("even", "odd")  # striped treeview rows, indexed by row number & 1
+# Tcl lambda inserting a flat {values tags values tags ...} list into a treeview, see bulk_insert
+_TREE_BULK_INSERT = "{w rows} {foreach {v t} $rows {$w insert {} end -values $v -tags $t}}"
+
+# Fixed button labels of the tables view and table menu
+_BILL_BTN_TEXT = "📄\nGENERATE\nBILL"
+_VIEW_BTN_TEXT = "👁️\nVIEW\nBILL"
+_REMOVE_BTN_TEXT = "✕"
+_PRINT_BTN_TEXT = "PRINT"
+_BACK_BTN_TEXT = "🔙 Back to Tables"
+_REMOVE_ITEM_BTN_TEXT = "🗑️ Remove Selected"
+_GENERATE_BILL_BTN_TEXT = "💳 Generate Bill"
+
+_KITCHEN_TMPL = "=== KITCHEN ORDER - TABLE {table} ===\nTime: {ts}\n\nItems:\n{body}\n\n=== END ORDER ==="
+_BILL_CONFIRM_TMPL = ("Generate bill for Table {table}?\n\nItems: {items}\nTotal: ₹{total:.2f}\n\n"
+                      "This will create an invoice and clear the table order.")
+_BILL_SUCCESS_TMPL = ("✅ Bill Generated Successfully!\n\nBill ID: {bill_id}\nTable: {table}\n"
+                      "Total: ₹{total:.2f}\nItems: {items}\n\nInvoice saved to:\n{path}")
+_ORDER_SUMMARY_TMPL = "Table {table} Order Summary\n{rule}\n{body}\n{thin_rule}\nTotal: ₹{total:.2f}"
 
 
 def ensure_dirs():
@@ -70,6 +143,7 @@ def ensure_dirs():
     os.makedirs(INVOICE_DIR, exist_ok=True)
     os.makedirs(BACKUP_DIR, exist_ok=True)
     os.makedirs(IMAGE_DIR, exist_ok=True)
+    os.makedirs(THUMB_CACHE_DIR, exist_ok=True)
 
 def load_printer_icon():
     """Load printer icon from PNG file"""
@@ -87,13 +161,48 @@ def load_printer_icon():
         return None
 
 
+def get_or_build_thumb(path: str, mtime: float, size):
+    """Return the image at path resized to fit size, using the on-disk thumbnail cache"""
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+    cache_path = os.path.join(THUMB_CACHE_DIR, f"{digest}_{int(mtime)}_{size[0]}x{size[1]}.jpg")
+    if os.path.exists(cache_path):
+        try:
+            pil = Image.open(cache_path)
+            pil.load()
+            return pil
+        except Exception:
+            pass  # corrupt cache file, rebuild it below
+    pil = Image.open(path).convert("RGB")
+    pil.thumbnail(size, Image.Resampling.LANCZOS)
+    try:
+        pil.save(cache_path, "JPEG", quality=85)
+    except OSError:
+        pass  # cache is only an optimisation
+    return pil
+
 def get_conn():
     ensure_dirs()
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row
+    # Per-connection read tuning: memory-mapped IO and an 8 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-8000")
     return conn
 
 
+def borrow_conn(conn=None):
+    """Return (conn, owned): the given connection (the UI's cached one), or a new one the caller must close"""
+    if conn is not None:
+        return conn, False
+    return get_conn(), True
+
+
+def day_range(date_str: str):
+    """[start, end) created_at bounds of a YYYY-MM-DD day, so date filters can use the index"""
+    next_day = (datetime.strptime(date_str, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+    return f"{date_str} 00:00:00", f"{next_day} 00:00:00"
+
+
 def init_db():
     conn = get_conn()
     cur = conn.cursor()
@@ -167,13 +276,18 @@ def init_db():
         cur.execute("ALTER TABLE bills ADD COLUMN customer_id INTEGER")
         cur.execute("ALTER TABLE bills ADD COLUMN customer_name TEXT")
         cur.execute("ALTER TABLE bills ADD COLUMN customer_mobile TEXT")
+    # Indexes for date range reports and per-bill item lookups
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_bills_created_at ON bills(created_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_bill_items_bill_id ON bill_items(bill_id)")
     conn.commit()
+    # WAL is stored in the database file, so setting it once here covers every later connection
+    cur.execute("PRAGMA journal_mode=WAL")
     conn.close()
 
 
 # Inventory operations
-def list_products(search_term: str = ""):
-    conn = get_conn()
+def list_products(search_term: str = "", conn=None):
+    conn, owned = borrow_conn(conn)
     cur = conn.cursor()
     if search_term:
         cur.execute(
@@ -183,10 +297,21 @@ def list_products(search_term: str = ""):
     else:
         cur.execute("SELECT * FROM products ORDER BY name ASC")
     rows = cur.fetchall()
-    conn.close()
+    if owned:
+        conn.close()
     return rows
 
 
+def get_product_by_id(pid: int, conn=None):
+    conn, owned = borrow_conn(conn)
+    cur = conn.cursor()
+    cur.execute("SELECT * FROM products WHERE id=?", (int(pid),))
+    row = cur.fetchone()
+    if owned:
+        conn.close()
+    return row
+
+
 def add_product(name: str, price: float, stock: int, image_path: str | None = None):
     conn = get_conn()
     cur = conn.cursor()
@@ -226,14 +351,14 @@ def delete_product(pid: int):
         # First delete all bill_items that reference this product
         cur.execute("DELETE FROM bill_items WHERE product_id=?", (int(pid),))
         deleted_items = cur.rowcount
-        print(f"Deleted {deleted_items} bill_items for product {pid}")
+        logger.info("Deleted %s bill_items for product %s", deleted_items, pid)
         
         # Then delete the product itself
         cur.execute("DELETE FROM products WHERE id=?", (int(pid),))
         conn.commit()
-        print(f"Product {pid} deleted successfully")
+        logger.info("Product %s deleted successfully", pid)
     except Exception as e:
-        print(f"Error deleting product {pid}: {e}")
+        logger.error("Error deleting product %s: %s", pid, e)
         conn.rollback()
     finally:
         conn.close()
@@ -242,9 +367,11 @@ def delete_product(pid: int):
 # Billing operations
 def create_bill(cart_items, customer_id=None, customer_name="", customer_mobile=""):
     # cart_items: list of dicts {product_id, name, price, qty}
-    print(f"DEBUG: create_bill called with {len(cart_items)} items")
-    for item in cart_items:
-        print(f"DEBUG: Item - ID: {item.get('product_id')}, Name: {item.get('name')}, Qty: {item.get('qty')}, Price: {item.get('price')}")
+    logger.debug("create_bill called with %d items", len(cart_items))
+    if logger.isEnabledFor(logging.DEBUG):
+        for item in cart_items:
+            logger.debug("Item - ID: %s, Name: %s, Qty: %s, Price: %s",
+                         item.get('product_id'), item.get('name'), item.get('qty'), item.get('price'))
     
     conn = get_conn()
     cur = conn.cursor()
@@ -273,7 +400,7 @@ def create_bill(cart_items, customer_id=None, customer_name="", customer_mobile=
                 (bill_id, item["product_id"], int(item["qty"]), float(item["price"]), subtotal),
             )
             # decrease stock
-            print(f"DEBUG: Updating stock for product {item['product_id']}, reducing by {item['qty']}")
+            logger.debug("Updating stock for product %s, reducing by %s", item['product_id'], item['qty'])
             cur.execute(
                 "UPDATE products SET stock = stock - ? WHERE id=?",
                 (int(item["qty"]), item["product_id"]),
@@ -281,17 +408,17 @@ def create_bill(cart_items, customer_id=None, customer_name="", customer_mobile=
             # Verify stock was updated
             cur.execute("SELECT stock FROM products WHERE id=?", (item["product_id"],))
             updated_stock = cur.fetchone()
-            print(f"DEBUG: Stock after update for product {item['product_id']}: {updated_stock['stock']}")
+            logger.debug("Stock after update for product %s: %s", item['product_id'], updated_stock['stock'])
 
         # Update customer's last order date if customer_id provided
         if customer_id:
             update_customer_last_order(customer_id)
 
         conn.commit()
-        print(f"DEBUG: Bill created successfully with ID {bill_id}")
+        logger.debug("Bill created successfully with ID %s", bill_id)
         return bill_id, total
     except Exception as e:
-        print(f"DEBUG: Error in create_bill: {str(e)}")
+        logger.error("Error in create_bill: %s", e)
         conn.rollback()
         raise e
     finally:
@@ -310,18 +437,43 @@ def get_recent_bills(limit: int = 50):
     return rows
 
 
-def get_daily_sales(date_str: str = None):
+def get_daily_sales(date_str: str = None, conn=None):
     """Get sales for a specific date (YYYY-MM-DD) or today if None"""
     if date_str is None:
         date_str = datetime.now().strftime("%Y-%m-%d")
-    conn = get_conn()
+    conn, owned = borrow_conn(conn)
     cur = conn.cursor()
     cur.execute(
-        "SELECT id, created_at, total FROM bills WHERE DATE(created_at) = ? ORDER BY id ASC",
-        (date_str,),
+        "SELECT id, created_at, total FROM bills WHERE created_at >= ? AND created_at < ? ORDER BY id ASC",
+        day_range(date_str),
     )
     rows = cur.fetchall()
-    conn.close()
+    if owned:
+        conn.close()
+    return rows
+
+
+def get_daily_sales_with_counts(date_str: str = None, conn=None):
+    """Get sales for a date with each bill's item row count and total quantity in one query"""
+    if date_str is None:
+        date_str = datetime.now().strftime("%Y-%m-%d")
+    conn, owned = borrow_conn(conn)
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT b.id, b.created_at, b.total,
+               COUNT(bi.id) AS item_count, COALESCE(SUM(bi.qty), 0) AS total_qty
+        FROM bills b
+        LEFT JOIN bill_items bi ON bi.bill_id = b.id
+        WHERE b.created_at >= ? AND b.created_at < ?
+        GROUP BY b.id
+        ORDER BY b.id ASC
+        """,
+        day_range(date_str),
+    )
+    rows = cur.fetchall()
+    if owned:
+        conn.close()
     return rows
 
 
@@ -330,16 +482,16 @@ def get_sales_summary(start_date: str, end_date: str):
     conn = get_conn()
     cur = conn.cursor()
     cur.execute(
-        "SELECT DATE(created_at) as sale_date, COUNT(*) as bill_count, SUM(total) as total_sales FROM bills WHERE DATE(created_at) BETWEEN ? AND ? GROUP BY DATE(created_at) ORDER BY sale_date DESC",
-        (start_date, end_date),
+        "SELECT DATE(created_at) as sale_date, COUNT(*) as bill_count, SUM(total) as total_sales FROM bills WHERE created_at >= ? AND created_at < ? GROUP BY DATE(created_at) ORDER BY sale_date DESC",
+        (day_range(start_date)[0], day_range(end_date)[1]),
     )
     rows = cur.fetchall()
     conn.close()
     return rows
 
 
-def get_bill_items(bill_id: int):
-    conn = get_conn()
+def get_bill_items(bill_id: int, conn=None):
+    conn, owned = borrow_conn(conn)
     cur = conn.cursor()
     cur.execute(
         """
@@ -352,26 +504,43 @@ def get_bill_items(bill_id: int):
         (bill_id,),
     )
     rows = cur.fetchall()
-    conn.close()
+    if owned:
+        conn.close()
     return rows
 
-def get_all_bills():
+def iter_all_bills(conn=None):
+    """Yield all bills with complete details including customer info, newest first, straight from the cursor"""
+    conn, owned = borrow_conn(conn)
+    try:
+        yield from conn.execute(
+            """SELECT id, created_at, total, customer_id, customer_name, customer_mobile,
+               (SELECT COUNT(*) FROM bill_items WHERE bill_id = bills.id) as item_count,
+               (SELECT SUM(qty) FROM bill_items WHERE bill_id = bills.id) as total_qty
+               FROM bills ORDER BY id DESC"""
+        )
+    finally:
+        if owned:
+            conn.close()
+
+
+def get_bills_signature(conn=None):
+    """Cheap fingerprint of the bills data: (max bill id, bill count, bill item count)"""
+    conn, owned = borrow_conn(conn)
+    row = conn.execute(
+        "SELECT MAX(id), COUNT(*), (SELECT COUNT(*) FROM bill_items) FROM bills"
+    ).fetchone()
+    if owned:
+        conn.close()
+    return tuple(row)
+
+
+def get_all_bills(conn=None):
     """Get all bills with complete details including customer info"""
-    conn = get_conn()
-    cur = conn.cursor()
-    cur.execute(
-        """SELECT id, created_at, total, customer_id, customer_name, customer_mobile,
-           (SELECT COUNT(*) FROM bill_items WHERE bill_id = bills.id) as item_count,
-           (SELECT SUM(qty) FROM bill_items WHERE bill_id = bills.id) as total_qty
-           FROM bills ORDER BY id DESC"""
-    )
-    rows = cur.fetchall()
-    conn.close()
-    return rows
+    return list(iter_all_bills(conn))
 
-def get_comprehensive_bill_items(bill_id: int):
+def get_comprehensive_bill_items(bill_id: int, conn=None):
     """Get comprehensive bill items with product details"""
-    conn = get_conn()
+    conn, owned = borrow_conn(conn)
     cur = conn.cursor()
     
     cur.execute(
@@ -387,50 +556,52 @@ def get_comprehensive_bill_items(bill_id: int):
         (bill_id,),
     )
     rows = cur.fetchall()
-    conn.close()
+    if owned:
+        conn.close()
     return rows
 
-def get_sales_analytics():
-    """Get comprehensive sales analytics"""
-    conn = get_conn()
+def get_sales_analytics(conn=None):
+    """Get comprehensive sales analytics: (summary, top products, 30-day daily trend) in one query"""
+    conn, owned = borrow_conn(conn)
     cur = conn.cursor()
     
-    # Total sales summary
+    # Summary columns plus the two lists folded into JSON arrays, all in a single round trip
     cur.execute("""
+        WITH top AS (
+            SELECT p.name, SUM(bi.qty) as total_sold, SUM(bi.subtotal) as total_revenue
+            FROM bill_items bi
+            JOIN products p ON p.id = bi.product_id
+            GROUP BY p.id, p.name
+            ORDER BY total_sold DESC
+            LIMIT 10
+        ),
+        trend AS (
+            SELECT DATE(created_at) as sale_date, 
+                   COUNT(*) as bill_count, 
+                   SUM(total) as daily_revenue
+            FROM bills 
+            WHERE created_at >= date('now', '-30 days')
+            GROUP BY DATE(created_at)
+            ORDER BY sale_date DESC
+        )
         SELECT 
             COUNT(*) as total_bills,
-            SUM(total) as total_revenue,
-            AVG(total) as avg_bill_value,
+            COALESCE(SUM(total), 0) as total_revenue,
+            COALESCE(AVG(total), 0) as avg_bill_value,
             MIN(created_at) as first_sale,
-            MAX(created_at) as last_sale
+            MAX(created_at) as last_sale,
+            (SELECT json_group_array(json_object('name', name, 'total_sold', total_sold,
+                                                 'total_revenue', total_revenue)) FROM top) as top_products,
+            (SELECT json_group_array(json_object('sale_date', sale_date, 'bill_count', bill_count,
+                                                 'daily_revenue', daily_revenue)) FROM trend) as daily_trend
         FROM bills
     """)
     summary = cur.fetchone()
+    top_products = json.loads(summary["top_products"])
+    daily_trend = json.loads(summary["daily_trend"])
     
-    # Top selling products
-    cur.execute("""
-        SELECT p.name, SUM(bi.qty) as total_sold, SUM(bi.subtotal) as total_revenue
-        FROM bill_items bi
-        JOIN products p ON p.id = bi.product_id
-        GROUP BY p.id, p.name
-        ORDER BY total_sold DESC
-        LIMIT 10
-    """)
-    top_products = cur.fetchall()
-    
-    # Daily sales trend (last 30 days)
-    cur.execute("""
-        SELECT DATE(created_at) as sale_date, 
-               COUNT(*) as bill_count, 
-               SUM(total) as daily_revenue
-        FROM bills 
-        WHERE created_at >= date('now', '-30 days')
-        GROUP BY DATE(created_at)
-        ORDER BY sale_date DESC
-    """)
-    daily_trend = cur.fetchall()
-    
-    conn.close()
+    if owned:
+        conn.close()
     return summary, top_products, daily_trend
 
 
@@ -565,8 +736,7 @@ def backup_products_csv(path: str):
     with open(path, "w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(["name", "price", "stock"])
-        for r in rows:
-            writer.writerow([r["name"], r["price"], r["stock"]])
+        writer.writerows((r["name"], r["price"], r["stock"]) for r in rows)
 
 
 def restore_products_csv(path: str):
@@ -618,6 +788,30 @@ class App(ttk.Frame):
         self.master.title(APP_TITLE)
         self.master.geometry("1000x650")
         self.pack(fill=tk.BOTH, expand=True)
+        # One connection for reads made on the Tk thread; worker threads open their own
+        self.conn = get_conn()
+        self.master.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Decoded PIL thumbnails keyed by (image path, image mtime, size), shared by every gallery/popup.
+        # PhotoImages are only built for labels on screen and live as long as a label holds them.
+        self._pil_cache = {}
+        self._thumb_photos = weakref.WeakValueDictionary()
+        self._thumb_mtimes = {}  # image path -> mtime of the cached thumbnails
+        # Gallery thumbnails are decoded on worker threads; PhotoImages are built on the Tk thread
+        self._thumb_pool = ThreadPoolExecutor(max_workers=4)
+        self._thumb_results = queue.Queue()
+        self._thumb_waiting = {}  # key being decoded -> labels to update when it is done
+        # Table bills are written to the DB and invoice file off the Tk thread
+        self._bill_pool = ThreadPoolExecutor(max_workers=2)
+        self._bills_in_flight = set()  # table numbers with a bill being generated
+        # CSV exports are written one at a time off the Tk thread, see run_in_background
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        # Reports data: bill items per bill id, and the full bill list for a short TTL
+        self._items_cache = {}
+        self._bills_cache = None  # (fetched at, rows, revenue)
+        self._bills_signature = None  # get_bills_signature() when the bills tree was last filled
+        self._debounce_jobs = {}
+        self._all_products_by_id = None  # id -> product row, rebuilt lazily after product changes
 
         self.build_styles()
         self.build_header()
@@ -636,6 +830,7 @@ class App(ttk.Frame):
         self.notebook.add(self.tables_tab, text="🍽️ Tables", padding=[10, 8])
         self.notebook.add(self.customers_tab, text="👥 Customers", padding=[10, 8])
         self.notebook.add(self.reports_tab, text="📊 Reports", padding=[10, 8])
+        self._billing_tab_id = self.notebook.index(self.billing_tab)
 
         self.build_inventory_tab()
         self.build_billing_tab()
@@ -644,8 +839,47 @@ class App(ttk.Frame):
         self.build_reports_tab()
         self.build_menu()
         self.build_statusbar()
+        # Views whose data changed while their tab was hidden; rebuilt when the tab is shown
+        self._stale = set()
+        self._tab_views = {
+            str(self.inventory_tab): "products",
+            str(self.billing_tab): "billing",
+            str(self.tables_tab): "tables",
+            str(self.customers_tab): "customers",
+            str(self.reports_tab): "reports",
+        }
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
 
+    def on_close(self):
+        """Stop background work and release the cached connection before the window closes"""
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        self._bill_pool.shutdown(wait=False)  # a bill already being written is still finished
+        self._io_pool.shutdown(wait=False)  # likewise for an export in progress
+        self.conn.close()
+        self.master.destroy()
+
+    def bulk_insert(self, tree, rows):
+        """Insert (values, tags) rows at the end of tree with a single Python->Tcl call"""
+        flat = []
+        for values, tags in rows:
+            flat.append(values)
+            flat.append(tags)
+        if flat:
+            self.tk.call("apply", _TREE_BULK_INSERT, str(tree), tuple(flat))
+
+    def run_in_background(self, work, on_done, on_error):
+        """Run work() on the IO worker, then on_done(result) or on_error(exc) on the Tk thread"""
+        fut = self._io_pool.submit(work)
+
+        def poll():
+            if not fut.done():
+                self.after(50, poll)
+            elif fut.exception() is not None:
+                on_error(fut.exception())
+            else:
+                on_done(fut.result())
+        self.after(50, poll)
+
     def build_styles(self):
         self.base_font = ("Segoe UI", 10)
         self.heading_font = ("Segoe UI", 11, "bold")
@@ -674,6 +908,59 @@ class App(ttk.Frame):
         style.configure("Info.TButton", foreground="white", background="#2196F3")
         style.configure("Product.TFrame", relief="raised", borderwidth=2)
 
+        # One shared hover handler for flat tk.Buttons, see add_hover
+        self.bind_class("HoverButton", "<Enter>", self._on_hover_enter)
+        self.bind_class("HoverButton", "<Leave>", self._on_hover_leave)
+
+        # Table management buttons - hover and disabled colors are handled by the theme
+        for status, (color, hover) in TABLE_STATUS_COLORS.items():
+            style.configure(f"Table.{status}.TButton", font=("Segoe UI", 12, "bold"),
+                            background=color, foreground="#1976D2", justify=tk.CENTER, anchor=tk.CENTER)
+            style.map(f"Table.{status}.TButton", background=[("active", hover)])
+        for name, color, hover, font in [
+            ("TableBill.TButton", "#4CAF50", "#45a049", ("Segoe UI", 8, "bold")),
+            ("TableViewBill.TButton", "#2196F3", "#1976D2", ("Segoe UI", 8, "bold")),
+            ("TableRemove.TButton", "#F44336", "#D32F2F", ("Segoe UI", 12, "bold")),
+            ("TablePrint.TButton", "#FF9800", "#F57C00", ("Segoe UI", 10, "bold")),
+            ("MenuBack.TButton", "#e74c3c", "#c0392b", ("Segoe UI", 12, "bold")),
+            ("MenuRemove.TButton", "#e74c3c", "#c0392b", ("Segoe UI", 12, "bold")),
+            ("MenuGenerate.TButton", "#27ae60", "#229954", ("Segoe UI", 12, "bold")),
+        ]:
+            style.configure(name, font=font, background=color, foreground="white",
+                            justify=tk.CENTER, anchor=tk.CENTER)
+            style.map(name,
+                      background=[("disabled", "#E0E0E0"), ("active", hover)],
+                      foreground=[("disabled", "#9E9E9E")])
+
+        # Table menu product cards - label fonts/colors parsed once, one click binding for every card
+        for name, font, color in [
+            ("Thumb.TLabel", ("Segoe UI", 9, "bold"), "#333333"),
+            ("ThumbPrice.TLabel", ("Segoe UI", 10, "bold"), "#2E7D32"),
+            ("ThumbStockOk.TLabel", ("Segoe UI", 8), "#4CAF50"),
+            ("ThumbStockLow.TLabel", ("Segoe UI", 8), "#FF9800"),
+            ("ThumbStockOut.TLabel", ("Segoe UI", 8), "#F44336"),
+        ]:
+            style.configure(name, font=font, foreground=color, background="#FFFFFF")
+        self.bind_class("ProductCell", "<Button-1>", self._on_product_cell_click)
+
+    def _on_product_cell_click(self, event):
+        self.add_product_id_to_table(event.widget.product_id)
+
+    def add_hover(self, widget, hover_bg):
+        """Give a tk.Button a hover background through the shared HoverButton bindtag"""
+        widget.hover_colors = (widget.cget("bg"), hover_bg)
+        tags = widget.bindtags()
+        widget.bindtags(tags[:1] + ("HoverButton",) + tags[1:])
+
+    @staticmethod
+    def _on_hover_enter(event):
+        if str(event.widget.cget("state")) != "disabled":
+            event.widget.configure(bg=event.widget.hover_colors[1])
+
+    @staticmethod
+    def _on_hover_leave(event):
+        event.widget.configure(bg=event.widget.hover_colors[0])
+
     def build_header(self):
         header = tk.Frame(self, bg="#2b74ff", height=80)
         header.pack(fill=tk.X)
@@ -966,39 +1253,31 @@ Thank you for using our Professional Billing Software!
         self.var_search = tk.StringVar()
         search_entry = tk.Entry(search_frame, textvariable=self.var_search, width=35, font=("Segoe UI", 10), relief="flat", bd=8)
         search_entry.pack(side=tk.LEFT, padx=(15, 0))
-        search_entry.bind("<KeyRelease>", lambda e: self.refresh_products())
+        search_entry.bind("<KeyRelease>", lambda e: self.debounce("products", self.refresh_products))
         
         # Actions (right)
         actions_frame = tk.Frame(header_frame, bg="#2c3e50")
         actions_frame.pack(side=tk.RIGHT, padx=20, pady=18)
         
-        def on_enter(e, color):
-            e.widget.config(bg=color)
-        def on_leave(e, color):
-            e.widget.config(bg=color)
-        
         refresh_btn = tk.Button(actions_frame, text="🔄 Refresh", command=self.refresh_products,
                                 font=("Segoe UI", 10, "bold"), bg="#3498db", fg="white", relief="flat", bd=0,
                                 padx=14, pady=8, cursor="hand2")
         refresh_btn.pack(side=tk.LEFT, padx=(0, 8))
-        refresh_btn.bind("<Enter>", lambda e: on_enter(e, "#5dade2"))
-        refresh_btn.bind("<Leave>", lambda e: on_leave(e, "#3498db"))
+        self.add_hover(refresh_btn, "#5dade2")
         ToolTip(refresh_btn, "Refresh the products list to see latest changes")
         
         export_btn = tk.Button(actions_frame, text="📤 Export", command=self.export_products_csv,
                                font=("Segoe UI", 10, "bold"), bg="#27ae60", fg="white", relief="flat", bd=0,
                                padx=14, pady=8, cursor="hand2")
         export_btn.pack(side=tk.LEFT, padx=(0, 8))
-        export_btn.bind("<Enter>", lambda e: on_enter(e, "#2ecc71"))
-        export_btn.bind("<Leave>", lambda e: on_leave(e, "#27ae60"))
+        self.add_hover(export_btn, "#2ecc71")
         ToolTip(export_btn, "Export all products to a CSV file for backup")
         
         import_btn = tk.Button(actions_frame, text="📥 Import", command=self.import_products_csv,
                                font=("Segoe UI", 10, "bold"), bg="#9b59b6", fg="white", relief="flat", bd=0,
                                padx=14, pady=8, cursor="hand2")
         import_btn.pack(side=tk.LEFT)
-        import_btn.bind("<Enter>", lambda e: on_enter(e, "#8e44ad"))
-        import_btn.bind("<Leave>", lambda e: on_leave(e, "#9b59b6"))
+        self.add_hover(import_btn, "#8e44ad")
         ToolTip(import_btn, "Import products from a CSV file")
 
         # Main content area with soft background
@@ -1142,12 +1421,12 @@ Thank you for using our Professional Billing Software!
                 title="Export Products to CSV"
             )
             if filename:
-                products = list_products("")
+                products = list_products("", conn=self.conn)
                 with open(filename, 'w', newline='', encoding='utf-8') as f:
                     writer = csv.writer(f)
                     writer.writerow(['ID', 'Name', 'Price', 'Stock', 'Image Path'])
-                    for p in products:
-                        writer.writerow([p['id'], p['name'], p['price'], p['stock'], p.get('image_path', '')])
+                    # sqlite3.Row has no .get(), image_path is NULL for products without an image
+                    writer.writerows((p['id'], p['name'], p['price'], p['stock'], p['image_path'] or '') for p in products)
                 messagebox.showinfo("Success", f"Products exported to {filename}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export: {e}")
@@ -1174,10 +1453,10 @@ Thank you for using our Professional Billing Software!
                             )
                             imported_count += 1
                         except Exception as e:
-                            print(f"Error importing row {row}: {e}")
+                            logger.warning("Error importing row %s: %s", row, e)
                             continue
                 messagebox.showinfo("Success", f"Imported {imported_count} products")
-                self.refresh_products()
+                self.mark_stale("products", "billing")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to import: {e}")
 
@@ -1201,9 +1480,7 @@ Thank you for using our Professional Billing Software!
         self.var_stock.set(str(stock))
         # load image path
         try:
-            conn = get_conn(); cur = conn.cursor()
-            cur.execute("SELECT image_path FROM products WHERE id=?", (int(pid),))
-            row = cur.fetchone(); conn.close()
+            row = self.lookup_product(int(pid))
             img_path = row["image_path"] if row else None
         except Exception:
             img_path = None
@@ -1211,21 +1488,27 @@ Thank you for using our Professional Billing Software!
         self.set_image_preview(img_path)
 
     def refresh_products(self):
-        for i in self.products_tree.get_children():
-            self.products_tree.delete(i)
+        self._table_gallery_stale = True  # stock/products changed, rebuild the table menu on next open
+        self._all_products_by_id = None
+        self.products_tree.delete(*self.products_tree.get_children())
         term = self.var_search.get().strip() if hasattr(self, "var_search") else ""
-        for idx, r in enumerate(list_products(term)):
-            tag = "even" if idx % 2 == 0 else "odd"
+        rows = list_products(term, conn=self.conn)
+        if not term:
+            self._all_products_by_id = {r["id"]: r for r in rows}
+        tree_rows = []
+        for idx, r in enumerate(rows):
+            tag = _ALT_TAGS[idx & 1]
             # Check if image exists - use dictionary access instead of .get()
             image_path = r["image_path"] if "image_path" in r.keys() else None
             image_status = "✅ Yes" if image_path and os.path.exists(image_path) else "❌ No"
-            self.products_tree.insert("", tk.END, values=(
+            tree_rows.append(((
                 r["id"], 
                 r["name"], 
-                f"₹{r['price']:.2f}", 
+                money(r['price']), 
                 r["stock"],
                 image_status
-            ), tags=(tag,))
+            ), (tag,)))
+        self.bulk_insert(self.products_tree, tree_rows)
 
     def on_add_product(self):
         name = self.var_name.get().strip()
@@ -1294,8 +1577,7 @@ Thank you for using our Professional Billing Software!
             ok, err = add_product(name, price_val, stock_val, img_path)
             if ok:
                 self.clear_product_form()
-                self.refresh_products()
-                self.refresh_billing_products()
+                self.mark_stale("products", "billing")
                 self.set_status(f"✅ Product '{name}' added successfully!", "success")
                 messagebox.showinfo("✅ Success", f"Product '{name}' has been added to your inventory!\n\nPrice: ₹{price_val:.2f}\nStock: {stock_val} units")
             else:
@@ -1341,8 +1623,7 @@ Thank you for using our Professional Billing Software!
         img_path = self.copy_image_to_library(self.var_image_path.get().strip()) if self.var_image_path.get().strip() else None
         ok, err = update_product(int(self.var_pid.get()), name, price_val, stock_val, img_path)
         if ok:
-            self.refresh_products()
-            self.refresh_billing_products()
+            self.mark_stale("products", "billing")
             messagebox.showinfo("Updated", "Product updated")
         else:
             messagebox.showerror("Error", f"Could not update. {err}")
@@ -1357,6 +1638,108 @@ Thank you for using our Professional Billing Software!
         self.var_image_path.set(path)
         self.set_image_preview(path)
 
+    def _thumb_key(self, product, size):
+        """Cache key of a product thumbnail, or None if the product has no usable image"""
+        path = product["image_path"]
+        if not Image or not path:
+            return None
+        path = os.path.realpath(path)  # products sharing an image file share one thumbnail
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return None  # image file missing
+        return (path, mtime, size)
+
+    def get_product_thumbnail(self, product, size):
+        """Return a PhotoImage of the product image scaled to fit size, or None"""
+        key = self._thumb_key(product, size)
+        if key is None:
+            return None
+        if key not in self._pil_cache:
+            try:
+                self._cache_thumbnail(key, get_or_build_thumb(*key))
+            except Exception:
+                return None
+        return self._thumb_photo(key)
+
+    def _cache_thumbnail(self, key, pil):
+        """Remember a decoded thumbnail for later PhotoImages"""
+        path, mtime, _ = key
+        if self._thumb_mtimes.get(path, mtime) != mtime:
+            self.drop_thumbnails(path)  # image file was replaced, old sizes are stale
+        self._pil_cache[key] = pil
+        self._thumb_mtimes[path] = mtime
+
+    def _thumb_photo(self, key):
+        """PhotoImage of a cached thumbnail, reusing one still shown by another label (Tk thread only)"""
+        img = self._thumb_photos.get(key)
+        if img is None:
+            img = ImageTk.PhotoImage(self._pil_cache[key])
+            self._thumb_photos[key] = img
+        return img
+
+    def request_thumbnail(self, product, size, label):
+        """Show the product thumbnail on label, decoding it on a worker thread if not cached"""
+        key = self._thumb_key(product, size)
+        if key is None:
+            return  # keep the placeholder
+        if key in self._pil_cache:
+            img = self._thumb_photo(key)
+            label.configure(image=img)
+            label.image = img
+            return
+        waiting = self._thumb_waiting.get(key)
+        if waiting is not None:
+            waiting.append(label)  # same image is already being decoded for another card
+            return
+        self._thumb_waiting[key] = [label]
+        self._thumb_pool.submit(self._decode_thumbnail, key)
+        if len(self._thumb_waiting) == 1:
+            self.after(THUMB_FLUSH_MS, self._flush_thumb_updates)
+
+    def _decode_thumbnail(self, key):
+        # Runs on a worker thread - PIL work only, no Tk calls
+        try:
+            pil = get_or_build_thumb(*key)
+        except Exception:
+            pil = None
+        self._thumb_results.put((key, pil))
+
+    def _flush_thumb_updates(self):
+        """Apply every thumbnail finished since the last tick in one batch"""
+        pending_updates = []
+        while True:
+            try:
+                key, pil = self._thumb_results.get_nowait()
+            except queue.Empty:
+                break
+            labels = self._thumb_waiting.pop(key, [])
+            if pil is not None:
+                if key not in self._pil_cache:
+                    self._cache_thumbnail(key, pil)
+                img = self._thumb_photo(key)
+                pending_updates.extend((label, img) for label in labels)
+        for label, img in pending_updates:
+            # Gallery may have been rebuilt, or the card scrolled back out of view, meanwhile
+            if label.winfo_exists() and getattr(label, "image", "") is not None:
+                label.configure(image=img)
+                label.image = img
+        if self._thumb_waiting:
+            self.after(THUMB_FLUSH_MS, self._flush_thumb_updates)
+
+    def drop_thumbnails(self, path: str):
+        """Forget every cached thumbnail size of an image file"""
+        for key in [k for k in self._pil_cache if k[0] == path]:
+            del self._pil_cache[key]
+        self._thumb_mtimes.pop(path, None)
+
+    def debounce(self, key: str, callback, delay: int = 100):
+        """Run callback once typing pauses for delay ms instead of on every keystroke"""
+        job = self._debounce_jobs.get(key)
+        if job is not None:
+            self.after_cancel(job)
+        self._debounce_jobs[key] = self.after(delay, callback)
+
     def set_image_preview(self, path: str | None):
         if not hasattr(self, 'image_preview_label') or self.image_preview_label is None:
             return
@@ -1393,26 +1776,46 @@ Thank you for using our Professional Billing Software!
             return
         if not messagebox.askyesno("Confirm", "Delete this product?"):
             return
+        if self.var_image_path.get().strip():
+            self.drop_thumbnails(os.path.realpath(self.var_image_path.get().strip()))
         delete_product(int(self.var_pid.get()))
         self.clear_product_form()
-        self.refresh_products()
-        self.refresh_billing_products()
+        self.mark_stale("products", "billing")
         messagebox.showinfo("Deleted", "Product deleted")
 
     def on_tab_changed(self, event=None):
         try:
-            tab = self.notebook.tab(self.notebook.select(), 'text')
-            if tab == "Billing":
-                self.refresh_billing_products()
-            elif tab == "Tables":
-                self.refresh_tables()
-            elif tab == "Customers":
-                self.refresh_customers_list()
-            elif tab == "Reports":
-                self.refresh_reports()
+            self._refresh_current_tab()
         except Exception:
             pass
 
+    def mark_stale(self, *views):
+        """Flag views as out of date; only the visible one is rebuilt now, the rest on tab switch"""
+        if "products" in views:
+            # Lookups and the table menu must not see old stock even before the inventory is rebuilt
+            self._table_gallery_stale = True
+            self._all_products_by_id = None
+        if "reports" in views:
+            self._bills_cache = None  # a new bill must show up even within the TTL
+        self._stale.update(views)
+        self._refresh_current_tab()
+
+    def _refresh_current_tab(self):
+        view = self._tab_views.get(self.notebook.select())
+        if view not in self._stale:
+            return
+        self._stale.discard(view)
+        if view == "products":
+            self.refresh_products()
+        elif view == "billing":
+            self.refresh_billing_products()
+        elif view == "tables":
+            self.refresh_tables()
+        elif view == "customers":
+            self.refresh_customers_list()
+        elif view == "reports":
+            self.refresh_reports()
+
     # Billing Tab - Clean and Simple like Tables Tab
     def build_billing_tab(self):
         # Styles for a beautiful, professional look
@@ -1441,7 +1844,7 @@ Thank you for using our Professional Billing Software!
         self.var_bill_search = tk.StringVar()
         search_entry = ttk.Entry(search_frame, textvariable=self.var_bill_search, width=35, font=("Segoe UI", 10))
         search_entry.pack(side=tk.LEFT, padx=(15, 0))
-        search_entry.bind("<KeyRelease>", lambda e: self.refresh_billing_products())
+        search_entry.bind("<KeyRelease>", lambda e: self.debounce("billing", self.refresh_billing_products))
         
         # Customer selection
         customer_frame = ttk.Frame(header_frame)
@@ -1549,7 +1952,9 @@ Thank you for using our Professional Billing Software!
     def refresh_billing_products(self):
         """Refresh the billing product gallery"""
         term = self.var_bill_search.get().strip() if hasattr(self, "var_bill_search") else ""
-        rows = list_products(term)
+        rows = list_products(term, conn=self.conn)
+        if not term and self._all_products_by_id is None:
+            self._all_products_by_id = {r["id"]: r for r in rows}
         self.refresh_billing_gallery(rows)
 
     def refresh_billing_gallery(self, products):
@@ -1573,7 +1978,6 @@ Thank you for using our Professional Billing Software!
         card_width, card_height = 150, 170
         # Fixed columns per row as requested
         cols_per_row = 6
-        self._billing_gallery_images = []
         
         for idx, p in enumerate(products):
             row = idx // cols_per_row
@@ -1598,21 +2002,10 @@ Thank you for using our Professional Billing Software!
             img_container.pack(fill=tk.X, padx=2, pady=2)
             img_container.pack_propagate(False)
             
-            img_label = tk.Label(img_container, cursor="hand2", bg="#FFFFFF")
-            img = None
-            if p["image_path"] and os.path.exists(p["image_path"]):
-                try:
-                    pil = Image.open(p["image_path"]).convert("RGB")
-                    pil.thumbnail(thumb_size, Image.Resampling.LANCZOS)
-                    img = ImageTk.PhotoImage(pil)
-                except Exception:
-                    img = None
-            if img is not None:
-                img_label.configure(image=img)
-                img_label.image = img
-                self._billing_gallery_images.append(img)
-            else:
-                img_label.configure(text="📦\nNo Image", font=("Segoe UI", 9), fg="#666666")
+            # Placeholder text until the thumbnail is loaded
+            img_label = tk.Label(img_container, cursor="hand2", bg="#FFFFFF",
+                                 text="📦\nNo Image", font=("Segoe UI", 9), fg="#666666")
+            self.request_thumbnail(p, thumb_size, img_label)
             img_label.pack(expand=True)
             
             # Details
@@ -1646,10 +2039,9 @@ Thank you for using our Professional Billing Software!
 
     def add_product_to_cart(self, pid: int):
         """Add product to cart by clicking on product image"""
-        prod = [r for r in list_products("") if r["id"] == pid]
+        prod = self.lookup_product(pid)
         if not prod:
             return
-        prod = prod[0]
         
         if prod["stock"] <= 0:
             messagebox.showwarning("Stock", f"Out of stock: {prod['name']}")
@@ -1658,21 +2050,22 @@ Thank you for using our Professional Billing Software!
         # Show the same popup as tables tab
         self.show_billing_product_popup(prod)
     
+    def centered_geometry(self, width: int, height: int) -> str:
+        """Geometry string that centers a width x height window on the screen"""
+        # Screen size is known up front, so no idle flush is needed before placing the window
+        x = max(0, (self.master.winfo_screenwidth() - width) // 2)
+        y = max(0, (self.master.winfo_screenheight() - height) // 2)
+        return f"{width}x{height}+{x}+{y}"
+
     def show_billing_product_popup(self, product):
         """Show a beautiful, modern popup for billing product quantity selection"""
         popup = tk.Toplevel(self.master)
         popup.title("Add to Cart")
-        popup.geometry("480x620")
+        popup.geometry(self.centered_geometry(480, 620))
         popup.resizable(False, False)
         popup.transient(self.master)
         popup.grab_set()
 
-        # Center the popup
-        popup.update_idletasks()
-        sw, sh = popup.winfo_screenwidth(), popup.winfo_screenheight()
-        x, y = (sw - 480) // 2, (sh - 620) // 2
-        popup.geometry(f"480x620+{x}+{y}")
-
         # Header bar
         header = tk.Frame(popup, bg="#2c3e50", height=64)
         header.pack(fill=tk.X)
@@ -1685,14 +2078,7 @@ Thank you for using our Professional Billing Software!
 
         # Product image
         img_label = tk.Label(body, bg="#ffffff")
-        img = None
-        if product["image_path"] and os.path.exists(product["image_path"]):
-            try:
-                pil = Image.open(product["image_path"]).convert("RGB")
-                pil.thumbnail((180, 180), Image.Resampling.LANCZOS)
-                img = ImageTk.PhotoImage(pil)
-            except Exception:
-                img = None
+        img = self.get_product_thumbnail(product, (180, 180))
         
         if img is not None:
             img_label.configure(image=img)
@@ -1740,7 +2126,7 @@ Thank you for using our Professional Billing Software!
         total_label.pack(pady=(18, 24))
         
         # Functions
-        def update_total():
+        def update_total(*_):
             qty = qty_var.get()
             total = qty * float(product["price"])
             total_var.set(f"Total: ₹{total:.2f}")
@@ -1748,17 +2134,15 @@ Thank you for using our Professional Billing Software!
         def decrease_qty():
             if qty_var.get() > 1:
                 qty_var.set(qty_var.get() - 1)
-                update_total()
         
         def increase_qty():
             if qty_var.get() < product["stock"]:
                 qty_var.set(qty_var.get() + 1)
-                update_total()
         
-        # Bind buttons
+        # Bind buttons - the trace recomputes the total on every quantity change
         minus_btn.configure(command=decrease_qty)
         plus_btn.configure(command=increase_qty)
-        qty_var.trace("w", lambda *args: update_total())
+        qty_var.trace_add("write", update_total)
         
         # Initial total
         update_total()
@@ -1875,19 +2259,11 @@ Thank you for using our Professional Billing Software!
         """Show popup to add new customer"""
         popup = tk.Toplevel(self.master)
         popup.title("Add New Customer")
-        popup.geometry("400x500")
+        popup.geometry(self.centered_geometry(400, 500))
         popup.resizable(False, False)
         popup.transient(self.master)
         popup.grab_set()
         
-        # Center the popup
-        popup.update_idletasks()
-        screen_width = popup.winfo_screenwidth()
-        screen_height = popup.winfo_screenheight()
-        x = (screen_width - 400) // 2
-        y = (screen_height - 500) // 2
-        popup.geometry(f"400x500+{x}+{y}")
-        
         popup.configure(bg="white")
         
         # Main container
@@ -1964,35 +2340,11 @@ Thank you for using our Professional Billing Software!
         # Create popup window
         popup = tk.Toplevel(self.master)
         popup.title(f"Add {product['name']} to Cart")
-        popup.geometry("450x600")
+        popup.geometry(self.centered_geometry(450, 600))
         popup.resizable(False, False)
         popup.transient(self.master)
         popup.grab_set()
         
-        # Center the popup properly
-        popup.update_idletasks()
-        
-        # Get screen dimensions
-        screen_width = popup.winfo_screenwidth()
-        screen_height = popup.winfo_screenheight()
-        
-        # Calculate position to center the window
-        x = (screen_width - 450) // 2
-        y = (screen_height - 600) // 2
-        
-        # Ensure positive coordinates and proper centering
-        x = max(0, x)
-        y = max(0, y)
-        
-        # Set the geometry with calculated position
-        popup.geometry(f"450x600+{x}+{y}")
-        
-        # Force the popup to be visible and centered
-        popup.lift()
-        popup.focus_force()
-        popup.attributes('-topmost', True)
-        popup.after_idle(lambda: popup.attributes('-topmost', False))
-        
         # Configure popup style
         popup.configure(bg="#F5F5F5")
         
@@ -2047,8 +2399,9 @@ Thank you for using our Professional Billing Software!
         controls_frame = tk.Frame(qty_frame, bg="#FFFFFF")
         controls_frame.pack(expand=True)
         
-        # Quantity variable
-        qty_var = tk.StringVar(value="1")
+        # Quantity variable - digits only, but may be empty while the user is retyping it
+        qty_var = tk.IntVar(value=1)
+        validate_qty = (popup.register(self.is_valid_qty_input), "%P")
         
         # Minus button - professional styling
         minus_btn = tk.Button(controls_frame, text="−", font=("Segoe UI", 20, "bold"),
@@ -2060,7 +2413,8 @@ Thank you for using our Professional Billing Software!
         # Quantity input - professional styling
         qty_entry = tk.Entry(controls_frame, textvariable=qty_var, font=("Segoe UI", 18, "bold"),
                             width=8, justify=tk.CENTER, relief="solid", bd=2,
-                            bg="#F8F9FA", fg="#333333", insertbackground="#333333")
+                            bg="#F8F9FA", fg="#333333", insertbackground="#333333",
+                            validate="key", validatecommand=validate_qty)
         qty_entry.pack(side=tk.LEFT, padx=10)
         
         # Plus button - professional styling
@@ -2102,58 +2456,51 @@ Thank you for using our Professional Billing Software!
         add_btn.pack(side=tk.LEFT)
         
         # Functions for quantity controls
-        def update_quantity(delta):
+        def current_qty():
             try:
-                current_qty = int(qty_var.get())
-                new_qty = max(1, min(current_qty + delta, product["stock"]))
-                qty_var.set(str(new_qty))
-                update_total()
-            except ValueError:
-                qty_var.set("1")
-                update_total()
+                return qty_var.get()
+            except tk.TclError:  # empty entry
+                return 0
         
-        def update_total():
-            try:
-                qty = int(qty_var.get())
-                total = qty * float(product["price"])
-                total_label.config(text=f"Total: ₹{total:.2f}")
-            except ValueError:
-                total_label.config(text="Total: ₹0.00")
+        def update_quantity(delta):
+            new_qty = max(1, min(current_qty() + delta, product["stock"]))
+            qty_var.set(new_qty)
+        
+        def update_total(*_):
+            qty = current_qty()
+            total = qty * float(product["price"])
+            total_label.config(text=f"Total: ₹{total:.2f}")
         
         def add_to_cart():
-            try:
-                qty = int(qty_var.get())
-                if qty <= 0:
-                    messagebox.showwarning("Invalid Quantity", "Please enter a valid quantity")
-                    return
-                
-                if qty > product["stock"]:
-                    messagebox.showwarning("Stock", f"Only {product['stock']} units available")
-                    return
-                
-                # Check if already in cart
-                for item in self.cart_items:
-                    if item["product_id"] == product["id"]:
-                        if item["qty"] + qty > product["stock"]:
-                            messagebox.showwarning("Stock", f"Only {product['stock']} units available")
-                            return
-                        item["qty"] += qty
-                        break
-                else:
-                    self.cart_items.append({
-                        "product_id": product["id"],
-                        "name": product["name"],
-                        "price": float(product["price"]),
-                        "qty": qty,
-                    })
-                
-                self.refresh_cart()
-                
-                # Close popup immediately - no success message to speed up process
-                popup.destroy()
-                
-            except ValueError:
-                messagebox.showwarning("Invalid Quantity", "Please enter a valid number")
+            qty = current_qty()
+            if qty <= 0:
+                messagebox.showwarning("Invalid Quantity", "Please enter a valid quantity")
+                return
+            
+            if qty > product["stock"]:
+                messagebox.showwarning("Stock", f"Only {product['stock']} units available")
+                return
+            
+            # Check if already in cart
+            for item in self.cart_items:
+                if item["product_id"] == product["id"]:
+                    if item["qty"] + qty > product["stock"]:
+                        messagebox.showwarning("Stock", f"Only {product['stock']} units available")
+                        return
+                    item["qty"] += qty
+                    break
+            else:
+                self.cart_items.append({
+                    "product_id": product["id"],
+                    "name": product["name"],
+                    "price": float(product["price"]),
+                    "qty": qty,
+                })
+            
+            self.refresh_cart()
+            
+            # Close popup immediately - no success message to speed up process
+            popup.destroy()
         
         # Bind events
         minus_btn.config(command=lambda: update_quantity(-1))
@@ -2161,7 +2508,7 @@ Thank you for using our Professional Billing Software!
         add_btn.config(command=add_to_cart)
         
         # Bind quantity entry changes
-        qty_var.trace("w", lambda *args: update_total())
+        qty_var.trace_add("write", update_total)
         
         # Initial total update
         update_total()
@@ -2171,14 +2518,12 @@ Thank you for using our Professional Billing Software!
         qty_entry.select_range(0, tk.END)
         
         # Ensure popup is on top and visible
-        popup.lift()
-        popup.focus_force()
-        popup.attributes('-topmost', True)
-        popup.after_idle(lambda: popup.attributes('-topmost', False))
-        
-        # Force update and show
-        popup.update()
-        popup.deiconify()
+        self._raise_popup(popup)
+
+    @staticmethod
+    def is_valid_qty_input(new_value: str) -> bool:
+        """Entry validator: accept positive whole numbers without leading zeros, or empty while editing"""
+        return new_value == "" or (new_value.isdigit() and new_value[0] != "0")
 
     def show_add_success_popup(self, parent_popup, product, qty):
         """Show success popup after adding product to cart"""
@@ -2188,17 +2533,11 @@ Thank you for using our Professional Billing Software!
         # Create success popup
         success_popup = tk.Toplevel(self.master)
         success_popup.title("Product Added Successfully")
-        success_popup.geometry("400x250")
+        success_popup.geometry(self.centered_geometry(400, 250))
         success_popup.resizable(False, False)
         success_popup.transient(self.master)
         success_popup.grab_set()
         
-        # Center the popup
-        success_popup.update_idletasks()
-        x = (success_popup.winfo_screenwidth() // 2) - (400 // 2)
-        y = (success_popup.winfo_screenheight() // 2) - (250 // 2)
-        success_popup.geometry(f"400x250+{x}+{y}")
-        
         # Configure popup style
         success_popup.configure(bg="#F5F5F5")
         
@@ -2250,18 +2589,18 @@ Thank you for using our Professional Billing Software!
         view_cart_btn.pack(side=tk.RIGHT)
         
         # Ensure popup is visible
-        success_popup.lift()
-        success_popup.focus_force()
-        success_popup.attributes('-topmost', True)
-        success_popup.after_idle(lambda: success_popup.attributes('-topmost', False))
+        self._raise_popup(success_popup)
+
+    def _raise_popup(self, win):
+        """Bring a newly shown popup to the front and give it focus"""
+        win.lift()
+        win.focus_force()
+        win.attributes('-topmost', True)
+        win.after_idle(lambda: win.attributes('-topmost', False))
 
     def switch_to_billing_tab(self):
         """Switch to billing tab to show the cart"""
-        # Find the billing tab and switch to it
-        for i, tab in enumerate(self.notebook.tabs()):
-            if "Billing" in self.notebook.tab(tab, "text"):
-                self.notebook.select(i)
-                break
+        self.notebook.select(self._billing_tab_id)
 
     def recalc_total(self):
         total = sum(i["price"] * i["qty"] for i in self.cart_items)
@@ -2269,12 +2608,11 @@ Thank you for using our Professional Billing Software!
 
 
     def refresh_cart(self):
-        for i in self.cart_tree.get_children():
-            self.cart_tree.delete(i)
+        self.cart_tree.delete(*self.cart_tree.get_children())
         for idx, item in enumerate(self.cart_items):
             subtotal = item["price"] * item["qty"]
-            tag = "even" if idx % 2 == 0 else "odd"
-            self.cart_tree.insert("", tk.END, values=(item["name"], f"₹{item['price']:.2f}", item["qty"], f"₹{subtotal:.2f}"), tags=(tag,))
+            tag = _ALT_TAGS[idx & 1]
+            self.cart_tree.insert("", tk.END, values=(item["name"], money(item['price']), item["qty"], money(subtotal)), tags=(tag,))
         self.recalc_total()
 
     def on_remove_cart_item(self):
@@ -2304,9 +2642,6 @@ Thank you for using our Professional Billing Software!
         path = save_invoice_text(bill_id)
         self.cart_items = []
         self.refresh_cart()
-        self.refresh_products()  # stock changed
-        self.refresh_billing_products()
-        self.refresh_reports()
         
         # Clear customer selection
         self.var_customer.set("")
@@ -2314,15 +2649,17 @@ Thank you for using our Professional Billing Software!
         self.selected_customer_name = ""
         self.selected_customer_mobile = ""
         
+        # Show the invoice first; stock changed, so rebuild the heavier views after it paints
         if path:
             self.show_invoice_preview(bill_id, path)
-        else:
+        self.master.after_idle(self.mark_stale, "products", "billing", "tables", "reports")
+        if not path:
             messagebox.showinfo("Done", f"Bill #{bill_id} saved.")
 
     def show_invoice_preview(self, bill_id: int, path: str):
         win = tk.Toplevel(self.master)
         win.title(f"Invoice #{bill_id} Preview")
-        win.geometry("700x500")
+        win.geometry(self.centered_geometry(700, 500))
 
         top = ttk.Frame(win)
         top.pack(fill=tk.X, padx=10, pady=8)
@@ -2376,25 +2713,45 @@ Thank you for using our Professional Billing Software!
 
         btns = ttk.Frame(win)
         btns.pack(fill=tk.X, padx=10, pady=10)
-        ttk.Button(btns, text="Save", command=lambda: (save_settings({k: v.get() for k, v in vars_.items()}), win.destroy(), messagebox.showinfo("Saved", "Company profile saved"))).pack(side=tk.RIGHT)
+        ttk.Button(btns, text="Save", command=lambda: (save_settings({k: v.get() for k, v in vars_.items()}), win.destroy(), self.show_toast("Company profile saved"))).pack(side=tk.RIGHT)
 
     def print_file(self, path: str):
         try:
             if hasattr(os, "startfile"):
                 # Sends to default printer; for thermal printers set as default, it will print there
                 os.startfile(path, "print")
-                messagebox.showinfo("Print", "Sent to printer. If nothing prints, check the default printer.")
+                self.show_toast("Sent to printer. If nothing prints, check the default printer.")
             else:
                 messagebox.showwarning("Print", "Printing is supported on Windows using the default printer.")
         except Exception as e:
             messagebox.showerror("Print Error", str(e))
 
+    def show_toast(self, message: str, duration: int = 2000):
+        """Show a short non-blocking notice that closes itself after duration ms"""
+        toast = tk.Toplevel(self.master)
+        toast.overrideredirect(True)
+        toast.transient(self.master)
+        label = tk.Label(toast, text=message, font=("Segoe UI", 10, "bold"), bg="#323232", fg="white",
+                         padx=16, pady=10)
+        label.pack()
+        # The label's requested size is known as soon as it is configured, the toplevel's only after an idle pass
+        x = self.master.winfo_rootx() + (self.master.winfo_width() - label.winfo_reqwidth()) // 2
+        y = self.master.winfo_rooty() + self.master.winfo_height() - 90
+        toast.geometry(f"+{max(0, x)}+{max(0, y)}")
+        toast.after(duration, toast.destroy)
+
     # Tables Tab
     def build_tables_tab(self):
         # Table status tracking - 8 tables with more space
         self.current_table = 0
-        self.table_orders = {i+1: [] for i in range(8)}  # Store orders for each table
+        self.table_orders = {i+1: {} for i in range(8)}  # Store orders for each table: product_id -> item
         self.table_status = {i+1: "empty" for i in range(8)}  # empty, ordering, ready, served
+        self._menu_built = False  # menu view is built once and shared by all tables
+        self._dirty_tables = set()  # tables whose card needs repainting
+        self._last_rendered = {}  # table_num -> (status, has_order) currently shown on its card
+        self._table_totals = {}  # table_num -> (total, item_count), dropped whenever the order changes
+        self._active_count = 0  # tables in ACTIVE_TABLE_STATUSES, kept up to date by _set_table_status
+        self._table_gallery_stale = True
 
         # Professional header
         header_frame = ttk.Frame(self.tables_tab, style="Header.TFrame")
@@ -2482,38 +2839,25 @@ Thank you for using our Professional Billing Software!
             status_label.pack(side=tk.RIGHT, padx=12, pady=8)
             
             # Remove button - systematic placement - bigger and rounded
-            remove_btn = tk.Button(
+            remove_btn = ttk.Button(
                 header_frame,
-                text="✕",
-                font=("Segoe UI", 12, "bold"),
+                text=_REMOVE_BTN_TEXT,
                 command=lambda t=table_num: self.clear_table_order(t),
-                bg="#F44336",
-                fg="white",
-                relief="raised",
-                bd=4,
+                style="TableRemove.TButton",
                 width=2,
-                height=1,
                 cursor="hand2"
             )
             remove_btn.pack(side=tk.RIGHT, padx=4, pady=8)
-            remove_btn.bind("<Enter>", lambda e, b=remove_btn: b.configure(bg="#D32F2F"))
-            remove_btn.bind("<Leave>", lambda e, b=remove_btn: b.configure(bg="#F44336"))
             
             # Main table button area with status text - bigger and rounded
-            btn = tk.Button(
+            btn = ttk.Button(
                 table_frame, 
                 text=self.get_status_text(table_num),
                 command=lambda t=table_num: self.open_table_menu(t),
-                font=("Segoe UI", 12, "bold"),
-                bg=self.get_table_color(table_num),
-                fg="#1976D2",
-                relief="raised",
-                bd=4,
+                style=f"Table.{self.table_status[table_num]}.TButton",
                 cursor="hand2"
             )
             btn.pack(fill=tk.BOTH, expand=True, padx=4, pady=2)
-            btn.bind("<Enter>", lambda e, b=btn, t=table_num: b.configure(bg=self.get_hover_color(t)))
-            btn.bind("<Leave>", lambda e, b=btn, t=table_num: b.configure(bg=self.get_table_color(table_num)))
             
             # Status icons frame - bigger
             icons_frame = tk.Frame(table_frame, height=30, bg=self.get_table_color(table_num))
@@ -2521,7 +2865,7 @@ Thank you for using our Professional Billing Software!
             icons_frame.pack_propagate(False)
             
             # Add status icons
-            self.add_table_icons(icons_frame, table_num)
+            printer_btn = self.add_table_icons(icons_frame, table_num)
             
             # Systematic buttons layout - bigger with more space
             buttons_frame = tk.Frame(table_frame, height=80)
@@ -2529,46 +2873,31 @@ Thank you for using our Professional Billing Software!
             buttons_frame.pack_propagate(False)
             
             # Generate Bill button - professional square design
-            bill_btn = tk.Button(
+            bill_btn = ttk.Button(
                 buttons_frame,
-                text="📄\nGENERATE\nBILL",
-                font=("Segoe UI", 8, "bold"),
+                text=_BILL_BTN_TEXT,
                 command=lambda t=table_num: self.generate_table_bill_direct(t),
-                bg="#4CAF50",
-                fg="white",
-                relief="raised",
-                bd=3,
+                style="TableBill.TButton",
                 width=8,
-                height=4,
                 cursor="hand2",
-                state="disabled",
-                compound="center"
+                state="disabled"
             )
-            bill_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2, pady=2)
-            bill_btn.bind("<Enter>", lambda e, b=bill_btn: b.configure(bg="#45a049") if b['state'] == 'normal' else None)
-            bill_btn.bind("<Leave>", lambda e, b=bill_btn: b.configure(bg="#4CAF50") if b['state'] == 'normal' else None)
+            bill_btn.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2, pady=2)
             
             # View Bill button - professional square design
-            view_bill_btn = tk.Button(
+            view_bill_btn = ttk.Button(
                 buttons_frame,
-                text="👁️\nVIEW\nBILL",
-                font=("Segoe UI", 8, "bold"),
+                text=_VIEW_BTN_TEXT,
                 command=lambda t=table_num: self.view_table_bill_direct(t),
-                bg="#2196F3",
-                fg="white",
-                relief="raised",
-                bd=3,
+                style="TableViewBill.TButton",
                 width=8,
-                height=4,
                 cursor="hand2",
-                state="disabled",
-                compound="center"
+                state="disabled"
             )
-            view_bill_btn.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2, pady=2)
-            view_bill_btn.bind("<Enter>", lambda e, b=view_bill_btn: b.configure(bg="#1976D2") if b['state'] == 'normal' else None)
-            view_bill_btn.bind("<Leave>", lambda e, b=view_bill_btn: b.configure(bg="#2196F3") if b['state'] == 'normal' else None)
+            view_bill_btn.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=2, pady=2)
             
-            self.table_buttons.append((table_frame, btn, icons_frame, header_frame, bill_btn, view_bill_btn))
+            self.table_buttons.append((table_frame, btn, icons_frame, header_frame, bill_btn, view_bill_btn, printer_btn))
+            self._last_rendered[table_num] = (self.table_status[table_num], bool(self.table_orders[table_num]))
         
         # Configure grid weights for systematic layout
         for i in range(4):  # 4 columns
@@ -2579,21 +2908,19 @@ Thank you for using our Professional Billing Software!
     def open_table_menu(self, table_num):
         """Open menu view for selected table"""
         self.current_table = table_num
-        self.table_status[table_num] = "ordering"
-        self.update_table_display()
+        self._set_table_status(table_num, "ordering")
+        self.mark_table_dirty(table_num)
         
         # Hide tables view and show menu view
         self.tables_main_frame.pack_forget()
         self.menu_view_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        self.build_menu_view(table_num)
+        if not self._menu_built:
+            self._build_menu_view_once()
+        self._bind_menu_view_to_table(table_num)
 
-    def build_menu_view(self, table_num):
-        """Build beautiful menu view for selected table"""
-        # Clear existing widgets
-        for widget in self.menu_view_frame.winfo_children():
-            widget.destroy()
-        
+    def _build_menu_view_once(self):
+        """Build beautiful menu view; the widgets are reused for every table"""
         # Beautiful header with modern styling
         header_frame = tk.Frame(self.menu_view_frame, bg="#2c3e50", height=80)
         header_frame.pack(fill=tk.X)
@@ -2604,23 +2931,19 @@ Thank you for using our Professional Billing Software!
         header_content.pack(expand=True, fill=tk.BOTH, padx=20, pady=15)
         
         # Back button with modern styling
-        back_btn = tk.Button(header_content, text="🔙 Back to Tables", 
-                            command=self.back_to_tables,
-                            font=("Segoe UI", 12, "bold"),
-                            bg="#e74c3c", fg="white", relief="flat", bd=0,
-                            cursor="hand2", padx=20, pady=10)
+        back_btn = ttk.Button(header_content, text=_BACK_BTN_TEXT, 
+                             command=self.back_to_tables,
+                             style="MenuBack.TButton", cursor="hand2", padding=(20, 10))
         back_btn.pack(side=tk.LEFT)
-        back_btn.bind("<Enter>", lambda e, b=back_btn: b.configure(bg="#c0392b"))
-        back_btn.bind("<Leave>", lambda e, b=back_btn: b.configure(bg="#e74c3c"))
         
         # Table info section
         table_info_section = tk.Frame(header_content, bg="#2c3e50")
         table_info_section.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Table number
-        table_title = tk.Label(table_info_section, text=f"Table {table_num}", 
-                              font=("Segoe UI", 20, "bold"), fg="white", bg="#2c3e50")
-        table_title.pack(anchor="e")
+        self.menu_table_title = tk.Label(table_info_section, text="", 
+                                        font=("Segoe UI", 20, "bold"), fg="white", bg="#2c3e50")
+        self.menu_table_title.pack(anchor="e")
         
         # Order summary removed as requested
         
@@ -2653,7 +2976,7 @@ Thank you for using our Professional Billing Software!
         search_entry = tk.Entry(search_frame, textvariable=self.var_table_search, 
                                font=("Segoe UI", 11), width=30, relief="flat", bd=1)
         search_entry.pack(side=tk.LEFT, padx=5, pady=5)
-        search_entry.bind("<KeyRelease>", lambda e: self.refresh_table_products())
+        search_entry.bind("<KeyRelease>", lambda e: self.debounce("tables", self.refresh_table_products))
         
         # Product gallery with beautiful design
         gallery_frame = tk.Frame(menu_frame, bg="white")
@@ -2670,7 +2993,13 @@ Thank you for using our Professional Billing Software!
         h_scroll = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL, command=self.table_gallery_canvas.xview)
         v_scroll = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.table_gallery_canvas.yview)
         
-        self.table_gallery_canvas.configure(xscrollcommand=h_scroll.set, yscrollcommand=v_scroll.set)
+        # Thumbnails are only loaded for cards scrolled into view, see _update_visible_thumbs
+        def on_gallery_yscroll(first, last):
+            v_scroll.set(first, last)
+            self.debounce("table_thumbs", self._update_visible_thumbs, 50)
+        self.table_gallery_canvas.configure(xscrollcommand=h_scroll.set, yscrollcommand=on_gallery_yscroll)
+        self.table_gallery_canvas.bind("<Configure>", lambda e: self.debounce("table_thumbs", self._update_visible_thumbs, 50))
+        self._table_gallery_cells = []
         
         # Inner frame for images
         self.table_gallery_inner = tk.Frame(self.table_gallery_canvas, bg="white")
@@ -2697,9 +3026,9 @@ Thank you for using our Professional Billing Software!
         order_header.pack(fill=tk.X)
         order_header.pack_propagate(False)
         
-        order_title = tk.Label(order_header, text=f"Table {table_num} Order", 
-                              font=("Segoe UI", 16, "bold"), fg="white", bg="#34495e")
-        order_title.pack(expand=True)
+        self.menu_order_title = tk.Label(order_header, text="", 
+                                        font=("Segoe UI", 16, "bold"), fg="white", bg="#34495e")
+        self.menu_order_title.pack(expand=True)
         
         # Order tree container to control height
         tree_container = tk.Frame(order_frame, bg="white")
@@ -2754,27 +3083,29 @@ Thank you for using our Professional Billing Software!
         buttons_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=20, pady=15)
         
         # Remove Selected button - Red like in screenshot
-        remove_btn = tk.Button(buttons_frame, text="🗑️ Remove Selected", 
-                              command=self.remove_selected_table_item,
-                              font=("Segoe UI", 12, "bold"),
-                              bg="#e74c3c", fg="white", relief="raised", bd=2,
-                              cursor="hand2", padx=20, pady=10, width=15, height=2)
+        remove_btn = ttk.Button(buttons_frame, text=_REMOVE_ITEM_BTN_TEXT, 
+                               command=self.remove_selected_table_item,
+                               style="MenuRemove.TButton", cursor="hand2", padding=(20, 10), width=15)
         remove_btn.pack(side=tk.LEFT, padx=(5, 0))
-        remove_btn.bind("<Enter>", lambda e, b=remove_btn: b.configure(bg="#c0392b"))
-        remove_btn.bind("<Leave>", lambda e, b=remove_btn: b.configure(bg="#e74c3c"))
         
         # Generate Bill button - Green like in screenshot
-        generate_btn = tk.Button(buttons_frame, text="💳 Generate Bill", 
-                                command=self.generate_table_bill,
-                                font=("Segoe UI", 12, "bold"),
-                                bg="#27ae60", fg="white", relief="raised", bd=2,
-                                cursor="hand2", padx=20, pady=10, width=15, height=2)
+        generate_btn = ttk.Button(buttons_frame, text=_GENERATE_BILL_BTN_TEXT, 
+                                 command=self.generate_table_bill,
+                                 style="MenuGenerate.TButton", cursor="hand2", padding=(20, 10), width=15)
         generate_btn.pack(side=tk.LEFT, padx=(5, 0))
-        generate_btn.bind("<Enter>", lambda e, b=generate_btn: b.configure(bg="#229954"))
-        generate_btn.bind("<Leave>", lambda e, b=generate_btn: b.configure(bg="#27ae60"))
         
-        # Refresh the menu
-        self.refresh_table_products()
+        self._menu_built = True
+
+    def _bind_menu_view_to_table(self, table_num):
+        """Point the shared menu view at the selected table"""
+        self.menu_table_title.configure(text=f"Table {table_num}")
+        self.menu_order_title.configure(text=f"Table {table_num} Order")
+        
+        # The gallery is the same for every table - only rebuild it when the
+        # products changed or a previous table left a search filter behind
+        if self._table_gallery_stale or self.var_table_search.get():
+            self.var_table_search.set("")
+            self.refresh_table_products()
         self.refresh_table_order()
 
     def back_to_tables(self):
@@ -2785,123 +3116,99 @@ Thank you for using our Professional Billing Software!
 
     def get_table_color(self, table_num):
         """Get color based on table status"""
-        status = self.table_status.get(table_num, "empty")
-        if status == "empty":
-            return "#E8F5E8"  # Light green
-        elif status == "ordering":
-            return "#E3F2FD"  # Light blue
-        elif status == "ready":
-            return "#FFF3E0"  # Light orange
-        elif status == "served":
-            return "#F3E5F5"  # Light purple
-        return "#E8F5E8"
+        return TABLE_STATUS_COLORS.get(self.table_status.get(table_num, "empty"), TABLE_STATUS_COLORS["empty"])[0]
 
     def get_hover_color(self, table_num):
         """Get hover color for table"""
-        status = self.table_status.get(table_num, "empty")
-        if status == "empty":
-            return "#C8E6C9"  # Medium green
-        elif status == "ordering":
-            return "#BBDEFB"  # Medium blue
-        elif status == "ready":
-            return "#FFE0B2"  # Medium orange
-        elif status == "served":
-            return "#E1BEE7"  # Medium purple
-        return "#C8E6C9"
+        return TABLE_STATUS_COLORS.get(self.table_status.get(table_num, "empty"), TABLE_STATUS_COLORS["empty"])[1]
 
     def get_status_emoji(self, table_num):
         """Get status emoji for table header"""
-        status = self.table_status.get(table_num, "empty")
-        if status == "empty":
-            return ""
-        elif status == "ordering":
-            return "📝"
-        elif status == "ready":
-            return "✅"
-        elif status == "served":
-            return "🍽️"
-        return ""
+        return TABLE_STATUS_EMOJI.get(self.table_status.get(table_num, "empty"), "")
 
     def get_status_text(self, table_num):
         """Get status text for table button"""
-        status = self.table_status.get(table_num, "empty")
-        order = self.table_orders[table_num]
-        item_count = len(order)
-        
-        if status == "empty":
-            return "VIEW"
-        elif status == "ordering":
-            return f"ORDERING\n({item_count} items)"
-        elif status == "ready":
-            return f"READY\n({item_count} items)"
-        elif status == "served":
-            return f"SERVED\n({item_count} items)"
-        return "VIEW"
+        return table_status_text(self.table_status.get(table_num, "empty"), len(self.table_orders[table_num]))
 
     def add_table_icons(self, parent, table_num):
-        """Add status icons to table - only for kitchen bill functionality"""
-        status = self.table_status.get(table_num, "empty")
-        
-        # Only show printer button for tables with orders (kitchen bill functionality)
-        if status in ["ordering", "ready", "served"]:
-            # Centered PRINT text in the middle of orange button - properly centered
-            printer_btn = tk.Button(
-                parent, 
-                text="PRINT",
-                font=("Segoe UI", 10, "bold"),
-                command=lambda: self.print_table_order(table_num),
-                bg="#FF9800", fg="white", relief="raised", bd=3, width=4, height=1,
-                cursor="hand2"
-            )
+        """Create the table's printer button - only for kitchen bill functionality"""
+        # Centered PRINT text in the middle of orange button - properly centered
+        printer_btn = ttk.Button(
+            parent, 
+            text=_PRINT_BTN_TEXT,
+            command=lambda: self.print_table_order(table_num),
+            style="TablePrint.TButton", width=6, padding=0,
+            cursor="hand2"
+        )
+        # Only shown for tables with orders, see update_table_display
+        if self.table_status.get(table_num, "empty") in PRINTABLE_TABLE_STATUSES:
             printer_btn.pack(expand=True, pady=2)
-            printer_btn.bind("<Enter>", lambda e, b=printer_btn: b.configure(bg="#F57C00"))
-            printer_btn.bind("<Leave>", lambda e, b=printer_btn: b.configure(bg="#FF9800"))
+        return printer_btn
 
     def update_table_display(self):
         """Update all table displays with current status"""
-        for i, (frame, btn, icons_frame, header_frame, bill_btn, view_bill_btn) in enumerate(self.table_buttons):
-            table_num = i + 1
-            color = self.get_table_color(table_num)
-            btn.configure(bg=color)
-            header_frame.configure(bg=color)
-            icons_frame.configure(bg=color)
-            
-            # Update header label color
-            for widget in header_frame.winfo_children():
-                if isinstance(widget, tk.Label):
-                    widget.configure(bg=color)
-            
-            # Update buttons based on table status
-            order = self.table_orders[table_num]
-            if order:
-                bill_btn.configure(state="normal", bg="#4CAF50", fg="white", text="📄\nGENERATE\nBILL")
-                view_bill_btn.configure(state="normal", bg="#2196F3", fg="white", text="👁️\nVIEW\nBILL")
-                # Rebind hover events for enabled state
-                bill_btn.bind("<Enter>", lambda e, b=bill_btn: b.configure(bg="#45a049"))
-                bill_btn.bind("<Leave>", lambda e, b=bill_btn: b.configure(bg="#4CAF50"))
-                view_bill_btn.bind("<Enter>", lambda e, b=view_bill_btn: b.configure(bg="#1976D2"))
-                view_bill_btn.bind("<Leave>", lambda e, b=view_bill_btn: b.configure(bg="#2196F3"))
-            else:
-                bill_btn.configure(state="disabled", bg="#E0E0E0", fg="#9E9E9E", text="📄\nGENERATE\nBILL")
-                view_bill_btn.configure(state="disabled", bg="#E0E0E0", fg="#9E9E9E", text="👁️\nVIEW\nBILL")
-                # Remove hover events for disabled state
-                bill_btn.unbind("<Enter>")
-                bill_btn.unbind("<Leave>")
-                view_bill_btn.unbind("<Enter>")
-                view_bill_btn.unbind("<Leave>")
-            
-            # Clear and rebuild icons
-            for widget in icons_frame.winfo_children():
-                widget.destroy()
-            self.add_table_icons(icons_frame, table_num)
+        self._dirty_tables.update(self.table_status)
+        self._flush_table_display()
+
+    def mark_table_dirty(self, table_num):
+        """Repaint a table card once the current event is handled"""
+        if not self._dirty_tables:
+            self.after_idle(self._flush_table_display)
+        self._dirty_tables.add(table_num)
+
+    def _flush_table_display(self):
+        """Repaint the dirty tables whose status or order state actually changed"""
+        dirty, self._dirty_tables = self._dirty_tables, set()
+        for table_num in sorted(dirty):
+            state = (self.table_status[table_num], bool(self.table_orders[table_num]))
+            if self._last_rendered.get(table_num) == state:
+                continue
+            self._last_rendered[table_num] = state
+            self._render_table(table_num)
+
+    def _render_table(self, table_num):
+        """Apply the current status colors and button states to one table card"""
+        _, btn, icons_frame, header_frame, bill_btn, view_bill_btn, printer_btn = self.table_buttons[table_num - 1]
+        color = self.get_table_color(table_num)
+        btn.configure(style=f"Table.{self.table_status[table_num]}.TButton")
+        header_frame.configure(bg=color)
+        icons_frame.configure(bg=color)
+        
+        # Update header label color
+        for widget in header_frame.winfo_children():
+            if isinstance(widget, tk.Label):
+                widget.configure(bg=color)
+        
+        # Update buttons based on table status
+        order = self.table_orders[table_num]
+        # Disabled colors come from the button styles
+        state = "normal" if order else "disabled"
+        bill_btn.configure(state=state)
+        view_bill_btn.configure(state=state)
+        
+        # Show the printer button only while the table has an order
+        if self.table_status[table_num] in PRINTABLE_TABLE_STATUSES:
+            if not printer_btn.winfo_manager():
+                printer_btn.pack(expand=True, pady=2)
+        else:
+            printer_btn.pack_forget()
 
     def select_table(self, table_num):
         # This method is now replaced by open_table_menu
         self.open_table_menu(table_num)
 
+    def lookup_product(self, pid: int):
+        """Product row by id - from the cached index, or a single-row query while it is stale"""
+        if self._all_products_by_id is not None:
+            return self._all_products_by_id.get(pid)
+        return get_product_by_id(pid, conn=self.conn)
+
     def refresh_table_products(self):
         term = self.var_table_search.get().strip() if hasattr(self, "var_table_search") else ""
-        rows = list_products(term)
+        rows = list_products(term, conn=self.conn)
+        self._table_gallery_stale = False
+        if not term and self._all_products_by_id is None:
+            self._all_products_by_id = {r["id"]: r for r in rows}
         
         # Refresh image gallery only
         self.refresh_table_gallery(rows)
@@ -2917,15 +3224,14 @@ Thank you for using our Professional Billing Software!
             return
         
         # Smaller images for compact card appearance
-        thumb_size = (80, 80)  # Smaller images for compact cards
-        self._table_gallery_images = []
+        self._table_thumb_size = (80, 80)  # Smaller images for compact cards
+        self._table_gallery_cells = []  # (product, image label, card) in display order
         
         # Arrange in a grid: 5 columns for more compact layout
         cols_per_row = 5
-        row = 0
-        col = 0
         
-        for p in products:
+        for idx, p in enumerate(products):
+            row, col = divmod(idx, cols_per_row)
             # Create main card frame with modern styling - smaller fixed size
             card_frame = tk.Frame(
                 self.table_gallery_inner, 
@@ -2940,91 +3246,79 @@ Thank you for using our Professional Billing Software!
             card_frame.grid(row=row, column=col, padx=4, pady=4, sticky="nsew")
             card_frame.grid_propagate(False)
             
-            # Make the entire card clickable (no hover effects)
-            card_frame.bind("<Button-1>", lambda e, pid=p["id"]: self.add_product_id_to_table(pid))
-            
             # Product image container
             img_container = tk.Frame(card_frame, bg="#F8F9FA", height=80)
             img_container.pack(fill=tk.X, padx=2, pady=2)
             img_container.pack_propagate(False)
             
             # Product image
-            img_label = tk.Label(img_container, cursor="hand2", bg="#F8F9FA")
-            img = None
-            if p["image_path"] and os.path.exists(p["image_path"]):
-                try:
-                    pil = Image.open(p["image_path"]).convert("RGB")
-                    pil.thumbnail(thumb_size, Image.Resampling.LANCZOS)
-                    img = ImageTk.PhotoImage(pil)
-                except Exception:
-                    img = None
-            
-            if img is not None:
-                img_label.configure(image=img)
-                img_label.image = img
-                self._table_gallery_images.append(img)
-            else:
-                img_label.configure(text="📷\nNo Image", font=("Segoe UI", 10), fg="#666666")
+            # Placeholder text until the card is scrolled into view and its thumbnail is loaded
+            img_label = tk.Label(img_container, cursor="hand2", bg="#F8F9FA",
+                                 text="📷\nNo Image", font=("Segoe UI", 10), fg="#666666")
+            img_label.image = None
+            self._table_gallery_cells.append((p, img_label, card_frame))
             
             img_label.pack(expand=True)
-            img_label.bind("<Button-1>", lambda e, pid=p["id"]: self.add_product_id_to_table(pid))
             
             # Product details container
             details_frame = tk.Frame(card_frame, bg="#FFFFFF")
             details_frame.pack(fill=tk.BOTH, expand=True, padx=4, pady=2)
             
             # Product name
-            name_label = tk.Label(
+            name_label = ttk.Label(
                 details_frame, 
                 text=p["name"][:12] + "..." if len(p["name"]) > 12 else p["name"],
-                font=("Segoe UI", 9, "bold"),
-                fg="#333333",
-                bg="#FFFFFF",
+                style="Thumb.TLabel",
                 wraplength=120
             )
             name_label.pack(anchor=tk.W, pady=(0, 1))
-            name_label.bind("<Button-1>", lambda e, pid=p["id"]: self.add_product_id_to_table(pid))
             
             # Price
-            price_label = tk.Label(
-                details_frame,
-                text=f"₹{p['price']:.0f}",
-                font=("Segoe UI", 10, "bold"),
-                fg="#2E7D32",
-                bg="#FFFFFF"
-            )
+            price_label = ttk.Label(details_frame, text=f"₹{p['price']:.0f}", style="ThumbPrice.TLabel")
             price_label.pack(anchor=tk.W, pady=(0, 1))
-            price_label.bind("<Button-1>", lambda e, pid=p["id"]: self.add_product_id_to_table(pid))
             
             # Stock information
-            stock_color = "#4CAF50" if p["stock"] > 10 else "#FF9800" if p["stock"] > 0 else "#F44336"
+            stock_style = "ThumbStockOk.TLabel" if p["stock"] > 10 else "ThumbStockLow.TLabel" if p["stock"] > 0 else "ThumbStockOut.TLabel"
             stock_text = f"Stock: {p['stock']}" if p["stock"] > 0 else "Out"
             
-            stock_label = tk.Label(
-                details_frame,
-                text=stock_text,
-                font=("Segoe UI", 8),
-                fg=stock_color,
-                bg="#FFFFFF"
-            )
+            stock_label = ttk.Label(details_frame, text=stock_text, style=stock_style)
             stock_label.pack(anchor=tk.W)
-            stock_label.bind("<Button-1>", lambda e, pid=p["id"]: self.add_product_id_to_table(pid))
             
-            # Make all labels clickable (no hover effects)
-            for widget in [img_container, details_frame, name_label, price_label, stock_label]:
-                widget.bind("<Button-1>", lambda e, pid=p["id"]: self.add_product_id_to_table(pid))
-            
-            # Move to next position
-            col += 1
-            if col >= cols_per_row:
-                col = 0
-                row += 1
+            # Make the entire card clickable (no hover effects) through the ProductCell class binding
+            for widget in (card_frame, img_container, img_label, details_frame, name_label, price_label, stock_label):
+                widget.product_id = p["id"]
+                widget.bindtags(("ProductCell",) + widget.bindtags())
         
         # Configure grid weights to ensure equal sizing
         for i in range(cols_per_row):
             self.table_gallery_inner.columnconfigure(i, weight=1, uniform="card")
-        for i in range(row + 1):
+        rows = -(-len(products) // cols_per_row)
+        for i in range(max(rows, 1)):
             self.table_gallery_inner.rowconfigure(i, weight=1, uniform="card")
+        
+        # Card positions are known once the grid is laid out
+        self.after_idle(self._update_visible_thumbs)
+
+    def _update_visible_thumbs(self):
+        """Load thumbnails for gallery cards in (or near) the viewport and release the rest"""
+        if not self._table_gallery_cells or not self.table_gallery_canvas.winfo_ismapped():
+            return
+        canvas = self.table_gallery_canvas
+        margin = 170  # prefetch about one row above and below the viewport
+        top = canvas.canvasy(0) - margin
+        bottom = canvas.canvasy(canvas.winfo_height()) + margin
+        for product, label, card in self._table_gallery_cells:
+            if not label.winfo_exists():
+                return  # gallery is being rebuilt
+            y = card.winfo_y()
+            if y + card.winfo_height() >= top and y <= bottom:
+                if label.image is None:
+                    label.image = ""  # requested, request_thumbnail fills in the PhotoImage
+                    self.request_thumbnail(product, self._table_thumb_size, label)
+            elif label.image is not None:
+                # Scrolled out of view - show the placeholder again and drop the image reference
+                label.configure(image="")
+                label.image = None
 
     def add_product_id_to_table(self, pid: int):
         """Add product directly from image gallery to table order"""
@@ -3032,11 +3326,10 @@ Thank you for using our Professional Billing Software!
             messagebox.showwarning("No Table Selected", "Please select a table first")
             return
             
-        prod = [r for r in list_products("") if r["id"] == pid]
+        prod = self.lookup_product(pid)
         if not prod:
             messagebox.showerror("Error", "Product not found")
             return
-        prod = prod[0]
         
         if prod["stock"] <= 0:
             messagebox.showwarning("Out of Stock", f"{prod['name']} is out of stock")
@@ -3049,17 +3342,11 @@ Thank you for using our Professional Billing Software!
         """Show a beautiful, modern popup for table product quantity selection"""
         popup = tk.Toplevel(self.master)
         popup.title("Add to Cart")
-        popup.geometry("480x620")
+        popup.geometry(self.centered_geometry(480, 620))
         popup.resizable(False, False)
         popup.transient(self.master)
         popup.grab_set()
 
-        # Center the popup
-        popup.update_idletasks()
-        sw, sh = popup.winfo_screenwidth(), popup.winfo_screenheight()
-        x, y = (sw - 480) // 2, (sh - 620) // 2
-        popup.geometry(f"480x620+{x}+{y}")
-
         # Header bar
         header = tk.Frame(popup, bg="#2c3e50", height=64)
         header.pack(fill=tk.X)
@@ -3072,14 +3359,7 @@ Thank you for using our Professional Billing Software!
 
         # Product image
         img_label = tk.Label(body, bg="#ffffff")
-        img = None
-        if product["image_path"] and os.path.exists(product["image_path"]):
-            try:
-                pil = Image.open(product["image_path"]).convert("RGB")
-                pil.thumbnail((180, 180), Image.Resampling.LANCZOS)
-                img = ImageTk.PhotoImage(pil)
-            except Exception:
-                img = None
+        img = self.get_product_thumbnail(product, (180, 180))
         
         if img is not None:
             img_label.configure(image=img)
@@ -3127,7 +3407,7 @@ Thank you for using our Professional Billing Software!
         total_label.pack(pady=(18, 24))
         
         # Functions
-        def update_total():
+        def update_total(*_):
             qty = qty_var.get()
             total = qty * float(product["price"])
             total_var.set(f"Total: ₹{total:.2f}")
@@ -3135,17 +3415,15 @@ Thank you for using our Professional Billing Software!
         def decrease_qty():
             if qty_var.get() > 1:
                 qty_var.set(qty_var.get() - 1)
-                update_total()
         
         def increase_qty():
             if qty_var.get() < product["stock"]:
                 qty_var.set(qty_var.get() + 1)
-                update_total()
         
-        # Bind buttons
+        # Bind buttons - the trace recomputes the total on every quantity change
         minus_btn.configure(command=decrease_qty)
         plus_btn.configure(command=increase_qty)
-        qty_var.trace("w", lambda *args: update_total())
+        qty_var.trace_add("write", update_total)
         
         # Initial total
         update_total()
@@ -3176,24 +3454,24 @@ Thank you for using our Professional Billing Software!
             
             # Add to table order
             order = self.table_orders[self.current_table]
-            for item in order:
-                if item["product_id"] == product["id"]:
-                    if item["qty"] + qty > product["stock"]:
-                        messagebox.showwarning("Stock Limit", f"Only {product['stock']} units available for {product['name']}")
-                        return
-                    item["qty"] += qty
-                    break
+            item = order.get(product["id"])
+            if item:
+                if item["qty"] + qty > product["stock"]:
+                    messagebox.showwarning("Stock Limit", f"Only {product['stock']} units available for {product['name']}")
+                    return
+                item["qty"] += qty
             else:
-                order.append({
+                order[product["id"]] = {
                     "product_id": product["id"],
                     "name": product["name"],
                     "price": float(product["price"]),
                     "qty": qty,
-                })
+                }
+            self._table_totals.pop(self.current_table, None)
             
             # Update table status to ordering
-            self.table_status[self.current_table] = "ordering"
-            self.update_table_display()
+            self._set_table_status(self.current_table, "ordering")
+            self.mark_table_dirty(self.current_table)
             self.refresh_table_order()
             
             # Show success feedback
@@ -3323,12 +3601,11 @@ Thank you for using our Professional Billing Software!
         customers = list_customers(search_term)
         
         # Clear existing items
-        for item in self.customers_tree.get_children():
-            self.customers_tree.delete(item)
+        self.customers_tree.delete(*self.customers_tree.get_children())
         
         # Add customers with enhanced last order information
         for i, customer in enumerate(customers):
-            tag = "even" if i % 2 == 0 else "odd"
+            tag = _ALT_TAGS[i & 1]
             
             # Get last order details
             last_order_info = self.get_customer_last_order_info(customer["id"])
@@ -3367,7 +3644,7 @@ Thank you for using our Professional Billing Software!
         if order:
             # Format the last order info beautifully
             date_str = order["created_at"][:10]  # YYYY-MM-DD
-            total_str = f"₹{order['total']:.2f}"
+            total_str = money(order['total'])
             items_str = order["items"] or "No items"
             
             # Truncate items if too long
@@ -3409,19 +3686,11 @@ Thank you for using our Professional Billing Software!
         """Show popup to edit customer"""
         popup = tk.Toplevel(self.master)
         popup.title("Edit Customer")
-        popup.geometry("400x500")
+        popup.geometry(self.centered_geometry(400, 500))
         popup.resizable(False, False)
         popup.transient(self.master)
         popup.grab_set()
         
-        # Center the popup
-        popup.update_idletasks()
-        screen_width = popup.winfo_screenwidth()
-        screen_height = popup.winfo_screenheight()
-        x = (screen_width - 400) // 2
-        y = (screen_height - 500) // 2
-        popup.geometry(f"400x500+{x}+{y}")
-        
         popup.configure(bg="white")
         
         # Main container
@@ -3669,22 +3938,21 @@ Thank you for using our Professional Billing Software!
             orders_tree.insert(
                 "",
                 "end",
-                values=(order["id"], order["created_at"][:19], f"₹{order['total']:.2f}"),
+                values=(order["id"], order["created_at"][:19], money(order['total'])),
             )
 
         def load_items_for_selected(event=None):
-            for row in items_tree.get_children():
-                items_tree.delete(row)
+            items_tree.delete(*items_tree.get_children())
             sel = orders_tree.selection()
             if not sel:
                 return
             bill_id = int(orders_tree.item(sel[0])["values"][0])
-            items = get_comprehensive_bill_items(bill_id)
+            items = get_comprehensive_bill_items(bill_id, conn=self.conn)
             for it in items:
                 items_tree.insert(
                     "",
                     "end",
-                    values=(it["name"], it["qty"], f"₹{it['price']:.2f}", f"₹{it['subtotal']:.2f}"),
+                    values=(it["name"], it["qty"], money(it['price']), money(it['subtotal'])),
                 )
 
         orders_tree.bind("<<TreeviewSelect>>", load_items_for_selected)
@@ -3847,7 +4115,7 @@ Thank you for using our Professional Billing Software!
 
         # Add orders to tree
         for i, order in enumerate(orders):
-            tag = "even" if i % 2 == 0 else "odd"
+            tag = _ALT_TAGS[i & 1]
             
             # Format date and time
             datetime_str = order["created_at"]
@@ -3863,7 +4131,7 @@ Thank you for using our Professional Billing Software!
                 order["id"],
                 date_part,
                 time_part,
-                f"₹{order['total']:.2f}",
+                money(order['total']),
                 order["items_count"],
                 items_preview
             ), tags=(tag,))
@@ -3894,15 +4162,8 @@ Thank you for using our Professional Billing Software!
         close_btn.pack(side=tk.LEFT)
 
         # Add hover effects
-        def on_enter(e, color):
-            e.widget.config(bg=color)
-        def on_leave(e, color):
-            e.widget.config(bg=color)
-
-        export_btn.bind("<Enter>", lambda e: on_enter(e, "#d35400"))
-        export_btn.bind("<Leave>", lambda e: on_leave(e, "#e67e22"))
-        close_btn.bind("<Enter>", lambda e: on_enter(e, "#7f8c8d"))
-        close_btn.bind("<Leave>", lambda e: on_leave(e, "#95a5a6"))
+        self.add_hover(export_btn, "#d35400")
+        self.add_hover(close_btn, "#7f8c8d")
 
     def export_customer_orders(self, customer_id, customer_name):
         """Export customer orders to a text file"""
@@ -3964,34 +4225,30 @@ Thank you for using our Professional Billing Software!
         pass
 
     def refresh_table_order(self):
+        # Clear tree in a single call
+        self.table_order_tree.delete(*self.table_order_tree.get_children())
         if self.current_table == 0:
-            # Clear tree and show message
-            for i in self.table_order_tree.get_children():
-                self.table_order_tree.delete(i)
+            # Show message
             self.table_order_tree.insert("", tk.END, values=("No table selected", "", "", ""))
             self.var_table_total.set("0.00")
             return
         
-        # Clear tree
-        for i in self.table_order_tree.get_children():
-            self.table_order_tree.delete(i)
-        
         # Populate with current table's order
         order = self.table_orders[self.current_table]
-        total = 0
+        total, _ = self.get_table_totals(self.current_table)
         
         if not order:
             self.table_order_tree.insert("", tk.END, values=("No items in order", "", "", ""))
         else:
-            for idx, item in enumerate(order):
+            for idx, item in enumerate(order.values()):
                 subtotal = item["price"] * item["qty"]
-                total += subtotal
-                tag = "even" if idx % 2 == 0 else "odd"
-                self.table_order_tree.insert("", tk.END, values=(
+                tag = _ALT_TAGS[idx & 1]
+                # Row iid is the product id so removal can key straight into the order
+                self.table_order_tree.insert("", tk.END, iid=str(item["product_id"]), values=(
                     item["name"], 
-                    f"₹{item['price']:.2f}", 
+                    money(item['price']), 
                     item["qty"], 
-                    f"₹{subtotal:.2f}"
+                    money(subtotal)
                 ), tags=(tag,))
         
         self.var_table_total.set(f"₹{total:.2f}")
@@ -4007,14 +4264,30 @@ Thank you for using our Professional Billing Software!
             messagebox.showwarning("No Selection", "Please select an item to remove")
             return
         
-        item = self.table_order_tree.item(sel[0])
-        name = item["values"][0]
+        if not sel[0].isdigit():
+            return  # placeholder row, nothing to remove
         
         # Remove from table order
-        order = self.table_orders[self.current_table]
-        self.table_orders[self.current_table] = [i for i in order if i["name"] != name]
+        self.table_orders[self.current_table].pop(int(sel[0]), None)
+        self._table_totals.pop(self.current_table, None)
         self.refresh_table_order()
 
+    def _compute_totals(self, table_num):
+        """Order total and item count of a table in a single pass"""
+        total = 0.0
+        qty = 0
+        for item in self.table_orders[table_num].values():
+            total += item["price"] * item["qty"]
+            qty += item["qty"]
+        return total, qty
+
+    def get_table_totals(self, table_num):
+        """Cached (total, item_count) of a table's current order"""
+        totals = self._table_totals.get(table_num)
+        if totals is None:
+            totals = self._table_totals[table_num] = self._compute_totals(table_num)
+        return totals
+
     def remove_from_table_order(self):
         """Legacy method - redirects to remove_selected_table_item"""
         self.remove_selected_table_item()
@@ -4027,11 +4300,12 @@ Thank you for using our Professional Billing Software!
             return
         
         if messagebox.askyesno("Clear Order", f"Clear all items from Table {table_num}?"):
-            self.table_orders[table_num] = []
-            self.table_status[table_num] = "empty"
+            self.table_orders[table_num] = {}
+            self._table_totals.pop(table_num, None)
+            self._set_table_status(table_num, "empty")
             if table_num == self.current_table:
                 self.refresh_table_order()
-            self.update_table_display()
+            self.mark_table_dirty(table_num)
 
     def generate_table_bill_direct(self, table_num):
         """Generate bill directly from table button"""
@@ -4039,203 +4313,157 @@ Thank you for using our Professional Billing Software!
         if not order:
             messagebox.showwarning("Empty Order", f"No items in Table {table_num} order")
             return
+        if table_num in self._bills_in_flight:
+            return  # already generating this table's bill
         
         # Show confirmation with order summary
-        total = sum(item["price"] * item["qty"] for item in order)
-        item_count = sum(item["qty"] for item in order)
+        total, item_count = self.get_table_totals(table_num)
         
-        confirm_msg = f"Generate bill for Table {table_num}?\n\n"
-        confirm_msg += f"Items: {item_count}\n"
-        confirm_msg += f"Total: ₹{total:.2f}\n\n"
-        confirm_msg += "This will create an invoice and clear the table order."
+        confirm_msg = _BILL_CONFIRM_TMPL.format(table=table_num, items=item_count, total=total)
         
         if not messagebox.askyesno("Confirm Bill Generation", confirm_msg):
             return
         
+        # Show loading message
+        loading_label = ttk.Label(self.tables_tab, text="Generating bill...", 
+                                font=("Segoe UI", 10, "bold"), foreground="blue")
+        loading_label.place(relx=0.5, rely=0.5, anchor="center")
+        
+        logger.debug("generate_table_bill_direct - Order for table %s: %s", table_num, order)
+        self._bills_in_flight.add(table_num)
+        # Detach the order so the worker owns these items - anything added meanwhile starts a new order
+        self.table_orders[table_num] = {}
+        self._table_totals.pop(table_num, None)
+        if self.current_table == table_num:
+            self.refresh_table_order()
+        fut = self._bill_pool.submit(self._create_table_bill, list(order.values()))
+        self.after(50, lambda: self._poll_bill(fut, table_num, order, item_count, loading_label))
+
+    @staticmethod
+    def _create_table_bill(items):
+        # Runs on a worker thread - DB and file IO only, no Tk calls
+        bill_id, total = create_bill(items)
+        # The bill is committed from here on - an invoice failure must not look like a failed bill
         try:
-            # Show loading message
-            loading_label = ttk.Label(self.tables_tab, text="Generating bill...", 
-                                    font=("Segoe UI", 10, "bold"), foreground="blue")
-            loading_label.place(relx=0.5, rely=0.5, anchor="center")
-            self.update()
-            
-            print(f"DEBUG: generate_table_bill_direct - Order for table {table_num}: {order}")
-            bill_id, total = create_bill(order)
             path = save_invoice_text(bill_id)
-            
-            # Remove loading message
-            loading_label.destroy()
-            
-            # Clear table after billing - reset to empty state
-            self.table_status[table_num] = "empty"
-            self.table_orders[table_num] = []
-            
-            # Update current table if it's the same
+        except Exception as e:
+            logger.error("Failed to write invoice for bill %s: %s", bill_id, e)
+            path = e
+        return bill_id, total, path
+
+    def _poll_bill(self, fut, table_num, billed, item_count, loading_label):
+        """Finish a table bill on the Tk thread once its worker is done"""
+        if not fut.done():
+            self.after(50, lambda: self._poll_bill(fut, table_num, billed, item_count, loading_label))
+            return
+        self._bills_in_flight.discard(table_num)
+        # Remove loading message
+        loading_label.destroy()
+        try:
+            bill_id, total, path = fut.result()
+        except Exception as e:
+            # create_bill itself failed, so nothing was billed - put the detached items back
+            # alongside anything added meanwhile
+            order = self.table_orders[table_num]
+            for product_id, item in billed.items():
+                if product_id in order:
+                    order[product_id]["qty"] += item["qty"]
+                else:
+                    order[product_id] = item
+            if self.table_status[table_num] == "empty":
+                self._set_table_status(table_num, "ordering")
+            self._table_totals.pop(table_num, None)
             if self.current_table == table_num:
                 self.refresh_table_order()
-            
-            self.update_table_display()
-            self.update_active_orders_count()
-            self.refresh_products()  # stock changed
-            self.refresh_billing_products()
-            # Also refresh the tables menu product gallery to reflect new stock immediately
-            try:
-                self.refresh_table_products()
-            except Exception:
-                pass
-            self.refresh_reports()
-            
-            if path:
-                # Success message
-                success_msg = f"✅ Bill Generated Successfully!\n\n"
-                success_msg += f"Bill ID: {bill_id}\n"
-                success_msg += f"Table: {table_num}\n"
-                success_msg += f"Total: ₹{total:.2f}\n"
-                success_msg += f"Items: {item_count}\n\n"
-                success_msg += f"Invoice saved to:\n{path}"
-                
-                messagebox.showinfo("Bill Generated", success_msg)
-                self.show_invoice_preview(bill_id, path)
-                self.show_success_feedback(f"Table {table_num} bill generated!")
-            else:
-                messagebox.showinfo("Done", f"Table {table_num} bill #{bill_id} saved.")
-        except Exception as e:
-            # Remove loading message if it exists
-            try:
-                loading_label.destroy()
-            except:
-                pass
+            self.mark_table_dirty(table_num)
             messagebox.showerror("Error", f"Failed to create bill:\n{str(e)}")
-
-    def generate_table_bill(self):
-        if self.current_table == 0:
-            messagebox.showwarning("No Table Selected", "Please select a table first")
             return
         
-        order = self.table_orders[self.current_table]
-        if not order:
-            messagebox.showwarning("Empty Order", f"No items in Table {self.current_table} order")
-            return
-        
-        # Show confirmation with order summary
-        total = sum(item["price"] * item["qty"] for item in order)
-        item_count = sum(item["qty"] for item in order)
-        
-        confirm_msg = f"Generate bill for Table {self.current_table}?\n\n"
-        confirm_msg += f"Items: {item_count}\n"
-        confirm_msg += f"Total: ₹{total:.2f}\n\n"
-        confirm_msg += "This will create an invoice and clear the table order."
-        
-        if not messagebox.askyesno("Confirm Bill Generation", confirm_msg):
-            return
+        # The billed items were detached already - the table is free unless a new order was started
+        if not self.table_orders[table_num]:
+            self._set_table_status(table_num, "empty")
+        self._table_totals.pop(table_num, None)
         
-        try:
-            # Show loading message
-            loading_label = ttk.Label(self.tables_tab, text="Generating bill...", 
-                                    font=("Segoe UI", 10, "bold"), foreground="blue")
-            loading_label.place(relx=0.5, rely=0.5, anchor="center")
-            self.update()
-            
-            print(f"DEBUG: generate_table_bill - Order for table {self.current_table}: {order}")
-            bill_id, total = create_bill(order)
-            path = save_invoice_text(bill_id)
-            
-            # Remove loading message
-            loading_label.destroy()
-            
-            # Clear table after billing - reset to empty state
-            self.table_status[self.current_table] = "empty"
-            self.table_orders[self.current_table] = []
+        # Update current table if it's the same
+        if self.current_table == table_num:
             self.refresh_table_order()
-            self.update_table_display()
-            self.update_active_orders_count()
-            self.refresh_products()  # stock changed
-            self.refresh_billing_products()
-            # Also refresh the tables menu product gallery to reflect new stock immediately
-            try:
-                self.refresh_table_products()
-            except Exception:
-                pass
-            self.refresh_reports()
+        
+        self.mark_table_dirty(table_num)
+        self.update_active_orders_count()
+        # Stock changed - rebuild what is on screen now, the other tabs when they are opened
+        self.mark_stale("products", "billing", "tables", "reports")
+        
+        if isinstance(path, Exception):
+            messagebox.showwarning("Invoice Not Saved",
+                                   f"Table {table_num} bill #{bill_id} was saved, but its invoice file "
+                                   f"could not be written:\n{path}")
+        elif path:
+            # Success message
+            success_msg = _BILL_SUCCESS_TMPL.format(bill_id=bill_id, table=table_num, total=total,
+                                                    items=item_count, path=path)
             
-            if path:
-                # Success message
-                success_msg = f"✅ Bill Generated Successfully!\n\n"
-                success_msg += f"Bill ID: {bill_id}\n"
-                success_msg += f"Table: {self.current_table}\n"
-                success_msg += f"Total: ₹{total:.2f}\n"
-                success_msg += f"Items: {item_count}\n\n"
-                success_msg += f"Invoice saved to:\n{path}"
-                
-                messagebox.showinfo("Bill Generated", success_msg)
-                self.show_invoice_preview(bill_id, path)
-                self.show_success_feedback(f"Table {self.current_table} bill generated!")
-            else:
-                messagebox.showinfo("Done", f"Table {self.current_table} bill #{bill_id} saved.")
-        except Exception as e:
-            # Remove loading message if it exists
-            try:
-                loading_label.destroy()
-            except:
-                pass
-            messagebox.showerror("Error", f"Failed to create bill:\n{str(e)}")
+            messagebox.showinfo("Bill Generated", success_msg)
+            self.show_invoice_preview(bill_id, path)
+            self.show_success_feedback(f"Table {table_num} bill generated!")
+        else:
+            messagebox.showinfo("Done", f"Table {table_num} bill #{bill_id} saved.")
+
+    def generate_table_bill(self):
+        if self.current_table == 0:
+            messagebox.showwarning("No Table Selected", "Please select a table first")
+            return
+        self.generate_table_bill_direct(self.current_table)
 
     def print_table_order(self, table_num):
         """Print table order (kitchen order)"""
-        order = self.table_orders.get(table_num, [])
+        order = self.table_orders.get(table_num, {})
         if not order:
             messagebox.showwarning("Empty Order", f"Table {table_num} has no items to print")
             return
         
-        # Create kitchen order text
-        lines = []
-        lines.append(f"=== KITCHEN ORDER - TABLE {table_num} ===")
-        lines.append(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
-        lines.append("Items:")
-        for item in order:
-            lines.append(f"- {item['name']} x {item['qty']}")
-        lines.append("")
-        lines.append("=== END ORDER ===")
-        
-        # Save to file
+        # Create kitchen order text and save to file
+        body = "\n".join(f"- {item['name']} x {item['qty']}" for item in order.values())
+        text = _KITCHEN_TMPL.format(table=table_num, ts=datetime.now().strftime('%Y-%m-%d %H:%M:%S'), body=body)
         kitchen_file = os.path.join(INVOICE_DIR, f"kitchen-order-table-{table_num}.txt")
-        with open(kitchen_file, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-        
-        # Print if possible
-        try:
-            if hasattr(os, "startfile"):
-                os.startfile(kitchen_file, "print")
-                messagebox.showinfo("Printed", f"Kitchen order for Table {table_num} sent to printer")
-            else:
-                messagebox.showinfo("Saved", f"Kitchen order saved to {kitchen_file}")
-        except Exception as e:
+        Path(kitchen_file).write_text(text, encoding="utf-8")
+        
+        # Print if possible - handing the file to the print spooler can take a while, keep it off the UI thread
+        if hasattr(os, "startfile"):
+            def on_error(e):
+                logger.error("Error printing %s: %s", kitchen_file, e)
+                messagebox.showerror("Print Failed", f"Could not print kitchen order for Table {table_num}:\n{e}\n\n"
+                                                     f"It was saved to {kitchen_file}")
+            self.run_in_background(
+                lambda: self._start_print_job(kitchen_file),
+                lambda _: messagebox.showinfo("Printed", f"Kitchen order for Table {table_num} sent to printer"),
+                on_error)
+        else:
             messagebox.showinfo("Saved", f"Kitchen order saved to {kitchen_file}")
 
+    @staticmethod
+    def _start_print_job(path: str):
+        # Runs on a worker thread - no Tk calls here, failures are reported through run_in_background
+        os.startfile(path, "print")
+
     def view_table_order(self, table_num):
         """View table order details"""
-        order = self.table_orders.get(table_num, [])
+        order = self.table_orders.get(table_num, {})
         if not order:
             messagebox.showinfo("Empty Order", f"Table {table_num} has no items")
             return
         
         # Create order summary
-        total = sum(item["price"] * item["qty"] for item in order)
-        lines = []
-        lines.append(f"Table {table_num} Order Summary")
-        lines.append("=" * 30)
-        for item in order:
-            subtotal = item["price"] * item["qty"]
-            lines.append(f"{item['name']} x {item['qty']} = ₹{subtotal:.2f}")
-        lines.append("-" * 30)
-        lines.append(f"Total: ₹{total:.2f}")
+        total, _ = self.get_table_totals(table_num)
+        body = "\n".join(f"{item['name']} x {item['qty']} = ₹{item['price'] * item['qty']:.2f}"
+                         for item in order.values())
+        summary = _ORDER_SUMMARY_TMPL.format(table=table_num, rule="=" * 30, body=body,
+                                             thin_rule="-" * 30, total=total)
         
-        messagebox.showinfo(f"Table {table_num} Order", "\n".join(lines))
+        messagebox.showinfo(f"Table {table_num} Order", summary)
 
     def view_table_bill_direct(self, table_num):
         """View table bill directly from table button"""
-        order = self.table_orders.get(table_num, [])
+        order = self.table_orders.get(table_num, {})
         if not order:
             messagebox.showinfo(f"Table {table_num}", "No items in order")
             return
@@ -4275,12 +4503,12 @@ Thank you for using our Professional Billing Software!
         
         # Add items to tree
         total = 0
-        for idx, item in enumerate(order):
+        for idx, item in enumerate(order.values()):
             subtotal = item["price"] * item["qty"]
             total += subtotal
-            tag = "even" if idx % 2 == 0 else "odd"
+            tag = _ALT_TAGS[idx & 1]
             tree.insert("", tk.END, text=item["name"], 
-                       values=(item["qty"], f"₹{item['price']:.2f}", f"₹{subtotal:.2f}"), 
+                       values=(item["qty"], money(item['price']), money(subtotal)), 
                        tags=(tag,))
         
         tree.tag_configure("even", background="#f5f7fb")
@@ -4311,7 +4539,7 @@ Thank you for using our Professional Billing Software!
                   command=lambda: [self.generate_table_bill_direct(table_num), view_window.destroy()]).pack(side=tk.RIGHT, padx=5)
 
     def refresh_tables(self):
-        if hasattr(self, 'refresh_table_products'):
+        if self._menu_built:
             self.refresh_table_products()
 
     def show_success_feedback(self, message: str):
@@ -4325,11 +4553,16 @@ Thank you for using our Professional Billing Software!
         # Remove after 2 seconds
         self.after(2000, feedback_label.destroy)
 
+    def _set_table_status(self, table_num, status):
+        """Change a table's status, keeping the active orders count in step"""
+        old = self.table_status[table_num]
+        self._active_count += (status in ACTIVE_TABLE_STATUSES) - (old in ACTIVE_TABLE_STATUSES)
+        self.table_status[table_num] = status
+
     def update_active_orders_count(self):
         """Update the active orders count in the header"""
         if hasattr(self, 'var_active_orders'):
-            active_count = sum(1 for status in self.table_status.values() if status in ["ordering", "ready"])
-            self.var_active_orders.set(f"Active: {active_count}")
+            self.var_active_orders.set(f"Active: {self._active_count}")
 
     # Reports Tab
     def build_reports_tab(self):
@@ -4439,7 +4672,7 @@ Thank you for using our Professional Billing Software!
         header_frame = ttk.Frame(self.all_bills_tab)
         header_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        ttk.Button(header_frame, text="🔄 Refresh All", command=self.refresh_reports).pack(side=tk.LEFT, padx=5)
+        ttk.Button(header_frame, text="🔄 Refresh All", command=lambda: self.refresh_reports(force=True)).pack(side=tk.LEFT, padx=5)
         ttk.Button(header_frame, text="📤 Export CSV", command=self.export_bills_csv).pack(side=tk.LEFT, padx=5)
         
         # Summary stats
@@ -4472,10 +4705,19 @@ Thank you for using our Professional Billing Software!
         for col, text in [("id", "Bill #"), ("created", "Date & Time"), ("customer", "Customer"), ("total", "Total ₹"), ("items", "Items"), ("qty", "Qty")]:
             self.bills_tree.heading(col, text=text)
             self.bills_tree.column(col, width=120)
-        self.bills_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        # The tree only holds the rows in view; this scrollbar moves the window over self._all_bills
+        self.bills_scroll = ttk.Scrollbar(bills_frame, orient=tk.VERTICAL, command=self.on_bills_scroll)
+        self.bills_scroll.pack(side=tk.RIGHT, fill=tk.Y, pady=5)
+        self.bills_tree.pack(fill=tk.BOTH, expand=True, padx=(10, 0), pady=5)
         self.bills_tree.tag_configure("even", background="#f5f7fb")
         self.bills_tree.tag_configure("odd", background="#ffffff")
         self.bills_tree.bind("<<TreeviewSelect>>", self.on_select_bill)
+        self.bills_tree.bind("<MouseWheel>", lambda e: self.scroll_bills(-1 if e.delta > 0 else 1))
+        self.bills_tree.bind("<Button-4>", lambda e: self.scroll_bills(-1))
+        self.bills_tree.bind("<Button-5>", lambda e: self.scroll_bills(1))
+        self.bills_tree.bind("<Configure>", lambda e: self.debounce("bills_window", self.render_bills_window, 30))
+        self._all_bills = []
+        self._bills_offset = 0
 
         # Right side - Bill items details
         items_frame = ttk.LabelFrame(bills_items_frame, text="🧾 Bill Items - Complete Details")
@@ -4498,62 +4740,117 @@ Thank you for using our Professional Billing Software!
         self.refresh_reports()
 
 
-    def refresh_reports(self):
+    def get_bill_items_cached(self, bill_id: int):
+        """Items of a bill, fetched once per bill until the reports are refreshed"""
+        rows = self._items_cache.get(bill_id)
+        if rows is None:
+            rows = self._items_cache[bill_id] = get_comprehensive_bill_items(bill_id, conn=self.conn)
+        return rows
+
+    def get_all_bills_cached(self):
+        """(all bills, their revenue), re-queried at most every BILLS_CACHE_TTL seconds"""
+        now = time.monotonic()
+        if self._bills_cache is None or now - self._bills_cache[0] > BILLS_CACHE_TTL:
+            # One pass over the cursor collects the rows for the bills window and sums the revenue
+            bills = []
+            revenue = 0.0
+            for bill in iter_all_bills(conn=self.conn):
+                bills.append(bill)
+                revenue += bill["total"]
+            self._bills_cache = (now, bills, revenue)
+        return self._bills_cache[1:]
+
+    def refresh_reports(self, force: bool = False):
+        self._items_cache.clear()  # current stock shown with the items may have changed
+        # Nothing to rebuild if no bill was added or removed since the last fill
+        signature = get_bills_signature(conn=self.conn)
+        if not force and signature == self._bills_signature:
+            return
+        self._bills_signature = signature
+        self._bills_cache = None  # forced or bills changed - cached rows may be stale
         # Clear existing data
-        for i in self.bills_tree.get_children():
-            self.bills_tree.delete(i)
-        for i in self.bill_items_tree.get_children():
-            self.bill_items_tree.delete(i)
+        self.bills_tree.delete(*self.bills_tree.get_children())
+        self.bill_items_tree.delete(*self.bill_items_tree.get_children())
         
         # Get all bills with comprehensive details
-        bills = get_all_bills()
-        total_revenue = 0
+        bills, total_revenue = self.get_all_bills_cached()
+        
+        logger.debug("Found %d bills in database", len(bills))
         
-        print(f"Found {len(bills)} bills in database")  # Debug print
+        self._all_bills = bills
+        self._bills_offset = 0
+        self.render_bills_window()
         
+        # Update summary stats
+        self.var_total_bills.set(f"Total Bills: {len(bills)}")
+        self.var_total_revenue.set(f"Revenue: ₹{total_revenue:.2f}")
+
+    def _visible_bill_rows(self):
+        rowheight = ttk.Style().lookup("Treeview", "rowheight")
+        rowheight = int(rowheight) if rowheight else 20
+        # Counting the heading as a row leaves room for a partly visible last row
+        return max(1, self.bills_tree.winfo_height() // rowheight)
+
+    def render_bills_window(self):
+        """Show only the bills that fit in the tree, starting at self._bills_offset"""
+        bills = self._all_bills
+        selected = self.bills_tree.selection()
+        self.bills_tree.delete(*self.bills_tree.get_children())
         if not bills:
             # Show a message if no bills found
             self.bills_tree.insert("", tk.END, values=(
                 "No bills", "No bills found in database", "", "", "", ""
             ))
+            self.bills_scroll.set(0, 1)
+            return
         
-        for idx, bill in enumerate(bills):
-            tag = "even" if idx % 2 == 0 else "odd"
-            # Format date and time properly
-            date_time = bill["created_at"]
-            if " " in date_time:
-                date_part, time_part = date_time.split(" ", 1)
-                # Format date as DD-MM-YYYY and time as HH:MM
-                try:
-                    dt = datetime.strptime(date_time, "%Y-%m-%d %H:%M:%S")
-                    formatted_time = dt.strftime("%d-%m-%Y %H:%M")
-                except:
-                    formatted_time = f"{date_part} {time_part}"
-            else:
-                formatted_time = date_time
+        count = self._visible_bill_rows()
+        self._bills_offset = max(0, min(self._bills_offset, len(bills) - count))
+        start = self._bills_offset
+        for idx in range(start, min(start + count, len(bills))):
+            # Positional unpack in iter_all_bills column order - cheaper than Row lookups by name
+            bill_id, created_at, total, _, customer_name, customer_mobile, item_count, total_qty = bills[idx]
+            tag = _ALT_TAGS[idx & 1]
+            # Format date as DD-MM-YYYY and time as HH:MM
+            formatted_time = _fmt_dt(created_at)
             
-            # Get customer info (sqlite3.Row doesn't support .get)
+            # Get customer info
             customer_info = ""
-            if bill["customer_name"]:
-                customer_info = f"{bill['customer_name']}"
-                if bill["customer_mobile"]:
-                    customer_info += f" ({bill['customer_mobile']})"
+            if customer_name:
+                customer_info = f"{customer_name}"
+                if customer_mobile:
+                    customer_info += f" ({customer_mobile})"
             else:
                 customer_info = "Walk-in Customer"
                 
-            self.bills_tree.insert("", tk.END, values=(
-                bill["id"], 
+            self.bills_tree.insert("", tk.END, iid=str(bill_id), values=(
+                bill_id, 
                 formatted_time, 
                 customer_info,
-                f"₹{bill['total']:.2f}",
-                bill["item_count"],
-                bill["total_qty"]
+                money(total),
+                item_count,
+                total_qty
             ), tags=(tag,))
-            total_revenue += bill["total"]
         
-        # Update summary stats
-        self.var_total_bills.set(f"Total Bills: {len(bills)}")
-        self.var_total_revenue.set(f"Revenue: ₹{total_revenue:.2f}")
+        # Keep the selected bill highlighted while it stays in view
+        if selected and self.bills_tree.exists(selected[0]):
+            self.bills_tree.selection_set(selected[0])
+        self.bills_scroll.set(start / len(bills), min(1.0, (start + count) / len(bills)))
+
+    def scroll_bills(self, rows: int):
+        self._bills_offset += rows
+        self.render_bills_window()
+        return "break"  # the tree itself has nothing more to scroll
+
+    def on_bills_scroll(self, action, value, unit=None):
+        """Scrollbar command: moveto FRACTION or scroll N units|pages"""
+        if action == "moveto":
+            self._bills_offset = int(float(value) * len(self._all_bills))
+        elif unit == "pages":
+            self._bills_offset += int(value) * self._visible_bill_rows()
+        else:
+            self._bills_offset += int(value)
+        self.render_bills_window()
 
     def refresh_daily_sales(self):
         date_str = self.var_sales_date.get().strip()
@@ -4566,30 +4863,12 @@ Thank you for using our Professional Billing Software!
             messagebox.showerror("Invalid Date", "Please use YYYY-MM-DD format")
             return
         
-        bills = get_daily_sales(date_str)
+        self._items_cache.clear()
+        # Bills with their item counts and quantities in a single query
+        bills = get_daily_sales_with_counts(date_str, conn=self.conn)
         total_sales = sum(bill["total"] for bill in bills)
         avg_bill = total_sales / len(bills) if bills else 0
-        
-        # Get comprehensive bill data
-        comprehensive_bills = []
-        total_items = 0
-        for bill in bills:
-            # Get item count and total quantity for each bill
-            conn = get_conn()
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT COUNT(*) as item_count, SUM(qty) as total_qty 
-                FROM bill_items WHERE bill_id = ?
-            """, (bill["id"],))
-            result = cur.fetchone()
-            conn.close()
-            
-            comprehensive_bills.append({
-                **bill,
-                "item_count": result["item_count"] or 0,
-                "total_qty": result["total_qty"] or 0
-            })
-            total_items += result["total_qty"] or 0
+        total_items = sum(bill["total_qty"] for bill in bills)
         
         # Update summary stats
         self.var_daily_count.set(str(len(bills)))
@@ -4598,31 +4877,15 @@ Thank you for using our Professional Billing Software!
         self.var_daily_items.set(str(total_items))
         
         # Clear and populate daily bills with comprehensive details
-        for i in self.daily_bills_tree.get_children():
-            self.daily_bills_tree.delete(i)
-        for idx, bill in enumerate(comprehensive_bills):
-            # Format time properly
-            date_time = bill["created_at"]
-            if " " in date_time:
-                try:
-                    dt = datetime.strptime(date_time, "%Y-%m-%d %H:%M:%S")
-                    time_str = dt.strftime("%H:%M")
-                except:
-                    time_str = date_time.split(" ")[1] if " " in date_time else date_time
-            else:
-                time_str = date_time
-            tag = "even" if idx % 2 == 0 else "odd"
-            self.daily_bills_tree.insert("", tk.END, values=(
-                bill["id"], 
-                time_str, 
-                f"₹{bill['total']:.2f}",
-                bill["item_count"],
-                bill["total_qty"]
-            ), tags=(tag,))
+        self.daily_bills_tree.delete(*self.daily_bills_tree.get_children())
+        # Format every row first, then hand them all to Tcl at once; Tk redraws the tree once
+        # when control returns to the event loop
+        rows = [((bill_id, _fmt_time(created_at), money(total), item_count, total_qty), (_ALT_TAGS[idx & 1],))
+                for idx, (bill_id, created_at, total, item_count, total_qty) in enumerate(bills)]
+        self.bulk_insert(self.daily_bills_tree, rows)
         
         # Clear bill items
-        for i in self.daily_bill_items_tree.get_children():
-            self.daily_bill_items_tree.delete(i)
+        self.daily_bill_items_tree.delete(*self.daily_bill_items_tree.get_children())
 
     def on_select_daily_bill(self, event=None):
         sel = self.daily_bills_tree.selection()
@@ -4633,23 +4896,23 @@ Thank you for using our Professional Billing Software!
             bill_id = int(self.daily_bills_tree.item(sel[0])["values"][0])
             
             # Get comprehensive bill items
-            rows = get_comprehensive_bill_items(bill_id)
+            rows = self.get_bill_items_cached(bill_id)
             
             # Clear existing items
-            for i in self.daily_bill_items_tree.get_children():
-                self.daily_bill_items_tree.delete(i)
+            self.daily_bill_items_tree.delete(*self.daily_bill_items_tree.get_children())
             
             # Add comprehensive details
             if rows:
-                for idx, r in enumerate(rows):
-                    tag = "even" if idx % 2 == 0 else "odd"
+                # Positional unpack in get_comprehensive_bill_items column order
+                for idx, (_, qty, price, subtotal, product_id, name, current_stock, _) in enumerate(rows):
+                    tag = _ALT_TAGS[idx & 1]
                     self.daily_bill_items_tree.insert("", tk.END, values=(
-                        r["product_id"],
-                        r["name"], 
-                        r["qty"], 
-                        f"₹{r['price']:.2f}", 
-                        f"₹{r['subtotal']:.2f}",
-                        r["current_stock"]
+                        product_id,
+                        name, 
+                        qty, 
+                        money(price), 
+                        money(subtotal),
+                        current_stock
                     ), tags=(tag,))
             else:
                 # Show a message if no items found
@@ -4660,8 +4923,7 @@ Thank you for using our Professional Billing Software!
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load bill items: {e}")
             # Also clear the items tree on error
-            for i in self.daily_bill_items_tree.get_children():
-                self.daily_bill_items_tree.delete(i)
+            self.daily_bill_items_tree.delete(*self.daily_bill_items_tree.get_children())
 
     def on_select_bill(self, event=None):
         sel = self.bills_tree.selection()
@@ -4670,28 +4932,28 @@ Thank you for using our Professional Billing Software!
         bill_id = int(self.bills_tree.item(sel[0])["values"][0])
         
         # Get comprehensive bill items
-        rows = get_comprehensive_bill_items(bill_id)
+        rows = self.get_bill_items_cached(bill_id)
         
         # Clear existing items
-        for i in self.bill_items_tree.get_children():
-            self.bill_items_tree.delete(i)
+        self.bill_items_tree.delete(*self.bill_items_tree.get_children())
         
         # Add comprehensive details
-        for idx, r in enumerate(rows):
-            tag = "even" if idx % 2 == 0 else "odd"
+        # Positional unpack in get_comprehensive_bill_items column order
+        for idx, (_, qty, price, subtotal, product_id, name, current_stock, _) in enumerate(rows):
+            tag = _ALT_TAGS[idx & 1]
             self.bill_items_tree.insert("", tk.END, values=(
-                r["product_id"],
-                r["name"], 
-                r["qty"], 
-                f"₹{r['price']:.2f}", 
-                f"₹{r['subtotal']:.2f}",
-                r["current_stock"]
+                product_id,
+                name, 
+                qty, 
+                money(price), 
+                money(subtotal),
+                current_stock
             ), tags=(tag,))
 
     def show_analytics(self):
         """Show comprehensive sales analytics"""
         try:
-            summary, top_products, daily_trend = get_sales_analytics()
+            summary, top_products, daily_trend = get_sales_analytics(conn=self.conn)
             
             # Create analytics window
             analytics_window = tk.Toplevel(self.master)
@@ -4729,18 +4991,15 @@ Last Sale: {summary['last_sale']}
             products_tree.column("sold", width=100)
             products_tree.column("revenue", width=150)
             products_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-            
-            for idx, product in enumerate(top_products):
-                tag = "even" if idx % 2 == 0 else "odd"
-                products_tree.insert("", tk.END, values=(
-                    product["name"],
-                    f"{product['total_sold']:,}",
-                    f"₹{product['total_revenue']:.2f}"
-                ), tags=(tag,))
-            
+            # Tag styles exist before any row uses them
             products_tree.tag_configure("even", background="#f5f7fb")
             products_tree.tag_configure("odd", background="#ffffff")
             
+            rows = [((product["name"], f"{product['total_sold']:,}", money(product['total_revenue'])),
+                     (_ALT_TAGS[idx & 1],))
+                    for idx, product in enumerate(top_products)]
+            self.bulk_insert(products_tree, rows)
+            
             # Close button
             ttk.Button(main_frame, text="Close", command=analytics_window.destroy).pack(pady=10)
             
@@ -4750,7 +5009,7 @@ Last Sale: {summary['last_sale']}
     def export_bills_csv(self):
         """Export all bills to CSV file"""
         try:
-            bills = get_all_bills()
+            bills, _ = self.get_all_bills_cached()
             if not bills:
                 messagebox.showwarning("No Data", "No bills found to export")
                 return
@@ -4762,24 +5021,27 @@ Last Sale: {summary['last_sale']}
             )
             
             if filename:
-                with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(['Bill ID', 'Date & Time', 'Total ₹', 'Item Count', 'Total Quantity'])
-                    
-                    for bill in bills:
-                        writer.writerow([
-                            bill['id'],
-                            bill['created_at'],
-                            f"{bill['total']:.2f}",
-                            bill['item_count'],
-                            bill['total_qty']
-                        ])
-                
-                messagebox.showinfo("Success", f"Exported {len(bills)} bills to {filename}")
+                # Write on the IO worker so the window stays responsive for large exports
+                self.run_in_background(
+                    lambda: self._write_bills_csv(filename, bills),
+                    lambda _: messagebox.showinfo("Success", f"Exported {len(bills)} bills to {filename}"),
+                    lambda e: messagebox.showerror("Error", f"Failed to export: {str(e)}"),
+                )
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export: {str(e)}")
 
+    @staticmethod
+    def _write_bills_csv(filename, bills):
+        # Runs on the IO worker - no Tk calls here
+        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['Bill ID', 'Date & Time', 'Total ₹', 'Item Count', 'Total Quantity'])
+            writer.writerows(
+                (bill['id'], bill['created_at'], f"{bill['total']:.2f}", bill['item_count'], bill['total_qty'])
+                for bill in bills
+            )
+
     def export_daily_csv(self):
         """Export daily sales to CSV file"""
         try:
@@ -4788,7 +5050,7 @@ Last Sale: {summary['last_sale']}
                 messagebox.showwarning("No Date", "Please select a date first")
                 return
                 
-            bills = get_daily_sales(date_str)
+            bills = get_daily_sales_with_counts(date_str, conn=self.conn)
             if not bills:
                 messagebox.showwarning("No Data", f"No sales found for {date_str}")
                 return
@@ -4800,36 +5062,28 @@ Last Sale: {summary['last_sale']}
             )
             
             if filename:
-                with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.writer(csvfile)
-                    writer.writerow(['Date', 'Bill ID', 'Time', 'Total ₹', 'Item Count', 'Total Quantity'])
-                    
-                    for bill in bills:
-                        time_str = bill["created_at"].split(" ")[1] if " " in bill["created_at"] else bill["created_at"]
-                        # Get item count and total quantity
-                        conn = get_conn()
-                        cur = conn.cursor()
-                        cur.execute("""
-                            SELECT COUNT(*) as item_count, SUM(qty) as total_qty 
-                            FROM bill_items WHERE bill_id = ?
-                        """, (bill["id"],))
-                        result = cur.fetchone()
-                        conn.close()
-                        
-                        writer.writerow([
-                            date_str,
-                            bill['id'],
-                            time_str,
-                            f"{bill['total']:.2f}",
-                            result["item_count"] or 0,
-                            result["total_qty"] or 0
-                        ])
-                
-                messagebox.showinfo("Success", f"Exported {len(bills)} bills for {date_str} to {filename}")
+                # Write on the IO worker so the window stays responsive for large exports
+                self.run_in_background(
+                    lambda: self._write_daily_csv(filename, date_str, bills),
+                    lambda _: messagebox.showinfo("Success", f"Exported {len(bills)} bills for {date_str} to {filename}"),
+                    lambda e: messagebox.showerror("Error", f"Failed to export daily sales: {str(e)}"),
+                )
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export daily sales: {str(e)}")
 
+    @staticmethod
+    def _write_daily_csv(filename, date_str, bills):
+        # Runs on the IO worker - no Tk calls here
+        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(['Date', 'Bill ID', 'Time', 'Total ₹', 'Item Count', 'Total Quantity'])
+            writer.writerows(
+                (date_str, bill['id'], bill["created_at"].split(" ")[1] if " " in bill["created_at"] else bill["created_at"],
+                 f"{bill['total']:.2f}", bill["item_count"], bill["total_qty"])
+                for bill in bills
+            )
+
     # Backup / Restore handlers
     def on_backup(self):
         default = os.path.join(BACKUP_DIR, f"products-backup-{datetime.now().strftime('%Y%m%d-%H%M%S')}.csv")
@@ -4856,8 +5110,7 @@ Last Sale: {summary['last_sale']}
             return
         try:
             count = restore_products_csv(path)
-            self.refresh_products()
-            self.refresh_billing_products()
+            self.mark_stale("products", "billing")
             messagebox.showinfo("Restore", f"Added {count} products from file")
         except Exception as e:
             messagebox.showerror("Error", str(e))
@@ -4869,32 +5122,27 @@ def fix_data_mismatch():
     cur = conn.cursor()
     
     try:
-        # Get all product IDs that exist in products table
-        cur.execute("SELECT id FROM products ORDER BY id")
-        existing_product_ids = [row[0] for row in cur.fetchall()]
-        print(f"Existing product IDs: {existing_product_ids}")
-        
-        if not existing_product_ids:
-            print("No products found, cannot check data mismatch")
-            return
-        
-        # Get all unique product_ids referenced in bill_items
-        cur.execute("SELECT DISTINCT product_id FROM bill_items ORDER BY product_id")
-        referenced_product_ids = [row[0] for row in cur.fetchall()]
-        print(f"Referenced product IDs in bill_items: {referenced_product_ids}")
-        
-        # Find missing product IDs
-        missing_product_ids = [pid for pid in referenced_product_ids if pid not in existing_product_ids]
-        print(f"Missing product IDs: {missing_product_ids}")
+        # Product ids referenced by bill_items that no longer exist in products, found in SQL
+        cur.execute(
+            """
+            SELECT DISTINCT bi.product_id
+            FROM bill_items bi
+            LEFT JOIN products p ON p.id = bi.product_id
+            WHERE p.id IS NULL
+            ORDER BY bi.product_id
+            """
+        )
+        missing_product_ids = [row[0] for row in cur.fetchall()]
+        logger.debug("Missing product IDs: %s", missing_product_ids)
         
         if missing_product_ids:
-            print("Found orphaned bill_items referencing deleted products. These will be ignored.")
+            logger.warning("Found orphaned bill_items referencing deleted products. These will be ignored.")
             # Note: We don't recreate products anymore - deleted products stay deleted
         else:
-            print("No data mismatch found")
+            logger.debug("No data mismatch found")
             
     except Exception as e:
-        print(f"Error checking data mismatch: {e}")
+        logger.error("Error checking data mismatch: %s", e)
     finally:
         conn.close()
 
@@ -4911,71 +5159,72 @@ def create_sample_data():
         cur.execute("SELECT COUNT(*) FROM bills")
         bill_count = cur.fetchone()[0]
         
-        print(f"Found {product_count} products and {bill_count} bills in database")
-        
-        if product_count == 0:
-            # Add sample products
-            sample_products = [
-                ("Pizza Margherita", 250.0, 50, "images/pizza.png"),
-                ("Burger Deluxe", 180.0, 30, "images/burger.png"),
-                ("Pasta Carbonara", 220.0, 25, "images/pasta.png"),
-                ("Chicken Wings", 150.0, 40, "images/wings.png"),
-                ("Caesar Salad", 120.0, 20, "images/salad.png"),
-                ("Coca Cola", 30.0, 100, "images/coke.png")
-            ]
-            
-            for name, price, stock, image in sample_products:
-                cur.execute("INSERT INTO products (name, price, stock, image_path) VALUES (?, ?, ?, ?)",
-                           (name, price, stock, image))
-            
-            print("Sample products created successfully!")
-        
-        if bill_count == 0:
-            # Create sample bills for today and yesterday
-            today = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Bill 1 - Today
-            cur.execute("INSERT INTO bills (created_at, total) VALUES (?, ?)", (today, 450.0))
-            bill_id_1 = cur.lastrowid
-            
-            # Bill 2 - Yesterday
-            cur.execute("INSERT INTO bills (created_at, total) VALUES (?, ?)", (yesterday, 320.0))
-            bill_id_2 = cur.lastrowid
-            
-            # Add sample bill items for bill 1
-            sample_items_1 = [
-                (bill_id_1, 1, 2, 250.0, 500.0),  # 2x Pizza
-                (bill_id_1, 2, 1, 180.0, 180.0),  # 1x Burger
-                (bill_id_1, 6, 2, 30.0, 60.0)     # 2x Coke
-            ]
-            
-            # Add sample bill items for bill 2
-            sample_items_2 = [
-                (bill_id_2, 3, 1, 220.0, 220.0),  # 1x Pasta
-                (bill_id_2, 4, 2, 150.0, 300.0),  # 2x Wings
-                (bill_id_2, 5, 1, 120.0, 120.0)   # 1x Salad
-            ]
-            
-            for bill_id, product_id, qty, price, subtotal in sample_items_1 + sample_items_2:
-                cur.execute("INSERT INTO bill_items (bill_id, product_id, qty, price, subtotal) VALUES (?, ?, ?, ?, ?)",
-                           (bill_id, product_id, qty, price, subtotal))
+        logger.debug("Found %s products and %s bills in database", product_count, bill_count)
+        
+        # One transaction for all sample rows; `with conn` commits on success and rolls back on error
+        with conn:
+            if product_count == 0:
+                # Add sample products
+                sample_products = [
+                    ("Pizza Margherita", 250.0, 50, "images/pizza.png"),
+                    ("Burger Deluxe", 180.0, 30, "images/burger.png"),
+                    ("Pasta Carbonara", 220.0, 25, "images/pasta.png"),
+                    ("Chicken Wings", 150.0, 40, "images/wings.png"),
+                    ("Caesar Salad", 120.0, 20, "images/salad.png"),
+                    ("Coca Cola", 30.0, 100, "images/coke.png")
+                ]
+                
+                cur.executemany("INSERT INTO products (name, price, stock, image_path) VALUES (?, ?, ?, ?)",
+                                sample_products)
+                
+                logger.info("Sample products created successfully!")
             
-            conn.commit()
-            print("Sample bills created successfully!")
-        else:
-            print("Bills already exist, skipping creation")
+            if bill_count == 0:
+                # Create sample bills for today and yesterday
+                today = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
+                
+                # Bill 1 - Today
+                cur.execute("INSERT INTO bills (created_at, total) VALUES (?, ?)", (today, 450.0))
+                bill_id_1 = cur.lastrowid
+                
+                # Bill 2 - Yesterday
+                cur.execute("INSERT INTO bills (created_at, total) VALUES (?, ?)", (yesterday, 320.0))
+                bill_id_2 = cur.lastrowid
+                
+                # Add sample bill items for bill 1
+                sample_items_1 = [
+                    (bill_id_1, 1, 2, 250.0, 500.0),  # 2x Pizza
+                    (bill_id_1, 2, 1, 180.0, 180.0),  # 1x Burger
+                    (bill_id_1, 6, 2, 30.0, 60.0)     # 2x Coke
+                ]
+                
+                # Add sample bill items for bill 2
+                sample_items_2 = [
+                    (bill_id_2, 3, 1, 220.0, 220.0),  # 1x Pasta
+                    (bill_id_2, 4, 2, 150.0, 300.0),  # 2x Wings
+                    (bill_id_2, 5, 1, 120.0, 120.0)   # 1x Salad
+                ]
+                
+                cur.executemany("INSERT INTO bill_items (bill_id, product_id, qty, price, subtotal) VALUES (?, ?, ?, ?, ?)",
+                                sample_items_1 + sample_items_2)
+                
+                logger.info("Sample bills created successfully!")
+            else:
+                logger.debug("Bills already exist, skipping creation")
             
         # Always try to fix data mismatch
         fix_data_mismatch()
             
     except Exception as e:
-        print(f"Error creating sample data: {e}")
+        logger.error("Error creating sample data: %s", e)
         conn.rollback()
     finally:
         conn.close()
 
 def main():
+    # Diagnostics stay quiet unless something goes wrong
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
     init_db()
     create_sample_data()  # Create sample data for testing
     root = tk.Tk()
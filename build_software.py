@@ -8,66 +8,65 @@ import os
 import sys
 import subprocess
 import shutil
+import threading
+import importlib.metadata
+import importlib.util
+import base64
+import hashlib
 from pathlib import Path
 
-def create_icon():
-    """Create a professional application icon"""
-    icon_svg = '''<?xml version="1.0" encoding="UTF-8"?>
-<svg width="256" height="256" viewBox="0 0 256 256" xmlns="http://www.w3.org/2000/svg">
-  <defs>
-    <linearGradient id="bg" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#2b74ff;stop-opacity:1" />
-      <stop offset="100%" style="stop-color:#1976d2;stop-opacity:1" />
-    </linearGradient>
-    <linearGradient id="icon" x1="0%" y1="0%" x2="100%" y2="100%">
-      <stop offset="0%" style="stop-color:#ffffff;stop-opacity:1" />
-      <stop offset="100%" style="stop-color:#e3f2fd;stop-opacity:1" />
-    </linearGradient>
-  </defs>
-  
-  <!-- Background -->
-  <rect width="256" height="256" rx="40" fill="url(#bg)"/>
-  
-  <!-- Document/Invoice Icon -->
-  <rect x="60" y="50" width="136" height="180" rx="8" fill="url(#icon)" stroke="#1976d2" stroke-width="3"/>
-  
-  <!-- Lines on document -->
-  <rect x="75" y="80" width="106" height="4" rx="2" fill="#1976d2"/>
-  <rect x="75" y="95" width="80" height="4" rx="2" fill="#1976d2"/>
-  <rect x="75" y="110" width="90" height="4" rx="2" fill="#1976d2"/>
-  <rect x="75" y="125" width="70" height="4" rx="2" fill="#1976d2"/>
-  
-  <!-- Total line -->
-  <rect x="75" y="180" width="106" height="6" rx="3" fill="#2b74ff"/>
-  
-  <!-- Dollar sign -->
-  <text x="128" y="160" font-family="Arial, sans-serif" font-size="48" font-weight="bold" text-anchor="middle" fill="#2b74ff">₹</text>
-  
-  <!-- App name -->
-  <text x="128" y="220" font-family="Arial, sans-serif" font-size="16" font-weight="bold" text-anchor="middle" fill="white">Bill Software</text>
-</svg>'''
-    
-    with open("icon.svg", "w", encoding="utf-8") as f:
-        f.write(icon_svg)
-    
-    print("✅ Created professional icon (icon.svg)")
+# pip package name -> module it installs, used to skip packages that are already present
+BUILD_DEPENDENCIES = {
+    "pyinstaller": "PyInstaller",
+    "matplotlib": "matplotlib",
+}
+# Bundled into the exe from requirements.txt, not needed by the build itself - still part of the cache key
+BUNDLED_PACKAGES = ("pillow",)
+
+# Persistent wheel cache so reinstalling on a build machine does not download again
+PIP_CACHE_DIR = Path.home() / ".cache" / "bill-software-pip"
+
+# Built executables keyed by a hash of everything that goes into them, see build_cache_key
+BUILD_CACHE_DIR = Path.home() / ".cache" / "billsoftware-build"
+BUILD_INPUTS = ("app", "images", "invoices")
+SPEC_FILE = "BillSoftware.spec"
+EXE_PATH = os.path.join("dist", "BillSoftware.exe")
+SPEC_HASH_FILE = os.path.join("build", ".bill_spec_hash")  # spec that produced the current build/
+# UPX slows every build and makes each launch decompress the bundle, so it is opt-in (BILL_UPX=1)
+USE_UPX = os.environ.get("BILL_UPX") == "1"
+HASH_CONTENT_LIMIT = 1024 * 1024  # larger files are keyed by size and mtime instead of content
+
+# Multi-size application icon, rendered once from the invoice artwork and embedded so builds never draw it
+_ICON_ICO_B64 = b"AAABAAYAEBAAAAAAIABWAgAAZgAAACAgAAAAACAAxQQAALwCAAAwMAAAAAAgAGsHAACBBwAAQEAAAAAAIADWCQAA7A4AAICAAAAAACAAJxMAAMIYAAAAAAAAAAAgAC4TAADpKwAAiVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAACHUlEQVR4nFWTvW5TQRCFv5ld+8YOYJEC6BAgEBJFGhyBREFJQUEBHUg8AxUND4CEREmbIjWipqWCPAAVooAm/CQEnJj43p1Dca8ds82sRppzvpmdtatPdMVzbGLaUCkuZCBEgLVRiEWOEKkXofJB1jx282bL+35TTeMgSy7chTuLOM8lFyCLZureH960UrayeRo301lgeEjsHzbEkvuxsxBitTKSmZXpblhK46yoZS5vijg5rHnxyDlR9RFgiPkxg7918Oz1hJ190ct4RK0sZIZoQpwcBHfXh/ytWSo0IsRRI04PEy/fTvi6G/Ry206eI4q230/fa95/npIdwCgSo5XEaOBcOtNHEtjxULOIFtVamSobo4GT3IAgZPSTcePiKtmNugQQXXPCMSELpFaoCTE5CiZHhXpWcTitWFtN/J4WQsJM3Thb6v8ImghGg8T4/BB3eP6m4vI5eDCm82vRIboJBXk5GRInKmdt2APg3nVI3hW3z8LcXx1JnhfPhUrATG32zjrsHUBTWhF3Fs4tUTdEEKEgJ7Gzb7z72DpLkBIoYNbA7WvQy7GwoyUICZmZqIs4O4KHt+gW6TjS3WcFsAWBMp6MmIXAhRj0ugXi/9jercMXkgJ3zxGzbV8ZjfPhT/34g91/9a1bovmyqFMRJYIvew39FGLllGv6a9suPP12BdmmGRulOfKDWVho6RMtfWkjGFbIcg4iPsjK43/bI1pZ9rWd6gAAAABJRU5ErkJggolQTkcNChoKAAAADUlIRFIAAAAgAAAAIAgGAAAAc3p69AAABIxJREFUeJy9l8+PFEUUxz+vqnZ+LMuwignIHliECxAMG5Cb8S8gkJBNTBT/h43LCTgYuEHCVf8CEwkJUa9qPBg9iJhI9GLEaNgQVMKP3dmdnu56Hmq6u3q6ZxRifEnNTE2/ft96r973W92yvKz2+nXJDq8Mz0jLrHivx1R9GxAARaEY1bkCSPO1cg7gUUQRMxDjbmVp/9rdq7tusKxWAA6+m16wbXtJPfg0LQKEEE0Ao9m/Aq/GENcGY0mTxxd/vbLnshxcHZ6yLXfTJ5lXvAL2v8tc64vGZ2DEtGZNOlg/bUDOq0f/H3AFxEKm6lOF7LxDdcmnmUwCNyYPMAoj0W/GrlV+hauZry9GwWraR5Alh+DAN2ej8Kjv8ToKKHFwHQOrZy7AXEeQxooBos41l1LD7XbAyRMJc20JxZuYbbMlmfLZnYzNxGKkoYlRXJxF0akCW4myb8+A98/uZLQ7z2VvfrDGFz96el3IfL1KRidSTbEiZJMT/EfLPIgI1SpV8dzEbhfBA0aEvzZSHvUzrBF0yoJEwvAeZluGXT0Xc6cGPtqCCVQbOQvC979v8vUvG8y2zKghG8CBrVTJvLKZKIcXurx94gVU42h1urom8NC1IRtFOfRyh5fmHM5IjXoBXEi9srizxY5utV+kYE65FXFF3FSR0XDj3T8TvvutT6dlioxiMyJsJJ5uazs7upahD5Vzpix8buP0jbZgDDwC2NVzHNrTYcaWPSDRp6LM2LDQJ5ue43tno+ZtVsmIhoUoNDgGWx94HjxN6TghZ1KmvvAzCP0ENoceZ6TEaFTNqnC5Jm2XijMYAWcEawSjwWd+ZgczYnEG+mnK6aMGZ0wBKDXwvAeqqukmHSyT2Jb//83PGZ98a1h7CG+9kfLqXst8VzAC1siEu+oSPoWGZQcfWehyZKFbCdlfD9/nTsI7r3fozdaqXgEqMaKFSAMNx1cM4JWIz+HjwG5h5xxYC73ZoHq23IGJlStwRlQ3087z3PKyWiM4IxgjvLYfrp2FD7+CP54E8EkqWa2uRke6NklxWaJ85jWMvI0ESDI4sBs+XoWWCxVQzcUrOBpbJbVGmddoWNfr8kYjYcSWl3t+W3PWcf5VkatiRD1QXshp6H3I9suf4PM7sK1NoQNx+HhtRqCfwNIinDoebUuhxGM0nHZS5eXsdWHhRejMVBWyyQQYpNXKaEPmEQ2bwcMCwnxpMYznsfrjWBXPhZcGYGxlcVkDDZ8NWKE4jHJ9jePneG4cvHQN/+VPtc9qXiH1JWRVhst4TlVTkcCGpm2I9f15rHweYAxcUSV1gt4W1znu074PLw3gVWk5uPcQ3vv0AdvbptbtVdPGWZJ5frg3oDsjZFoBz3Adw7B/W/av3j8l7d5Nn6x7glshH16Vx1sZqhPeG8abqqHbex0TVHL07gGaKSLS6ho/3DgtAK+cu3/BtOYuqU/xab8SxJqcwlPAZay0kV/qfcWX0cupDp5eXLty5LKwrJbrku1bXTuD66yIHx5TTdtBsZvOhzqXp/E8mquKGYi1t7Jk49r9q0dvsPyR/RsCPViw5vYA9gAAAABJRU5ErkJggolQTkcNChoKAAAADUlIRFIAAAAwAAAAMAgGAAAAVwL5hwAABzJJREFUeJzFml+IXFcdxz+/c+/M3ZlJ9p9hte3GWKgptihKtA+pUiikLb4r0TzUUChKEB8CpQ8tS32xBASfVHwwUghii/hqAxYtJoiQJ6mQNgW1m8bu1t1u0snsztxzfn24d+7c/3d2u6lfmHvnnHvPud/z+3/PjACwooYXxAE88KyeEnWn1Olx0FlVBRASKBqfSZ011076pdg//lbsK9yrKgJibop4l8FduPbi/IU0Zxl/+cJZPSKe+5XxzWMouNCh6mqI7h/5qjmSRYlB/AARgw23L7pw++l//fTuf7OiRgC++IwuW9wVr22WwkFoQQURQ47snSBfIfliv6pTVE1nwdPhh2uieuzauUOr8siK+mt9+6o/4z0aDsKhCO3s4OoHfWLk072qQ68z37aDjdc+27v6uDx4Vk9KwG/dTmgRvPLB05GPvOXOkU/a6qwJZr1wdOs7RrGnUVQlTzQ95XSSv7PkUxABDdWonvZV9GEXWgG8crPJEvh/mE2xTz0XbgP6sC9ieuXRpnxCkZJJReM4myWU76s6R/cmNt5AftzlQKTnq9rJs3LyKJIXrBWsi8xKReLr2bMm7fQs+XvHx0lbBFq+4NTVkE8tXFV9SpNUGXnYCUf0DtykF4xJRpIrG1NEsT+/jKFV1rfazPitOAflWRXMU/ziVOVmMwyFQ4tb/P7MIocOtKPRGb2NUdrZCFVlJ1RO/+YGf7tqOBgIVuvIR0e/uMos+TGloXXcPS8cXujuiWDzAqDTgs8vtfjLG5bZmbQWqp3djzrrHGayiJGNJKV7lHIdnCoewjCMzLVJ8okGpg+VipjYbLTKfPYOjefcDflEA43kBTRHePO2ZWQ/vi4UMAJzHQ+vcKWevJL4QEOSGl9VACF0yo9eXuWt97aZaRvUVUWecoiRZOFOodMSfv3kEe6abcXPmDbxMdFAXW0zfliUxBTfCC9978iuSKexPXJYR5ICRCDw47CcqLSZfGxC1ZLP1jbpYfCP1QEf7ji8XNHdBFX4yuEOvcBk+m1Gi9ORB8WfvrYhMSHnlJ+//j5vr+0w0xZcOnFWQOJD6JSffWuZ+5YCBDCmyouayEfwS28qI4/G6o1M6JffPdzMeo8oEs1rZNJXiEL1JXEEq/DKlU3Wb4W0vGIx0Qyh7Qknv7ZAr21KRqdNtqq8iY7ZKFRBPqkqYxNS4K21Hd7ZGNL2JTatIsk8Kc+AiKCqBL5hZJsWXm42uVKinnymL+bkG3j+m59pePj0KHqBMqkP6p07ikLT7h7EX0MHP/njfys04Oh68xz0ZhETJSlVWB98wJPfaPOle7o4jfq9VD6ohxaOk1JiN1sf8b0C3P/pgMWuF/tAfJdGBrZ5s8U768qf3zAMRsoTX3YszhkWuz6eiV6860qRyWtsudkUNDAVeSYJzQh8+9hCJYFLV+FPO3DXAqxuCJ54nPzqHJ/7FIn0p0fN66bkolBV+CqLMtZNHHx8dUxuayC8vQabfThzAn74RDyXyhTks8mzSvKMQ3oT+eLgCF4JExebxmwHum34oJ9esOCZwpAS5F85S0xcJm2zF/JVMBI9/uv3wy+egpPH4bmX4Z/XwTPRApuRMpESs0mTB8VMT376dBU6sA5+cALuXYILf81N1biEbOhMzjnyUFVKfAzyEOUJgOVFuPxj2BlFbTOVCaVRbjZpjZQ4cRX57BKcjsNmvWC77ehjawq+YkidmI9WSF7zGqgjLyUUjbCrDYgmBy73j3ry5DWQP5el8jGuvgvrtybmslc4hW4ADy7DZCotddgs+Qj+9GajSdM6eP4V+Ps16M0w1ftAGUSinY6lWfjD2eiclCVCqlGUfLKAZvJ5W4zM4fz3ob8dOWZ5NTrdApxC4MPBzqSvXvLpuFlZSuQHF9ELos9+IXlHLn1+OXkoLSWKg8t8da9Snx7N5EtKiTqHyTLe742t7PT5GqycPESlhO6W/CeDZvKg6quIkNtErdsrtU6TbcD9xHhbRXU6yUfZWcRHtY+YHmorySfqEi2tQvcD43lbyRtePfkoXLm+r+glz5854Ua3naKp7cmJ5J0qnZbw5g3H765scM98q0ILUtOqxjgg9IeO19/s0wsMtvBTUybYWPEDw2hwyUfMecR7TKPfnEpXrkTS394JOPPSFiLZzFWm8mx/6lplqIwWEviGINZC5XanOhBPQM7LIyvq/6f/3qteZ+FRO9gcitCuWjmAScQ+kVDxt4SKKCL10U5QHNpAXoemM9d2g43X3u3+73EBuO+Z95dV5Iq0e0t2sGEBQVKlSUWYrU98uyPf6LCqDlRNZ85zw/6aOHPs+rmjq4YVNdfOHVq14dZDbti/aIKDnrS7BjG56arIZ1FFsjlUV5NHDNLuGAkOeG50+6Ib9R+6fu7oKisrseun/m5z77Mbp8CdErXHVe1s/DuVVJNXaiVPU1VZH+cRQUVuIuayKhduvHg083ebjwAmW2YGHAEMNwAAAABJRU5ErkJggolQTkcNChoKAAAADUlIRFIAAABAAAAAQAgGAAAAqmlx3gAACZ1JREFUeJzlm12sHVUVx39rzz7n9pz7Uar0mxAoVOUCNlAbbIyUQAL4baK39IEQQyIPGhJNEX3ytjExAYshmIi++OJHSBsTjWICSItEDcqLYOChVqiStnrbFNrb+3HOmdnLhzlzz8ycOWdmzrm3kLqSe+6evWftvf57rb3W2ntmhBjtmlb7h/3iX/vg0ZHq2NbPiHNTqvoxVDehiiIS3qkk/4PGyqTK2qMeGZAv9dvNp4pYEDkp6J8w3iEu/PE3x37wyUaEMbpbOnwqiOj1D7XuVGMfNR7bADQAdX6OMAOCkH4gioJP9hHnE2MRbwRwOBe8EviLDx8/sP7ZCCuAAWBKPYDr9gb7pGKfMR7bXNN3rtly6lraLYwOB15ARRkefLKPNJ+6lrrmrHPNC06Mt82r1p+5+hun94WYD3oAEpnEdXuDfdUJM92c9QNRBBGTL8ygZp8GMQj4ZB+5fBo4RNSOr/da507uf/Oxzft2TR+xAjC5V283VX3e+a6FU4uIXFLgo3p1ijG+sfWKa1y4443HNh6W7Q9ofX7CvexVzGTQ9J1cappP16tzUh0zrjX3+uI5t8M0Jvy7vIqZdP8P4AHEGNecdVKpT9YmuMv4sAdBEfSSB4+GnCIqgqrIHiNwm/pOFDWXNvhErXH+oih6mzHirVPnoCvJiXd3KYBPyCE4HxFvnXXqawg+zhjvLg+8tv+kUxZpt6bq22XNHCts78+3LOBjt/hqO5ofBDxY8ZKClU5v04KmwXdzxnkd4DR5bz74CJ+I7d3YH4QAgSqnm2dRaS3l1N2aIMHbq667Jb8PVaFuR6laQyddLQo+/LW9NZElSNzshaY5w/QXqnx482U4VUyWMS0LJftVVUSEs3Mtvv3rs7x9bpyKJ6iWAw9g00MVMV/PCO8sNNl5veMrt24YBNGy0dGZJt/51QIbxkbxNW29+b7CltN8VB9qxBPBKQROMSul/B7kO8UaQRLWUd5R2k6xfKhTCIEbuegToISWOGyItGnWMuC7hOrlt5aZkq4mPglklvuFSDvYYYak/VKGYBeXeoHMyw9sVkNf8ELqJKdDcw0XxuSsvGpZKOx0dMTr2RYvF0mOMvOAvuAzkBmBv59c4BNPHGuvy5UhT4Sz8z6P776CL+18f1K2VLkIeEhFgXzw2aQK11w+ws/uvwqn3atyEBLApCZTAD9Qrt9cI1DFW1pzWWlYscwwsQTywceZk3fXq4bbPjBeBNuykB/NdEKK4pqPyHY3FQEvxEcXYL7p+OvxuaEtIEyxYXzEcPOV9czw2p1xlgXfwWLLg4/fG16LwD/PNLj3J8eH9gEisNhSrrl8hOe+di21qglFycbcpzIfPIAdFHwbOgBO4cZNNV6bnsQNufgFcEDVE0asEASKMZIVdROS9wrn/cBDjyiQDz5bnNW1rPB0MWgw8Ip2R4FyJzmdJfDf8y2efPEMURowFLXdjBFYaCpf3H4Z26+s5+w40445HzykosBgx1ih2c4uOl78x4Vl3RMYEc4vBnx0yyjbrwzDbd+1kCFpP/AQXwKlwCf9vFO4dt0Ih7++NV+6Iai3gy2v+ejKdmBnr6N+ml8pSjtSociySp815oMHsN0ZXhHwSQ4jcGymwQM//3efJSAoARWdYFQ3YAyMrxJEYK6hOAenGifZe3eNz297H4HTIUJqMfAwxG4wXTO+yrBr69jSAskWS6mZUSwBp88ZDr0kLLbgczsCrlmv/GfecsWaEaCcI+24vzLRICyX3w1mDKYK6ycqTH96Y66wr/4L9v0S6iOwZhQWW3B8xnL6HHz3nvVs3RgugfLniyXBS9hSbjdI1kx3WoM+WVAUHsUI990KZ2bhtbfg7Tn48u3wwU2wdrXidJDTpfKaj66K7wYTv93ZvgC2j+TOgTGw0IQf/x4CBwst+NZn4cG7470MQ8U1H9UbMlnyND9ANGhjsyY0/bkGNFow3wxN3g+GjTHlwUP0isxKg4cls775avjFg/DTr4YT8f3fwZHXwHqhlQxGg4EHKPA+QLo+695yorYC2LIO9uyEZguefC60ADPkSVo58GHsyHkknl2fHqoMCeCZ0Cne+3G46So4egr+fDR0koNaQVnNR9Tn2WB2fTjUcM4qWg6b1sDT3wx9QaUtiWd68/WizkPVuJz0AR+hy9oNUlTzw7msqIdaNfwbnqKThOiy2NsuXYnQMOC1d1NPikQuY1PZOVI5zUdkkw3ZDN3guyVYOgcouToGWUzZT6DalSXAQ2I3mM2QFyUiEgHfhYnOSj0aUA3ziFXVruHbQpQDD0vPBrMZCoMH3pyBe56A+Ubby+fjKU1GwgTq8fvgUzfFWzQEr7HrlKx9doPZDP3BS8LvAoytgo9sgfMLoZZW4kGpCDR92HhZ90Isq/monPmGSNHkKP48Zu0E/PD+olCGJ9+FEw3EZqIceCXjDZFBM0MF1DH8fiaPtEAUKAgehtoNJkkAGSCJKU3Jx4Cpi7j0+eBh4N1glwTvKSpzyjXAbjBdfq9QcbOP1w+wG7x0wINiOtGzDHglfQj9blI6JBf3a6oW8QQNupj7gw89kWp4mqN68e0iGrtzDFkunCuAeGLRYAZj1+FaS+69n9nHp6HitdPed+HlqIoXDlqrSM8MsJ/mMVZwrRmr8IJnR6Zcs+UArz/4sOzUMVqx/O2tRV56c5YPbaihulJ7gIyNF+HCnV0M+O2r5xmteu0XptOSJuVfUq3ixFaNa7ResGjwFOp2o05UTCZDsstwcOsJsxdq7P7RKcZrtHeD3afFvZdGZHB5iydq79wbcTZ85dy8UE9MQAGnrirhn3tKNj5wol5bXXnZVOqTrjnrEGPSzOkXi6KyESFQ8J1LiZfmzJvUDL6uV/G6+YyE6XA58IEz1VHjWnOv6zuNHQKwZe/p281I7Xnnz7dwQfuzuf7g47+SkYsP8qAyCb7XmLE61R499gIffjYndlUFf/6OE4/ccNjsmlb7xmNrDweN2f12bG0FwRF+Q1MIfFsOVLX9P9RIp077tCfrlfADiGR9p48uvnLgHYLzxtZVXHN2/4lHbjhM9OEkUwc9Dk65qx+emfYqtWmAoDnr2q/Exvx8Xoi8SJov4e21/RGBVOsGFNdc3H/qe5P7mTpkOLQ76LjY9gfFVz104k5jVz2K8baBQNBAnV8SfMk13/PcPocvT/PGQ7zw+Eid/4q2Gg+fOnBjxsfTACK6a1rt8QObnzVzf7lFVac0aB5UOIGYttEVBVcCfE8Qg/K1NR/KfIKgdRCnU/ULx245deDGZ5k+YiPwAP8DnjmgzBgatSYAAAAASUVORK5CYIKJUE5HDQoaCgAAAA1JSERSAAAAgAAAAIAIBgAAAMM+YcsAABLuSURBVHic7Z1/jBzlecc/zzuzu/fLP84xJg5JHAi/GhBK4yhEFGOcKBWogFLIUSVRElUKBISQKhKSKAJOV9o0URWa1oooKWmbNkEVJ1QURwkqqMZAURtom4a0DdTBCQgM2Phsn+9u73bmffrH7Nztj5nd2buZ2V17v6exd5953/d5Z77P887z/poVEkFl5yTOvinxQslFk7rFm/NvFnHWq3q3IE4J9YPUzfnjyo34lixtrXxN+iQufSf6kpfR+TVG5BCDqr9ojPMtq95xhk+798UpeSM8vXNS3X1T+CBxilaKapeACXWYFh/g3Nt0s2v8z2KcHWLsJWLMRhHwFy1gW1xGjxqARMs715e8jFQMAAUEM7QerI9a/6j6S0+r9Z907dL9L9xzxmGgjrs4tDSAnTv3uvv27fLgQeeCL03cibW3OsNmk/VAK6Dq+aqoCG6ry213oQPPT0p8vUQVT0QFcR1TGEbcEv7Cm0cQd/cvv37j3TDts3Ovy75dXlMxVcQawOSkmqkpseffVvmIM+Te7hT4iDcPaiseIiJgQCSs1ID8eFkW5DfIFdSqomJc1xndhL+08KhdOPSnB+7Z9iiTapgSG5UzwgBUmESYEnvBl/UqsA+LYxy/7FUCT5eaPB1XNOLbgPxkOZJeo6qq9ZyhjQX1F31R+ej+r234YWAEaGNc0GAAQbB34iCysMF/yBScq23Ft2pVRcRJt6LJ09bKB+THy2tzq1pfjCumMGJsZWHP+NFfXTe2dVb3TV1eFxya2gLCSH9+zH/IHXau9pd8H8UMyG+XvrfIBxAxDtY3/tKs74yMX/3m+q0P7Zva5e2cpI7L5RZgYkKd6Wnxz/uDytWFEfcHtmIrqLo0txKpVjRpGQPy4+Vt9CmIZ0pjBf/E4WsOfHPbnpBrqN6aUPCe2/RSKdq96gNqnfrnfeYVjZUPyI+XJ9OnihR8cUto+fiuF+8546mQc0O1N3zR53UUY78qxrhqlQH57dL3C/kAImoriDEurvvViz5/cBSmARWz/Ubc6WnxK2q/6I6aHf6iXwn79flXtF4+ID9e3qk+EXH98rGKM3rajlmxX5yevt7ffiOugMrZt85uLpRGnjfibFD1ZNDVa5W+/8gP5YoqpqBY75hT1vP279562IBoqTDyicKIM27V8wfkt0rfz+RD8CjwfGfktHFvyHwCRM32+7RghSs0GCw0tZm6V9FV6huQHymviwZQo94Cgn/F9vu0YGZeZVxEd9kKyLIBdL+iHesbkB8pjzhjtDKHwq6ZV18bN0Mn/JtMyXWt9byg+e+Vig7IX72+QB6jT9Sq55Q2uHZebzKKjovUjw71SEWT6RuQHylvrU8hGN0dl/d8oVIGKfVmRdvoG5AfKU+mT1B00SBOKT5ZL1Q0Rt+A/Eh5cn0WESm5g2Vc7WUnH/nhads44tdeSfO3AfnJcvTmPXX7paID8tO/p0D0mH+7jOlVNA4D8pOWsTZ9ESN/yTKmRb7W5BHqlx7IyiEx8jpZ1GfayDtJmzXy9fwQMTFAdMb0yQeDi3G8mvwr/694PhHn42XRGpXmOjbLNDZto856Wfw1NhrTStlqDb6CErles2Ud1ur54Se3e54viCjzHOL1E0c6ekCcDFCUUbfEpqENYIvQZARZkr+CRL2ALJ5PIsoR7xUKpTnuuuqtFBypymOKO4lgLRgDP/nVHA//9DXePrYFbInoFq0W6Xl+iAgDyJp8xeAyzyHc0hzf/czZfPj8sZhyTm5YhU//zQF+9PMjbCqejtpW1p8++dCmF5BNZGowjsdrJ47wh9ds5cPnj1GuWFxzCrh+CAlagaIr3P+pd3HB1H9TLs8zbNZh8YiKG7IgH+oMIP9uiesEXuAawXVOIQMAtDrv6lnFNVDGEhc0ZkN+GITHnsqS/OpZhVPJ8RsRXnr8XcrO80M09QLy8Px2lRoAsvb8EKb5VNbkD9Ae+ZAPNQYwIL9XkB/5sIqh4Fp5mgMSA0De5EPkbGAy5Wvy/FM48GuFfMkP5ImHgmvla6rogPxI5O354ZmOF4SsnfxkvQBtVXQ/QQDtdIg7e88P0XYouFaeDvntYcPxgZOltegh8hvPJF4Qkhf5EJC/ULF4viInweyQb5UNw8HKe6WVPeRLPrQYCm6dcS3kS2x+axVjhMdfmOXG771EwZVO7KYnYYxwouyz89wxvv3JbS2GvPMnHxIsCMnT860G/dJ/OzDH//16nuL6Ar7f3xYgAp5nWahYlnyl6Aqa+JKyJD9BLyAb8uODQKc6MXDrri2MFA2LnmL6/BFgBOaWLJedM8ZYySzHN+2NIFvPDxHbC8iO/HiEXI8UDbfu2tIybb8i2eRX9p4fIrIX0A3yG1P2e9NfCyUg3knEfn7kQ0QvoNvk9zo6I3M1pUd9y4Z8aOgF9Ar5AqfcApFGZE/+chAYlyR/8lWDOGB+yfKdfzncc0FgbUC34+yxlQGrlKAN/2fp+SFiegHZkh9XVd8qriPs3vsGX37g5Z7rBoZdutM3FNh/94WMlcyy0aZSPq1fup+m54dY297AVWzXaoXQmy4+c5Rzto303EBQ7aBO0RGspjdaXT88lg/5sJa9gant1VuBqVrA5eeu47/u/I2eHApOPqzbGVZGR/IjHxIOBTd9y4D8WliF4YKBQgeZuoD0TTM/8kNJ53sDMyYfgkeB7aGmvxHS+CWVOCBfz6/pBfSO54dIO7rOHJnUNVvPD5F8b2Cq5LcPBvtpOjj9uCBL8ht6Ae0ypkt+a+L7cTo4brp39XabH/mQZG9gTuRDf04Hr226txH5kg/t9gbmSD7053Rw3HRvesjyVTcxMUA3yIeTYzq4f8iP6QXkQ35ro1D6azpYyWKGMFvPD1HXAmRPfrdIXR0ximY49dtOc7Q8iSyJ54eonw3sEfJ7Zzq4O28Ly4t8qG0BeoD8LKaDFYvLCEVdX1+b2g579XPdy+bE8mblEJedM5rJ1G98fZNK104+hLOBXXkJYzOymA5WlPX23QxpoFcB12lOZy3L3TcBymaGo/ZlTt9QYv/dF6Q+9RtV0+Y3hYXy9rLOyQ+DwNgLyv+Zn/50sGK0xIgWUcrV7y4nFgqIgGuqRqFQKlbAeKACoiw6R9m4WOLyc9enPvUbXdOkrpKO54foeEFIOp4fXUom08EaeLzjKL4FRwyPPQe3PwBLfmAER+fgU+9zuOtjBquCI4qv72KxQiZTv4krnkC2Ws8PW/417g1srSRGbVukPR387Ivw/adgpLQy0TRagtl5sBLIn/hfw+R0MBK56MFbN8IXrlqp+8lEPrB8QWvYG5hASZ0keVtuwpZ/Dc1/mHXJg7sehMd+DmND1Wc9sHUjFNzAIAoOHDwK9z4KjoFj8/BH11efyjaQ5Yd8PD/EKvcGtlYSo7YjyPI/q4cQkHnJuXDp+dVXTJuA8IefgcOzweclD87cAjd8CDwbBHo3fChI3/1p6ezIh1XtDWytJEZt7giv8/QNcMe19eee+AX83ROBZzsGji3AZy6DT14aUU6uBtB4r7IkP+wF9Jjnp4mw2/a3++DR52D9MBw6Ds+9DI4ErcEbx+G6DwRH7e+mGun2e4uz9fwQHewNbK0kRm0M8jGMMHj7xavwTz+DTdVXEhfd4Nk+VoI7fhc+fkl9+u4je88PERHeZD0U2aVHgoBvoeKtfJ9fhGd+GcQC2r2qNSA/8iHR3sDWSmLUJiwjW4TXPnExvHdbYADPHoAf/WcQ/CFB9/DoPHz7hmrAp91u+uuRJfnQdm9gayUxahOWkT1CIrefFRwQBHrbNsOf/ziICd42Do89F/QKPnZx8GjojgE0N0FZkw9NbwpNriRGbcIy8oXVwPs9P2jqb/ltuOAdwSPAKgwV4K/3wsJSEBiufklXesie/MDgTJTltVOytoq2kmeDYE6f5dfTFxz4/Z1Q8YOqDBfhf16BPf9R3Z/XZQPIw/NDmGj6syI/0NbN+xuOMv7Ob8KFb4f5StDkF134+ydgsRIYS7dagbw8P0RkLyCJbLUV7TZEguf8UAE+dRmUl4KWoOjAT38NDz8bpMvbAFa4y5r8eph2CdLulvSCGYTDu9dshw+cDSUX1o/A5nXwj89AuRL8qFOeaH1v0ic/1NdmLiDlPmmPIIzyh4vwD7cGs3+hzLfB46A76CwWW4vnh7IWl3pykl8LJZgRLHSN8HbIxvNrkXhBSLrk94ZJLL+UQeuFvTEOlBX59bJEC0LSI783iK9FGtPO6SMf8iFBEJgN+T13x3sI+ZEPbX4y5mT2/P5BduRDiyBwQH7eiOoIZkn+ci+gdz2/F8bkU8GqAstsPT9EUwuQD/lRGyDqcwq9NS27VnS2syh7zw/RvDk0U/JDefyd0JqzxxfyXpGbPlSDaxguJs6x8m/G5EPTq2LzID8eqkGqcgVu/x488XywbMtv3WD0LMIWzPPhzz4NO84P5iHaDTPnRT6s4j2BrVV1UtFm+DaYsv2rf4bvPx0s1T6+0N+dRjHBDONN98NP/jjYkBIf22iu5MOqfjgyDc+P6ZNWp2q3nwlb1sNrM4G39GswGO5DKC/B9R8M1iFE7zGUyI/Zkt+iFxCfMRvPD2FMcIN+6zz47s3w9AvV7Vx9+ghAAuN1TbDRJDRmkWajVkANNTcpW88Pz3Tww5FpkN/elcO3hH7wnOA42RDbs8nZ80Mk3ByaD/khTHXRRreXZqUJx0kay2RLfuOZBJtD8yU/hDGRy5VOUWRDPiRcEJI3+acmlCQBc3rkB5IWTpYl+XEXO0A9svP8EC0XhAw8v5vI1vNDxAaB2Xn+AO2RD/kQsyBkQH43kR/5ELEgZEB+N5Ev+RA5G5hMSfO3AflpInvyA7nbHc8fGEUr5OH5IToYCm6Wr9bzB/THIy/PD7G2H44ceH5qWN3ewEC+Wg5hLT8cmfKAxKmOYGgsP/LDby2XhcdnHJCfPvL1/BAGaTXlkn+3ZIBaZOP5yzyKYFT9xaQZ0/Z8qwNTiL8H2TX7AQRVf9Eo3GuG1qOqXuuMaXl+ILWqjJZMsEGzehNUT6GDgPzRksFpeit+xuSremZoHaJyrxF0BlW//uczGjOm2+yrFUYLRR5/fhbfQsGV5X0Ap8phqsfjz88yM+9TMKa6TCxL8kMHFKqcz8hZkwe3MO++ZMQpqXrVs7UZs3jmC2IqvHLiMBPbx/mL33tH8OpWkZNqM0gcfBv8FM6/Hpjj4995EVdcik4J1bjFj2mRD6CKOKJqF+1w6Z2y/T4tzOw//AOnOHaFv3TcF8RZSZ5lwCdgFplZOsZbRk2wVr6nA4Ioy9QYeTIcW/ABhyGnhI19VWma5AOoL8UxR5fmHnn13QvXuP/+Oamcdfsbj4g7dAVLsxZwsicfwIIt8pbCW5gvL1STdmIBnXQtG8Ofdpriz2pYQIK0zfrq0xZMCSNOjuQDiBV3yLGLs4/wufdXXFAx5YMP+ByaNMbdYG2lhVmn/XxSrApDMgYSfQOiIGj1r1668oxrX07nRl7NISQwgCh9Wn+6Wt18mv3l74pxHTt/eEbLlQcAMdtvxN2/+22HUN1tRsZNfW8gmfK1VDQ4fBTbcETJArmPxS4bQfgXpq/9s02yQNIsj0tfl0OqMlVUbfXQhqNeZlWxjenCMmI3yWZBPkH0PzJu1Pq7X9v9vkPbb3zWFVCZmJg2z79zx9AJx/2xKY7u8MvHPRFZ5a+JpFDRjvQlL2PVXg+5rtvPinwZGnN1af5J31u68vWXXigzPWFN0PZO8LNvbJ3DW/qKWuuJKcDy3pUB+X1PPqoYB6z1FPuV17/x3jmYAEQNwPS0+BMT6rx4zxlP2fk3rzXFYbf6I3ox2gfktyqj58hHPFMcdr25mWsPfv3Cp5hQh2nxoWYyaHpa/J2T6h745rY9Xvn4Hmd0c0FR22wDA/JbldFT5KsF1JrR8YJfPr7n9W9u38OkuiH50BTtq+ycfNw5cXCdzGx850OmMHK1rcxbtZ6KGGdAfusyeox8H2NECiMGb2HPK0fmr2PrrDJ1uV/b5Yro7qkwiTAl9uwvH7tKRR8Wp+j45aMVBLd+e+OA/NXrC+Tpk6+qwVh/Ab/iqzUfffVr7/4hk2qYQhv72xFzwaJMiWVSzf6vbfihXTx2pap91F331gLiStBNVL9VfJCsonGyQD4gv52+JpGPqoc44q7bUkD1UVuevXKFfLFRgy2txzF37nXZt8uDCefML/3lnah3qzO8aZN6ZWxlDtT3VUVFwpVFrS6pDwyg6W70sgEoKB6igjiOFIYRt4S/MHME4+w++Cd33A3T/gqH0Wg/kF0TMZ572yubPWM+q8bsEKdwCcbdKMbBlo/T+OavviIe+szzFRDM0DqwPtZ6R/ErTyv+k1TK9x+85/2HAZh40GH6ep8WSDiTobJzEmfflCxb0lmTusUuHLzZiLPeWu8WESnVPhX6ygD6yvOpDiPbRRXnW6J63B8ev/f1qa1vLCecVJcp/Jjx9Tr8P/FzlK8+T0wrAAAAAElFTkSuQmCCiVBORw0KGgoAAAANSUhEUgAAAQAAAAEACAYAAABccqhmAAAS9UlEQVR4nO2dbaxlV1nHf+fMLZ1prUOZ6XSCNdgLJKS0ISUSkQR8SYxGiEEsAT5QEMIH+GKIvZREQ/xK7ydjojEqoCYNMfhBozF8QLEJAhLlPbzeCoROX+hAW6CdYWZ6/HA5t+dlr73X2vtZ56z17P8vmWTm7mfv9Zx1nt+6+5xZa+0JhXDLXZdnzUdmLf/qju+mPX7W8DeL64biN/76Jn2vn+v15ckj//uYVqcH+6fXen4bbC2JsPCLSH6L6waPSv4sefR5Hw/2b9iKixtt9Ja7rsw22alD4iW/bR6SPz5ik4NB9oYOpZ8j+ZviJX+ePGqUfzX+YP9MVkezXXxZfCipU+OOSn6LPCS/TR65BgLzi66LD6V2avio5LfIQ/Lb52E9EEwtLyb54+Mlf548PMsPsLv3SOoFWzEZTZrFh1o6VfLb5iH58+Sx+vru379xsL+D7wAkf1q85M+Tx9jkB9jde3jw3cCgAUDyp8VL/jx5jFH+OUMHgV63EGHxwUOn5shD8ufJY8zyr9LnI0HyHYDkT4+X/HnykPzL9LkbSBoAJH96vOTPk4fkb2Z376GkE6IHAMmfHi/58+Qh+dvPTBkEDOYBjKNTU+Mlf548JL9VHodEDQD6tj8tXvLnyUPyx1839i6gcwCQ/Gnxkj9PHpI//boxg0DrACD50+Ilf548JH//PLoGgR7fAahTm+Ilf548JL9VHs0EBwAt7ImPl/x58pD8Nnns7j0YPKFxAJD88fGSP08ekt82j5sDg0DkRwB1alO85M+Th+S3zaPtrLUBQDv5xMVL/jx5SH7bPBbParoL6LgDUKc2xUv+PHlIfts8Ys5aGgC0gWd3vOTPk4fkt80jdNbqXUDgDkCd2hQv+fPkIflt80g5q2EAUKc2xUv+PHlIfts8Ul/f0QCgh3aE4yV/njwkv20esa/v5r1zR6HT1YOxjcWfNY5OtcpD8ufJQ3XaHJE4FVidanHd4FHJnyUP1Wk4Ygp6UGdTvOTPk4fkt82j7+ubfwzoNRNQnSr5+8RJfts8LF5fxACgTrW4bvCo5M+Sh+o07rpJMwHVqZK/T5zkt83D8vVNwp//1akW1w0elfxZ8lCdpl03aiagOlXy94mT/LZ55Hh9nTMB1amSv0+c5LfNI9frmzb9MP6S6tSUeMmfJw/Vaf88gjMB1amSv0+c5LfNI/frmzb9UJ0q+fvESX7bPDbx+qbqVJvrBo9K/ix5qE5t8ph2h9g3un7UV6ceHZX8WfJQndrlMe0OsW90+ai/TgXJnysP1altHtNtNOq9UyV/njxUp/avb6pOlfx94iS/bR7ben1GuwKnNeq2UyV/ljwkf67X1zoAqFNT4iV/njwkfz75YfCuwKmNOu1UyZ8lD8mfV36IWAtg16jTTpX8WfKQ/Pnlh461AHaNOu1UyZ8lD8m/GfkBdvI3WkenPjE9SGxX1M41s7PV1WlqfJv8cDQAjFd+iT9enpw8BMCJ2Y2JZ/qQHxrWAtg1KvlFHTw1eTgh2o/8sPQRwLLR+uQ/9/7bEnMQtfPcu7949PenJg9H3An4kh+SHgwi+YUvVt/39jsBf/JDz+cChI+WL/8qkn/cxL3/26/TmPhU+aHHcwHCR+uQf/G3v+QXsFwH63cBfuWHgWsBapNfiDRKqdM88kPjTMDURiW/8EgpdZpPfui5FkDyC9+UUqd55YfGAUDyCxFPvfJD4lqA+uXXYCEsqVt+aHkuQPhUyS+EB/kh8FyA8KmSXwgv8kPEWgDJL8QifuSHjnkAkl+IRXzJDy0DgOQXYhF/8kNgAJD8QiziU35oGAAkvxCL+JUfgs8G9Cn/+h5+QrThW36YNT0bUPILMQb5Ye3ZgJJfiLHIP2Pp2YCSX4g5Y5AfImcCWjdqfd3g0d779osxMxb5IcOuwDGNWl43eFTyiyz4kR+SNgW1a9TqusGjkl9kwZf8YLgrcEqjFtcNHpX8Igv+5AejXYFTGx163eBRyS+y4FN+MNgVuE+jQ64bPCr5RRb8yg8DdwXu26jkF3XgW35ofTSY5G9i8XFSokxsnvfgX37ouStw/0Ylv8jP8PdpHPJD43MBJL8Q8dQrPyTuCty/0VLk1yAhLKlbfkjYFbh/o37k17ME62Az71P98sPRl4CSPxYNAsKL/DBgLcAY5RfCk/zQcy2A5BfjxJf80GMtgOQX48Sf/JC4FkDyi3HiU35IWAsg+cU48Ss/RK4FkPxinPiWHxpnAqY2KvmFR/zLDx1rASS/GCfjkB8aBwDJL0QIT/LD2nJg7/IPHyy0IrA/tc+i9CY/NKwFkPxhJP8wau4/j/LDynMBvMuvDwuiD17lh4W1AJJfiHU8yw9rzwYc2lhcfK3y1/4ZdtvU1n/e5QfYkfxp1FbEoh9jkB8y7QocPFq5/GIcjEX+Ga0DgOQXopw6tZcfjHcFDh6V/KJKSqnTPPKD4a7AwaOSX1RJKXWaT34w2hU4eFTyiyoppU7zyg8GuwIHj0p+4Zr65YeVmYDx1Cq/hglhQSl1Okx+GLArcPCo5BeuKaVOh8sPPXcFDh6V/MI1pdSpjfzQ+nTgtEbHIn/NK9pqoczZlqXUqZ38kLgrcPCo5BeGlNfPpdSprfyQsCtw8OhI5BdjpZQ6tZcfBq4FkPzCN6XUaR75YcBagDHKX+ZnU3+U0c+l1Gk++SH4JaDkD1FGcYq8lFKneeWHHmsBxiy/EOvUKz8krgWoX34NEsKSuuWHhLUAkl+IReqXHyLXAkh+IRbxIT9ErAWQ/EIs4kd+6JgHIPmFWMSX/NAyAEh+IRbxJz8EBgDJL8QiPuWHhgFA8guxiF/5YWUmoOTvpryVas9w3WyXq2bXZm/nChd5fPr1o3/7nR3pW35YmAko+bspWf5jnNiI/AAXJo8u/bvkfumPf/lh/mzAkcjv+cPBidnpjbQz4wo/mTy2kba2Ryl1mld+gKnkr58pV/Gs2cmNtHVhcp4ZT2+krW2y/TrNLz+srQb0Lv+wYeDc+28r8nb32OxqLky+v/bzCTDhGMdmJzjG1VHXeppL/GTyRPD4xcn5tZ95+w6gvjrtl8dssjQASP4Yai32zxzA3ffCI2G3ATixcxWf+ONTXB/8OuGUdWqVUkqd9pcfkp8LMG75a+Zlz4c/fWt33MXL8LEvZU+nckqp02HyA+xIfj98/tvwf99rj3neafj2o+0x//pZ2DkWPr4zhVffDpO174/GQCl1Olx+iN4WXPKXzuUr8O6/h0ceH36tzxwc/gnxG7fBa146vJ36KKVObeQHg12BQ/GSf7P82+ds5I/hzldtpp2yKKVO7eSHgbsCh+Il/+b50H2baefWn4fbf2EzbZVDKXVqKz8M2BU4FC/5N88nvw5fO7eZtu585WbaKYdS6tRefui5K3AoXvJvhxechY+8Oy72nn+G/275fA/wjl+H33xJ87EXnk3LrW5KqdM88sOsaQCQ/LVxw88e/unimw/D/36rO+6Ol8PPXT84rcoppU7zyQ+JuwKHLiL5y+crD8C7/ubwfwvaeM1LJX85dZpXfug1E3A5XvKXwQM/gH/5n+WfPT2DJ56CL38XPvstmHV01ZmT8IevzpaiM+qXH44GgLHI73ew+M6j8Gcf7X/+Tafgz98W91FClFKnw+SHpJmAyxeR/D44NoXXvxz+4LfguhPbzqYGSqnT4fJD9EzA5YtIfh+86kXwvt+Ds8/edia1UEqd2sgPUTMBly8i+f1w31fhnR84XEMguiilTu3kh+gBQPJ75RsPwlv+Aj76hW1nUjKl1Kmt/BD1EUDy18DJE/CLu8/8++IlePAxOP+j7m//L1+B994LZ0/CS56XNc0KKaVO7eWHzgFA8tfCLTfBh965/vPvnoe//g/4yKfbz790Bd5zL/zTXXD8qjw51kcpdZpHfohYCyD56+amU/And8Af/W537APfh7/8WP6c6qCUOs0nPwQHAMnvjTe9An779u64v7sPvtexbZh/SqnTvPLDrGkAkPxeee/vwDUde4NevAR/9e+byadmPMgPgbUAfuUf9yDxnJ+BN0cs5/3HT+suoA0v8sPSACD5x8Cdr4Rru+4CLsMHPr6RdKrDk/ywsiuw5PfPyWvgja/ojvuHT8H5H+bPpya8yQ8wlfzj462/0v1ffRcvwQf/czP51IBH+WH+bMCBF+kbt/FOTWzFK9dfC2/45e64D/8X/ODH+fMpHa/yA0wl/zj5/V+FqzumgV24BB/8+AaSKRjP8kPiWgCrOMm/fU5fB3f8Unfchz8Jjz2ZP58S8S7/DNPnAkj+2nj7r8GzOu4CnrwIfzvC7wLGID+YPRdA8tfImZPw2pd1x937CXh8RHcBY5EfGncFTm1U8tfM+153+Ees4l9+6FgLMLSxUKPxSH6xDcYhPzQOAJJfiHjqlR96PxegVvk1PAhL6pYfGtYCDG0splGL60t+sV3qlx9W1gIMbSy20aHXl/xiu/iQHxbWAgxtLKXRIdeX/GK7+JEfjGcCSn7hG1/yg+FMQMkvfONPfjCaCSj5hW98yg8RuwJ3IfmFb/zKDwNnAkp+4Rvf8kPLrsDdp/ZvtE+c5Bebxb/80HMmoOQXvhmH/NBjJqDkFwI8yA+JMwHrl1+DhbDAh/yQMBNQ8gsBnuSHyJmAkl8I8CY/RAwAkl8I8Cg/dAwAkl8I8Co/EN4TUPKHuXUv26XFQL60b31Fv/JD4A5A8oeR/GVj+/74lh8aBgDJH0by14HN++RfflgZALzLr28ERBzjkB8W1gJIfiHW8Sw/rD0d2Lv8w4YB+y+YRA6s3ifv8s9Yejqw5I9Bg0DZSP64+PlZO3kb9SX/HA0CvhmL/JC0K3Bqoz7lF2OnlDodLj9E7wqc2qjkFx4ppU5t5IekAUDyizFTSp3ayQ/GzwWQ/MInpdSprfxg+FwAyS98Ukqd2ssPRs8FkPzCJ6XUaR75oXFX4NRGJb/wSCl1mk9+GPhcAMkvfFJKneaVHxoHAMkvRDz1yg89nwtQr/waLIQlpdRpP/mhx3MBJL8QUE6d9pcfEp8LIPmFgHLqdJj8kLQWQPILUU6dDpcfes4ElPxinJRSpzbyQ4+ZgJJfjJNS6tROfkicCSj5xTgppU5t5YfWAUDyC1FOndrLD5EzASW/GCel1Gke+aFxLYDkF6KcOs0nP3TMBJT8YpyUUqd55YeWmYCSX4h1PMkPgZmAfuXXYCH6401+aJgJKPmFWMej/BB8NmDeRtePltKpQqxTXp3a5dHwbMD8jS4fLaVThVinvDq1zWPaHWLfaHmdKsQ65dWpvYdTyS/EOuXVaR4PjXYFTmu0nE4VYp3y6jSXhwlrAewaLaVThWijlDrNJz8M3hU4tdFSOlWINkqp07zyQ8RaALtGS+lUISypV37ovStwaqOlyK/hQVhSSp32kx967Qqc2qjkFx4ppU77yw/JuwKnNir5hUdKqdNh8gNMD/ZPT/I0KvmFR0qp0+Hyn7vnxZPIXYFTG5X8wiOl1Olw+eckDACSX4yZUurUTn7o+VyA8NHy5T8+O3309+fe/cXE9oVHFuvgGMcbInzKDz8dAA72b2j5HsCP/E1oEBg33e9/GXVqLf+5e148gYFrAWqVf/EuADQIjJXV9339t79P+RfZGd5oXfLPOT47xYXJ+aN/axAYN2OUHxbuAJY/BviWfx5/fHYq8TzhkbHJP7/9h8Y7gHHIP2c+CCzeDYhxMLYv/JridtoOhk/1If8ix2enzDo1Nj7+LNs88r+Py3GzzqlmueTwV6fNR/vXx9KXgAf7Z4JvlTrVNg/JnycP1Wn7mefuuXXpHYmaB6BOtc1D8ufJQ3Waft21AWD1LkCdapuH5M+Th+q0+8zV3/7QcQegTrXNQ/LnyUN12j+P4Fu1u/fILK2x+Eab4j11alO85M+Th+SPO7Pptz+03AHcv39mok61yUPy58lD8sedGZIfklYDpjUaG19rp8bGS/48eUh+mzxaB4D792+M3CxEndoUL/nz5CH5489s++0PEXcA3YPA+Do1Jl7y58lD8sef2SU/RH4ECA8C4+vUmHjJnycPyR9/Zoz8MOg7gPF1aky85M+Th+S3ymOZ6AFg+S5AndoUL/nz5CH5064b+9sfEu8ADgeBcXZqV7zkz5OH5E+7bor80OMjwP37ZxMa8NGpXfGSP08ekj/tuqnyQ8tMwBh29x5qydhHp3bFS/48eUj++DP7iD9n0ESg8N1A/Z0aEy/58+Qh+ePPHCI/GMwEXB8E6u/UmHjJnycPyR9/5lD5YeBHgFV29x6cQd2dGhMv+fPkIfnjzrQQf47pAABw808HgTBldmpsvOTPk4fkjzvTUn7IMADMaR4IyuzU2HjJnycPyd99prX4c7INAHOeGQjK69SUeMmfJw/J335mLvHnZB8AFrl571zkq5f8y1GS3yKPWuRf3Lc/NxsdABYJDwaSfzlK8lvkUbr8m5R+ka0NAKscDgiSfzlK8lvkUaL82xJ+lf8HzqXTQ2+q9xkAAAAASUVORK5CYII="
+
+def write_if_changed(path, data, encoding="utf-8"):
+    """Write data to path unless it already holds exactly those bytes, keeping its mtime"""
+    p = Path(path)
+    b = data.encode(encoding) if isinstance(data, str) else data
+    if p.exists() and p.read_bytes() == b:
+        return False
+    p.write_bytes(b)
+    return True
 
 def install_dependencies():
     """Install required dependencies for building"""
-    print("📦 Installing build dependencies...")
+    print("📦 Checking build dependencies...")
     
-    dependencies = [
-        "pyinstaller",
-        "pillow",
-        "matplotlib"
-    ]
+    missing = [dep for dep, module in BUILD_DEPENDENCIES.items()
+               if importlib.util.find_spec(module) is None]
+    if not missing:
+        print("✅ All build dependencies already installed")
+        return
     
-    for dep in dependencies:
-        try:
-            subprocess.run([sys.executable, "-m", "pip", "install", dep], check=True)
-            print(f"✅ Installed {dep}")
-        except subprocess.CalledProcessError:
-            print(f"❌ Failed to install {dep}")
+    # One pip run resolves and downloads everything together
+    env = {**os.environ, "PIP_CACHE_DIR": str(PIP_CACHE_DIR)}
+    try:
+        subprocess.run([sys.executable, "-m", "pip", "install",
+                        "--disable-pip-version-check", "--no-input", *missing],
+                       check=True, env=env)
+        print(f"✅ Installed {', '.join(missing)}")
+    except subprocess.CalledProcessError:
+        print(f"❌ Failed to install {', '.join(missing)}")
 
 def create_spec_file():
     """Create PyInstaller spec file"""
@@ -120,7 +119,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=''' + str(USE_UPX) + ''',
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,
@@ -133,52 +132,127 @@ exe = EXE(
 )
 '''
     
-    with open("BillSoftware.spec", "w", encoding="utf-8") as f:
-        f.write(spec_content)
+    write_if_changed("BillSoftware.spec", spec_content)
     
     print("✅ Created PyInstaller spec file")
 
-def convert_icon():
-    """Convert SVG icon to ICO format"""
-    try:
-        from PIL import Image
-        import cairosvg
-        
-        # Convert SVG to PNG
-        cairosvg.svg2png(url="icon.svg", write_to="icon.png", output_width=256, output_height=256)
-        
-        # Convert PNG to ICO
-        img = Image.open("icon.png")
-        img.save("icon.ico", format="ICO", sizes=[(16,16), (32,32), (48,48), (64,64), (128,128), (256,256)])
-        
-        print("✅ Converted icon to ICO format")
-        return True
-    except ImportError:
-        print("❌ Installing cairosvg for icon conversion...")
-        subprocess.run([sys.executable, "-m", "pip", "install", "cairosvg"], check=True)
-        return convert_icon()
-    except Exception as e:
-        print(f"❌ Icon conversion failed: {e}")
+def write_icon():
+    """Write the prebuilt application icon (16-256px, same bytes as the committed icon.ico)"""
+    if write_if_changed("icon.ico", base64.b64decode(_ICON_ICO_B64)):
+        print("✅ Restored application icon (icon.ico)")
+    else:
+        print("✅ Application icon up to date (icon.ico)")
+
+def build_cache_key():
+    """Hash of the spec, the icon, the bundled sources, the Python version and the build packages' versions"""
+    h = hashlib.blake2b()
+    h.update(sys.version.encode())
+    # PyInstaller and the libraries it bundles - upgrading any of them must rebuild
+    for dep in (*BUILD_DEPENDENCIES, *BUNDLED_PACKAGES):
+        try:
+            version = importlib.metadata.version(dep)
+        except importlib.metadata.PackageNotFoundError:
+            version = "missing"
+        h.update(f"{dep}\0{version}\0".encode())
+    for path in (SPEC_FILE, "icon.ico"):
+        if os.path.exists(path):
+            h.update(Path(path).read_bytes())
+    for top in BUILD_INPUTS:
+        for root, dirs, files in os.walk(top):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                st = os.stat(path)
+                h.update(f"{Path(path).as_posix()}\0{st.st_size}\0".encode())
+                if st.st_size < HASH_CONTENT_LIMIT:
+                    h.update(Path(path).read_bytes())
+                else:
+                    h.update(str(st.st_mtime_ns).encode())
+    return h.hexdigest()
+
+def restore_cached_build(key):
+    """Copy a previously built executable for key into dist/, if there is one"""
+    cached = BUILD_CACHE_DIR / key / "BillSoftware.exe"
+    if not cached.exists():
         return False
+    os.makedirs("dist", exist_ok=True)
+    shutil.copy2(cached, EXE_PATH)
+    return True
+
+def store_cached_build(key):
+    """Remember the executable just built for key"""
+    if os.path.exists(EXE_PATH):
+        cached_dir = BUILD_CACHE_DIR / key
+        cached_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(EXE_PATH, cached_dir / "BillSoftware.exe")
+
+def prepare_build_dir():
+    """Clear build/ if the spec changed since it was made; returns (extra PyInstaller args, spec hash)"""
+    spec_digest = hashlib.sha256(Path(SPEC_FILE).read_bytes()).hexdigest()
+    try:
+        if Path(SPEC_HASH_FILE).read_text() == spec_digest:
+            return [], spec_digest
+    except OSError:
+        pass
+    if os.path.exists("build"):
+        shutil.rmtree("build")
+    return ["--clean"], spec_digest
+
+def record_spec_hash(spec_digest):
+    """Note which spec the contents of build/ came from"""
+    os.makedirs("build", exist_ok=True)
+    Path(SPEC_HASH_FILE).write_text(spec_digest)
+
+def run_streamed(cmd, while_running=None):
+    """Run cmd, echoing its output as it arrives, and call while_running() in the meantime"""
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            text=True, errors="replace", bufsize=1)
+    
+    def forward_output():
+        for line in proc.stdout:
+            sys.stdout.write(line)
+        sys.stdout.flush()
+    
+    forwarder = threading.Thread(target=forward_output, daemon=True)
+    forwarder.start()
+    try:
+        if while_running:
+            while_running()
+    finally:
+        forwarder.join()
+        proc.wait()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
 
-def build_executable():
-    """Build the executable using PyInstaller"""
+def build_executable(while_building=None):
+    """Build the executable using PyInstaller, running while_building() alongside it"""
     print("🔨 Building executable...")
     
     try:
         # Clean previous builds
         if os.path.exists("dist"):
             shutil.rmtree("dist")
-        if os.path.exists("build"):
-            shutil.rmtree("build")
+        
+        # Nothing changed since an earlier build - reuse its executable
+        key = build_cache_key()
+        if restore_cached_build(key):
+            print("✅ Sources unchanged, reused cached executable")
+            if while_building:
+                while_building()
+            return True
+        
+        # Keep PyInstaller's analysis cache in build/ unless the spec changed
+        clean_args, spec_digest = prepare_build_dir()
         
         # Build executable
-        subprocess.run([
+        run_streamed([
             sys.executable, "-m", "PyInstaller",
-            "--clean",
+            *clean_args,
             "--noconfirm",
-            "BillSoftware.spec"
-        ], check=True)
+            SPEC_FILE
+        ], while_building)
+        record_spec_hash(spec_digest)
+        store_cached_build(key)
         
         print("✅ Executable built successfully!")
         return True
@@ -216,8 +290,7 @@ echo You can now run Bill Software from your desktop.
 pause
 '''
     
-    with open("install.bat", "w", encoding="utf-8") as f:
-        f.write(installer_content)
+    write_if_changed("install.bat", installer_content)
     
     print("✅ Created installer script")
 
@@ -263,8 +336,7 @@ Professional License - Single User
 **Build Date:** ''' + str(Path().cwd()) + '''
 '''
     
-    with open("README.txt", "w", encoding="utf-8") as f:
-        f.write(readme_content)
+    write_if_changed("README.txt", readme_content)
     
     print("✅ Created professional README")
 
@@ -273,27 +345,21 @@ def main():
     print("🏗️  Building Bill Software - Professional Edition")
     print("=" * 50)
     
-    # Step 1: Create icon
-    create_icon()
-    
-    # Step 2: Install dependencies
+    # Step 1: Install dependencies
     install_dependencies()
     
-    # Step 3: Convert icon
-    if not convert_icon():
-        print("⚠️  Continuing without custom icon...")
+    # Step 2: Create icon
+    write_icon()
     
-    # Step 4: Create spec file
+    # Step 3: Create spec file
     create_spec_file()
     
-    # Step 5: Build executable
-    if build_executable():
-        # Step 6: Create installer
+    # Step 4: Build executable, creating the installer (step 5) and README (step 6) meanwhile
+    def create_docs():
         create_installer_script()
-        
-        # Step 7: Create README
         create_readme()
-        
+    
+    if build_executable(while_building=create_docs):
         print("\n🎉 BUILD COMPLETED SUCCESSFULLY!")
         print("=" * 50)
         print("📁 Files created:")
@@ -305,6 +371,10 @@ def main():
         print("   Run 'install.bat' to install the software")
         
     else:
+        # The docs were written during the build - don't leave an installer for a missing exe
+        for path in ("install.bat", "README.txt"):
+            if os.path.exists(path):
+                os.remove(path)
         print("\n❌ Build failed. Please check the errors above.")
 
 if __name__ == "__main__":
@@ -4,33 +4,20 @@ Create Professional Client Package
 Packages the software for distribution to clients
 """
 
+import hashlib
 import os
 import shutil
 import zipfile
 from datetime import datetime
 from pathlib import Path
 
-def create_client_package():
-    """Create a professional package for clients"""
-    
-    # Create package directory
-    package_dir = "BillSoftware_ClientPackage"
-    if os.path.exists(package_dir):
-        shutil.rmtree(package_dir)
-    os.makedirs(package_dir)
-    
-    print("📦 Creating professional client package...")
-    
-    # Copy executable
-    if os.path.exists("dist/BillSoftware.exe"):
-        shutil.copy2("dist/BillSoftware.exe", f"{package_dir}/BillSoftware.exe")
-        print("✅ Added executable")
-    else:
-        print("❌ Executable not found! Run quick_build.bat first")
-        return False
-    
-    # Create professional README
-    readme_content = f"""# Bill Software - Professional Edition
+from build_software import write_if_changed
+
+# Every zip entry gets the same timestamp and mode so identical inputs give a byte-identical zip
+ZIP_DATE_TIME = (2024, 1, 1, 0, 0, 0)
+ZIP_FILE_ATTR = 0o100644 << 16
+
+_README = """# Bill Software - Professional Edition
 
 ## 🚀 Welcome to Bill Software!
 
@@ -98,15 +85,11 @@ This software is licensed for single business use.
 
 ---
 **Version:** 1.0.0
-**Package Date:** {datetime.now().strftime("%B %d, %Y")}
+**Package Date:** {package_date}
 **Build:** Professional Edition
 """
-    
-    with open(f"{package_dir}/README.txt", "w", encoding="utf-8") as f:
-        f.write(readme_content)
-    
-    # Create installation guide
-    install_guide = """# Installation Guide
+
+_INSTALLATION_GUIDE = """# Installation Guide
 
 ## Option 1: Simple Run (Recommended)
 1. Double-click "BillSoftware.exe"
@@ -136,12 +119,8 @@ This software is licensed for single business use.
 - Copy the entire software folder to backup
 - Your data is always safe and portable
 """
-    
-    with open(f"{package_dir}/INSTALLATION_GUIDE.txt", "w", encoding="utf-8") as f:
-        f.write(install_guide)
-    
-    # Create user manual
-    user_manual = """# Bill Software - User Manual
+
+_USER_MANUAL = """# Bill Software - User Manual
 
 ## Getting Started
 
@@ -186,12 +165,8 @@ This software is licensed for single business use.
 - Export reports regularly
 - Keep backups of your data
 """
-    
-    with open(f"{package_dir}/USER_MANUAL.txt", "w", encoding="utf-8") as f:
-        f.write(user_manual)
-    
-    # Create license file
-    license_content = """# Software License Agreement
+
+_LICENSE = """# Software License Agreement
 
 ## Bill Software - Professional Edition
 Single User License
@@ -225,12 +200,8 @@ Software provided "as is" without warranty.
 By using this software, you agree to these terms.
 © 2024 Bill Software. All rights reserved.
 """
-    
-    with open(f"{package_dir}/LICENSE.txt", "w", encoding="utf-8") as f:
-        f.write(license_content)
-    
-    # Create batch file for easy launching
-    launcher_content = """@echo off
+
+_LAUNCHER = """@echo off
 title Bill Software - Professional Edition
 echo.
 echo ========================================
@@ -246,26 +217,18 @@ echo Software started successfully!
 echo You can close this window.
 timeout /t 3 >nul
 """
-    
-    with open(f"{package_dir}/Start Bill Software.bat", "w", encoding="utf-8") as f:
-        f.write(launcher_content)
-    
-    print("✅ Created professional documentation")
-    
-    # Create ZIP package
-    zip_filename = f"BillSoftware_v1.0_{datetime.now().strftime('%Y%m%d')}.zip"
-    
-    with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(package_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, package_dir)
-                zipf.write(file_path, arcname)
-    
-    print(f"✅ Created ZIP package: {zip_filename}")
-    
-    # Create delivery instructions
-    delivery_instructions = f"""# Delivery Instructions for Client
+
+# Documents written into every package, as str.format templates filled with {package_date}
+_DOCS = (
+    ("README.txt", _README),
+    ("INSTALLATION_GUIDE.txt", _INSTALLATION_GUIDE),
+    ("USER_MANUAL.txt", _USER_MANUAL),
+    ("LICENSE.txt", _LICENSE),
+    ("Start Bill Software.bat", _LAUNCHER),
+)
+
+# Written next to the zip for whoever sends it to the client
+_DELIVERY_INSTRUCTIONS = """# Delivery Instructions for Client
 
 ## Package Contents
 - BillSoftware.exe (Main application)
@@ -307,6 +270,7 @@ Your professional billing software is ready for delivery!
 
 📦 **Package:** {zip_filename}
 📋 **Size:** ~50MB
+🔒 **SHA-256:** {zip_sha256}
 🚀 **Installation:** No installation required - just run!
 
 **What's Included:**
@@ -333,11 +297,100 @@ Best regards,
 [Contact Information]
 
 ---
-Package created: {datetime.now().strftime("%B %d, %Y at %I:%M %p")}
+Package created: {package_created}
 """
+
+def iter_tree(root):
+    """Yield (DirEntry, arcname) for every file under root"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    yield entry, os.path.relpath(entry.path, root)
+
+def file_sha256(path):
+    """SHA-256 hex digest of a file, read in large chunks"""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+def create_client_package():
+    """Create a professional package for clients"""
+    
+    # One timestamp for the whole run, so the zip name and documents agree across midnight
+    now = datetime.now()
+    
+    # Create package directory - built next to the old one and swapped in once complete
+    package_dir = "BillSoftware_ClientPackage"
+    staging_dir = package_dir + ".new"
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    
+    print("📦 Creating professional client package...")
+    
+    # Copy executable
+    if os.path.exists("dist/BillSoftware.exe"):
+        os.makedirs(staging_dir)
+        shutil.copy2("dist/BillSoftware.exe", f"{staging_dir}/BillSoftware.exe")
+        print("✅ Added executable")
+    else:
+        print("❌ Executable not found! Run quick_build.bat first")
+        return False
+    
+    # Create professional documentation
+    package_date = now.strftime("%B %d, %Y")
+    # The staging directory starts empty, so these are always fresh files
+    for name, body in _DOCS:
+        Path(staging_dir, name).write_text(body.format(package_date=package_date), encoding="utf-8")
+    
+    print("✅ Created professional documentation")
+    
+    # Windows cannot replace a non-empty directory, so move the old package aside first
+    old_dir = package_dir + ".old"
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if os.path.exists(package_dir):
+        os.replace(package_dir, old_dir)
+    os.replace(staging_dir, package_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    
+    # Create ZIP package
+    zip_filename = f"BillSoftware_v1.0_{now.strftime('%Y%m%d')}.zip"
+    
+    entries = sorted(iter_tree(package_dir), key=lambda e: e[1])
+    
+    # Stream each file into the zip in 1 MB chunks rather than holding it in memory
+    with zipfile.ZipFile(zip_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for entry, arcname in entries:
+            info = zipfile.ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+            info.external_attr = ZIP_FILE_ATTR
+            # PyInstaller already compresses the bundled archive, deflating the exe again only costs time
+            if entry.name.endswith(".exe"):
+                info.compress_type = zipfile.ZIP_STORED
+            else:
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info._compresslevel = 9  # ZipFile.open() takes the level from the ZipInfo
+            with open(entry.path, "rb") as src, zipf.open(info, "w") as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+    
+    # Lets the client check the download arrived intact
+    zip_sha256 = file_sha256(zip_filename)
+    
+    print(f"✅ Created ZIP package: {zip_filename}")
+    
+    # Create delivery instructions
+    delivery_instructions = _DELIVERY_INSTRUCTIONS.format(
+        zip_filename=zip_filename,
+        zip_sha256=zip_sha256,
+        package_created=now.strftime("%B %d, %Y at %I:%M %p"),
+    )
     
-    with open("DELIVERY_INSTRUCTIONS.txt", "w", encoding="utf-8") as f:
-        f.write(delivery_instructions)
+    write_if_changed("DELIVERY_INSTRUCTIONS.txt", delivery_instructions)
     
     print("\n🎉 CLIENT PACKAGE CREATED SUCCESSFULLY!")
     print("=" * 50)
@@ -10,13 +10,15 @@ import subprocess
 import shutil
 from pathlib import Path
 
+from build_software import (build_cache_key, restore_cached_build, store_cached_build, write_if_changed,
+                            prepare_build_dir, record_spec_hash, USE_UPX)
+
 def create_simple_icon():
     """Create a simple ICO file using basic method"""
     # Create a simple 16x16 icon using base64 encoded data
     icon_data = b'\x00\x00\x01\x00\x01\x00\x10\x10\x00\x00\x01\x00\x20\x00\x68\x04\x00\x00\x16\x00\x00\x00\x28\x00\x00\x00\x10\x00\x00\x00\x20\x00\x00\x00\x01\x00\x20\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
     
-    with open("icon.ico", "wb") as f:
-        f.write(icon_data)
+    write_if_changed("icon.ico", icon_data)
     
     print("✅ Created simple icon")
 
@@ -71,7 +73,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=''' + str(USE_UPX) + ''',
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,
@@ -83,8 +85,7 @@ exe = EXE(
 )
 '''
     
-    with open("BillSoftware.spec", "w", encoding="utf-8") as f:
-        f.write(spec_content)
+    write_if_changed("BillSoftware.spec", spec_content)
     
     print("✅ Created PyInstaller spec file")
 
@@ -96,16 +97,25 @@ def build_executable():
         # Clean previous builds
         if os.path.exists("dist"):
             shutil.rmtree("dist")
-        if os.path.exists("build"):
-            shutil.rmtree("build")
+        
+        # Nothing changed since an earlier build - reuse its executable
+        key = build_cache_key()
+        if restore_cached_build(key):
+            print("✅ Sources unchanged, reused cached executable")
+            return True
+        
+        # Keep PyInstaller's analysis cache in build/ unless the spec changed
+        clean_args, spec_digest = prepare_build_dir()
         
         # Build executable
         subprocess.run([
             sys.executable, "-m", "PyInstaller",
-            "--clean",
+            *clean_args,
             "--noconfirm",
             "BillSoftware.spec"
         ], check=True)
+        record_spec_hash(spec_digest)
+        store_cached_build(key)
         
         print("✅ Executable built successfully!")
         return True
@@ -141,8 +151,7 @@ echo You can now run Bill Software from your desktop.
 pause
 '''
     
-    with open("install.bat", "w", encoding="utf-8") as f:
-        f.write(installer_content)
+    write_if_changed("install.bat", installer_content)
     
     print("✅ Created installer script")
 